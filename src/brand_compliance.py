@@ -119,6 +119,8 @@ class VastBrandCompliance:
 
         # Create brand-compliant paragraph styles
         self.styles = self._create_paragraph_styles()
+        # create_vast_table styles, keyed by the compact flag
+        self._table_styles: Dict[bool, TableStyle] = {}
 
         self.logger.info("VAST Brand Compliance initialized")
 
@@ -206,6 +208,13 @@ class VastBrandCompliance:
             leading=self.typography.BODY_SIZE * self.typography.BODY_LINE_SPACING,
         )
 
+        # Centered body text for multi-line Model cells in hardware tables
+        styles["vast_model_center"] = ParagraphStyle(
+            "ModelCenter",
+            parent=styles["vast_body"],
+            alignment=1,  # 1 = CENTER alignment
+        )
+
         return styles
 
     def create_vast_header(self, title: str, subtitle: str = None, cluster_info: Dict[str, Any] = None) -> List[Any]:
@@ -317,6 +326,45 @@ class VastBrandCompliance:
 
         return elements
 
+    def _vast_table_style(self, compact: bool) -> TableStyle:
+        """Return the shared create_vast_table style, built once per density."""
+        style = self._table_styles.get(compact)
+        if style is not None:
+            return style
+
+        font_sz = (self.typography.BODY_SIZE - 2) if compact else self.typography.BODY_SIZE
+        cell_pad = 4 if compact else 8
+        lr_pad = 6 if compact else 12
+        style = self._table_styles[compact] = TableStyle(
+            [
+                # Header row styling
+                ("BACKGROUND", (0, 0), (-1, 0), self.colors.BACKGROUND_DARK),
+                ("TEXTCOLOR", (0, 0), (-1, 0), self.colors.PURE_WHITE),
+                ("FONTNAME", (0, 0), (-1, 0), self.typography.PRIMARY_FONT),
+                ("FONTSIZE", (0, 0), (-1, 0), font_sz),
+                ("ALIGN", (0, 0), (-1, -1), "CENTER"),
+                ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+                # Data rows styling with gradient effect
+                ("BACKGROUND", (0, 1), (-1, -1), self.colors.VAST_BLUE_LIGHTEST),
+                ("TEXTCOLOR", (0, 1), (-1, -1), self.colors.DARK_GRAY),
+                ("FONTNAME", (0, 1), (-1, -1), self.typography.BODY_FONT),
+                ("FONTSIZE", (0, 1), (-1, -1), font_sz),
+                # Borders and spacing
+                ("GRID", (0, 0), (-1, -1), 1, self.colors.BACKGROUND_DARK),
+                (
+                    "ROWBACKGROUNDS",
+                    (0, 1),
+                    (-1, -1),
+                    [self.colors.PURE_WHITE, self.colors.ALTERNATING_ROW],
+                ),
+                ("PADDING", (0, 0), (-1, -1), cell_pad),
+                ("LEFTPADDING", (0, 0), (-1, -1), lr_pad),
+                ("RIGHTPADDING", (0, 0), (-1, -1), lr_pad),
+                ("WORDWRAP", (0, 0), (-1, -1), "CJK"),
+            ]
+        )
+        return style
+
     def create_vast_table(
         self,
         data: List[List[str]],
@@ -373,39 +421,7 @@ class VastBrandCompliance:
         table = Table(table_data, colWidths=computed_widths, repeatRows=1)
 
         # Apply VAST brand table styling
-        font_sz = (self.typography.BODY_SIZE - 2) if compact else self.typography.BODY_SIZE
-        cell_pad = 4 if compact else 8
-        lr_pad = 6 if compact else 12
-        table_style = TableStyle(
-            [
-                # Header row styling
-                ("BACKGROUND", (0, 0), (-1, 0), self.colors.BACKGROUND_DARK),
-                ("TEXTCOLOR", (0, 0), (-1, 0), self.colors.PURE_WHITE),
-                ("FONTNAME", (0, 0), (-1, 0), self.typography.PRIMARY_FONT),
-                ("FONTSIZE", (0, 0), (-1, 0), font_sz),
-                ("ALIGN", (0, 0), (-1, -1), "CENTER"),
-                ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
-                # Data rows styling with gradient effect
-                ("BACKGROUND", (0, 1), (-1, -1), self.colors.VAST_BLUE_LIGHTEST),
-                ("TEXTCOLOR", (0, 1), (-1, -1), self.colors.DARK_GRAY),
-                ("FONTNAME", (0, 1), (-1, -1), self.typography.BODY_FONT),
-                ("FONTSIZE", (0, 1), (-1, -1), font_sz),
-                # Borders and spacing
-                ("GRID", (0, 0), (-1, -1), 1, self.colors.BACKGROUND_DARK),
-                (
-                    "ROWBACKGROUNDS",
-                    (0, 1),
-                    (-1, -1),
-                    [self.colors.PURE_WHITE, self.colors.ALTERNATING_ROW],
-                ),
-                ("PADDING", (0, 0), (-1, -1), cell_pad),
-                ("LEFTPADDING", (0, 0), (-1, -1), lr_pad),
-                ("RIGHTPADDING", (0, 0), (-1, -1), lr_pad),
-                ("WORDWRAP", (0, 0), (-1, -1), "CJK"),
-            ]
-        )
-
-        table.setStyle(table_style)
+        table.setStyle(self._vast_table_style(bool(compact)))
         table_elements.append(table)
 
         # Keep title and table together if title provided
@@ -570,12 +586,7 @@ class VastBrandCompliance:
                 for j, cell in enumerate(row):
                     if j == 1 and "<br/>" in str(cell):  # Model column with HTML
                         # Create Paragraph with center alignment for Model column
-                        model_style = ParagraphStyle(
-                            "ModelCenter",
-                            parent=self.styles["vast_body"],
-                            alignment=1,  # 1 = CENTER alignment
-                        )
-                        processed_row.append(Paragraph(str(cell), model_style))
+                        processed_row.append(Paragraph(str(cell), self.styles["vast_model_center"]))
                     else:
                         processed_row.append(str(cell))
                 processed_table_data.append(processed_row)
@@ -625,7 +636,7 @@ class VastBrandCompliance:
         return elements
 
     def create_vast_hardware_table_with_pagination(
-        self, table_data: List[List[str]], title: str, headers: List[str]
+        self, table_data: List[List[str]], title: str, headers: List[str], rows_per_page: int = 25
     ) -> List[Any]:
         """
         Create VAST brand-compliant hardware table with pagination support for large tables.
@@ -635,6 +646,8 @@ class VastBrandCompliance:
             table_data (List[List[str]]): Table data
             title (str): Table title
             headers (List[str]): Column headers
+            rows_per_page (int): Rows per page before the table is split; the
+                default of ~25 suits A4 with the current styling
 
         Returns:
             List[Any]: Table elements with pagination
@@ -643,10 +656,7 @@ class VastBrandCompliance:
             return []
 
         elements = []
-
-        # Define rows per page (adjust based on page size and row height)
-        # Assuming ~25 rows per page for A4 with current styling
-        rows_per_page = 25
+        rows_per_page = max(1, int(rows_per_page))
 
         # Calculate number of pages needed
         total_rows = len(table_data)
@@ -900,40 +910,51 @@ class VastBrandCompliance:
             topPadding=0,
         )
 
+        # The watermark placement only depends on the page geometry, so the
+        # image is located and measured once per template, not on every page
+        from utils import get_bundle_dir
+
+        watermark_path = str(get_bundle_dir() / "assets" / "diagrams" / "lg_vast_watermark.png")
+        watermark_box: Optional[Tuple[float, float, float, float]] = None
+        watermark_error: Optional[Exception] = None
+        if os.path.exists(watermark_path):
+            try:
+                from PIL import Image as PILImage
+
+                with PILImage.open(watermark_path) as img:
+                    img_width, img_height = img.size
+
+                scale = min(frame_width / img_width, frame_height / img_height)
+                watermark_width = img_width * scale
+                watermark_height = img_height * scale
+                watermark_box = (
+                    (page_width - watermark_width) / 2,
+                    (page_height - watermark_height) / 2,
+                    watermark_width,
+                    watermark_height,
+                )
+            except Exception as e:
+                watermark_error = e
+
         def watermark_overlay(canvas, doc):
             """Draw watermark on top of page content (runs after content is rendered)."""
             page_num = canvas.getPageNumber()
             if page_num <= 1:
                 return
 
-            from utils import get_bundle_dir
-
-            watermark_path = str(get_bundle_dir() / "assets" / "diagrams" / "lg_vast_watermark.png")
-
-            if not os.path.exists(watermark_path):
+            if watermark_box is None:
                 if page_num == 2:
-                    self.logger.warning(f"Watermark image not found: {watermark_path}")
+                    if watermark_error is None:
+                        self.logger.warning(f"Watermark image not found: {watermark_path}")
+                    else:
+                        self.logger.error(f"Error adding watermark: {watermark_error}")
                 return
 
             try:
-                from PIL import Image as PILImage
-
                 if page_num == 2:
                     self.logger.info(f"Applying watermark from: {watermark_path}")
 
-                with PILImage.open(watermark_path) as img:
-                    img_width, img_height = img.size
-
-                available_width = page_width - left_margin - right_margin
-                available_height = page_height - top_margin - bottom_margin
-
-                scale = min(available_width / img_width, available_height / img_height)
-                watermark_width = img_width * scale
-                watermark_height = img_height * scale
-
-                x_position = (page_width - watermark_width) / 2
-                y_position = (page_height - watermark_height) / 2
-
+                x_position, y_position, watermark_width, watermark_height = watermark_box
                 canvas.saveState()
                 canvas.setFillAlpha(0.55)
                 canvas.drawImage(
@@ -17,23 +17,32 @@ Author: Manus AI
 Date: September 26, 2025
 """
 
+import hashlib
+import io
 import json
 import os
 import sys
+import traceback
+from collections import Counter, OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, cast
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, cast
 
-# Add src directory to Python path
-sys.path.insert(0, str(Path(__file__).parent))
+# Add src directory to Python path (once; repeat imports must not grow sys.path)
+_SRC_DIR = str(Path(__file__).parent)
+if _SRC_DIR not in sys.path:
+    sys.path.insert(0, _SRC_DIR)
 
 from brand_compliance import VastBrandCompliance, create_vast_brand_compliance
 
 # Import rack diagram module
 from rack_diagram import RackDiagram
 from utils import get_bundle_dir, get_data_dir
+from utils.cluster_paths import cluster_paths, resolve_cluster_key_from_summary
 from utils.logger import get_logger
+from utils.switch_identity import assign_switch_designators, switch_identity_key
 
 try:
     from reportlab.lib import colors
@@ -42,6 +51,7 @@ try:
     from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
     from reportlab.lib.units import cm, inch
     from reportlab.lib.utils import ImageReader
+    from reportlab.pdfbase.pdfmetrics import stringWidth
     from reportlab.pdfgen import canvas
     from reportlab.platypus import (
         BaseDocTemplate,
@@ -59,11 +69,528 @@ try:
         TableStyle,
     )
 
+    # Colors of the per-node network table grid (see _node_table_style)
+    _NODE_TABLE_HEADER_BG = colors.grey
+    _NODE_TABLE_HEADER_FG = colors.whitesmoke
+    _NODE_TABLE_BODY_BG = colors.beige
+    _NODE_TABLE_GRID = colors.black
+
+    # Centers a single-cell wrapper table's content (network diagram pages)
+    _CENTERED_CELL_STYLE = TableStyle(
+        [
+            ("ALIGN", (0, 0), (-1, -1), "CENTER"),
+            ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+        ]
+    )
+
     REPORTLAB_AVAILABLE = True
 except ImportError:
     REPORTLAB_AVAILABLE = False
 
 
+# Number of generated rack diagrams kept per builder
+_RACK_CACHE_SIZE = 8
+
+# Placeholder strings shown for unset API values. Compare them with ==, never
+# ``is``: values parsed from API responses are not guaranteed to be interned.
+_UNKNOWN = "Unknown"
+_NOT_CONFIGURED = "Not Configured"
+_EMPTY_VALUE_STRINGS = frozenset((_UNKNOWN, "null", "None"))
+# Indexed by bool(flag) to render boolean cells without branching
+_YES_NO = ("No", "Yes")
+
+# Storage Capacity rows in display order: (cluster_summary key, label, kind).
+# "capacity" values are rounded and suffixed with TB/TiB, "percent" with %,
+# and "text" values are shown verbatim unless missing or "Unknown".
+_STORAGE_ROWS = (
+    ("usable_capacity_tb", "Usable Capacity", "capacity"),
+    ("free_usable_capacity_tb", "Free Usable Capacity", "capacity"),
+    ("drr_text", "Data Reduction Ratio (DRR)", "text"),
+    ("physical_space_tb", "Physical Space", "capacity"),
+    ("physical_space_in_use_tb", "Physical Space In Use", "capacity"),
+    ("free_physical_space_tb", "Free Physical Space", "capacity"),
+    ("physical_space_in_use_percent", "Physical Space In Use %", "percent"),
+    ("logical_space_tb", "Logical Space", "capacity"),
+    ("logical_space_in_use_tb", "Logical Space In Use", "capacity"),
+    ("free_logical_space_tb", "Free Logical Space", "capacity"),
+    ("logical_space_in_use_percent", "Logical Space In Use %", "percent"),
+)
+
+# Rows of the Cluster Information table in display order: (cluster_summary
+# key, label, is_flag). Flags render as Yes/No/Unknown, other values verbatim.
+_CLUSTER_STATUS_FIELDS = (
+    ("state", "State", False),
+    ("ssd_raid_state", "SSD RAID State", False),
+    ("nvram_raid_state", "NVRAM RAID State", False),
+    ("memory_raid_state", "Memory RAID State", False),
+    ("leader_state", "Leader State", False),
+    ("leader_cnode", "Leader CNode", False),
+    ("mgmt_cnode", "Management CNode", False),
+    ("mgmt_inner_vip", "Management Inner VIP", False),
+    ("mgmt_inner_vip_cnode", "Management Inner VIP CNode", False),
+    ("enabled", "Enabled", True),
+    ("enable_similarity", "Similarity Enabled", True),
+    ("is_wb_raid_enabled", "Write-Back RAID Enabled", True),
+    ("wb_raid_layout", "Write-Back RAID Layout", False),
+    ("dbox_ha_support", "DBox HA Support", True),
+    ("enable_rack_level_resiliency", "Rack Level Resiliency", True),
+    ("disable_metrics", "Metrics Disabled", True),
+)
+
+# Cluster summary fields listed under "Cluster Network Configuration":
+# (key, label, unknown_is_nc). When unknown_is_nc is False only a missing
+# value is shown as "Not Configured", so falsy values like 0 still print.
+_NET_FIELDS = (
+    ("management_vips", "Management VIPs", True),
+    ("external_gateways", "External Gateways", True),
+    ("dns", "DNS Server", True),
+    ("ntp", "NTP Server", True),
+    ("ext_netmask", "External Netmask", True),
+    ("auto_ports_ext_iface", "Auto Ports External Interface", True),
+    ("b2b_ipmi", "B2B IPMI", False),
+    ("ipmi_gateway", "IPMI Gateway", True),
+    ("ipmi_netmask", "IPMI Netmask", True),
+    ("eth_mtu", "Ethernet MTU", False),
+    ("ib_mtu", "InfiniBand MTU", False),
+    ("nb_eth_mtu", "NVMe/TCP Ethernet MTU", False),
+)
+
+# cluster_network_configuration fields: (key, label, default, optional).
+# "Unknown" is shown as "Not Configured"; optional rows are omitted then.
+_CLUSTER_NET_FIELDS = (
+    ("management_vips", "Management VIPs", _NOT_CONFIGURED, False),
+    ("mgmt_vip", "Management VIP", _NOT_CONFIGURED, True),
+    ("mgmt_inner_vip", "Management Inner VIP", _NOT_CONFIGURED, True),
+    ("mgmt_inner_vip_cnode", "Management Inner VIP CNode", _NOT_CONFIGURED, True),
+    ("external_gateways", "External Gateways", _NOT_CONFIGURED, False),
+    ("dns", "DNS Servers", _NOT_CONFIGURED, False),
+    ("ntp", "NTP Servers", _NOT_CONFIGURED, False),
+    ("ext_netmask", "External Netmask", _UNKNOWN, False),
+    ("auto_ports_ext_iface", "Auto Ports External Interface", _UNKNOWN, False),
+    ("b2b_ipmi", "B2B IPMI", False, False),
+    ("eth_mtu", "Ethernet MTU", _UNKNOWN, False),
+    ("ib_mtu", "InfiniBand MTU", _UNKNOWN, False),
+    ("nb_eth_mtu", "NVMe/TCP Ethernet MTU", _UNKNOWN, False),
+    ("ipmi_gateway", "IPMI Gateway", _UNKNOWN, False),
+    ("ipmi_netmask", "IPMI Netmask", _UNKNOWN, False),
+)
+
+# Rows of the comprehensive "Network Configuration" summary table, keyed into
+# cluster_network_configuration: (key, label). Summary rows are omitted when
+# not configured, MTU rows when falsy, and IPMI rows are always shown.
+_NETWORK_SUMMARY_FIELDS = (
+    ("management_vips", "Management VIPs"),
+    ("external_gateways", "External Gateways"),
+    ("dns", "DNS Servers"),
+    ("ntp", "NTP Servers"),
+    ("ext_netmask", "External Netmask"),
+    ("auto_ports_ext_iface", "Auto Ports Ext Interface"),
+)
+_NETWORK_MTU_FIELDS = (
+    ("eth_mtu", "Ethernet MTU"),
+    ("ib_mtu", "InfiniBand MTU"),
+    ("nb_eth_mtu", "NVMe/TCP Ethernet MTU"),
+)
+_NETWORK_IPMI_FIELDS = (
+    ("ipmi_gateway", "IPMI Gateway"),
+    ("ipmi_netmask", "IPMI Netmask"),
+)
+
+# Encryption/EKM rows of the security table, keyed into cluster_summary:
+# (key, group, label, missing).  missing=None rows show any non-None value;
+# otherwise lists are comma-joined and empty values or those in missing are
+# shown as "Not Configured".
+_SECURITY_SUMMARY_FIELDS = (
+    ("enable_encryption", "Encryption", "Enabled", None),
+    ("encryption_type", "Encryption", "Type", (_UNKNOWN,)),
+    ("s3_enable_only_aes_ciphers", "Encryption", "S3 AES Ciphers Only", None),
+    ("ekm_servers", "EKM", "Servers", (_UNKNOWN, "")),
+    ("ekm_address", "EKM", "Address", (_UNKNOWN, "")),
+    ("ekm_port", "EKM", "Port", None),
+    ("ekm_auth_domain", "EKM", "Auth Domain", (_UNKNOWN, "")),
+    ("secondary_ekm_address", "Secondary EKM", "Address", ("null",)),
+    ("secondary_ekm_port", "Secondary EKM", "Port", None),
+)
+
+# Dynamic TOC layout tables: subsections followed by extra space, and the
+# dot leader length (inches) of top-level entries (4.75 for all others).
+_TOC_SPACE_AFTER = frozenset(
+    (
+        "Hardware Overview",
+        "Feature Configuration",
+        "DBox Inventory",
+        "Physical Rack Layout",
+        "DNode Network",
+        "Port Summary",
+        "Device Mapping",
+        "Logical Network Diagram",
+        "Protection Policies",
+        "Authentication Services",
+        "Cluster Health Check Results",
+    )
+)
+_TOC_DOT_LEADER_INCHES = {
+    "Executive Summary": 5.0,
+    "Cluster Information": 5.0,
+    "Hardware Summary": 5.0,
+    "Physical Rack Layout": 4.92,
+    "Network Configuration": 4.87,
+    "Switch Configuration": 4.95,
+    "Port Mapping": 5.4,
+    "Logical Network Diagram": 4.78,
+    "Logical Configuration": 4.95,
+}
+
+# Logical configuration count rows: (key, inner list key, label, noun), per
+# source section; see _count_rows.
+_LOGICAL_COUNT_FIELDS = (
+    ("tenants", "tenants", "Tenants", "tenants"),
+    ("views", "views", "Views", "views"),
+    ("view_policies", "policies", "View Policies", "policies"),
+    ("protection_policies", "policies", "Protection Policies", "policies"),
+)
+_NETWORK_SERVICE_COUNT_FIELDS = (("vippools", "pools", "VIP Pools", "pools"),)
+_DATA_PROTECTION_COUNT_FIELDS = (
+    ("snapshot_programs", "programs", "Snapshot Programs", "programs"),
+    ("protection_policies", "policies", "Data Protection Policies", "policies"),
+)
+
+# TOC structure with section keys for dynamic page lookup.
+# Format: (text, indent_level, section_key, is_bold); section_key maps to the
+# page tracker filled in by PageMarker during the first pass.
+_TOC_STRUCTURE: Tuple[Tuple[str, int, Optional[str], bool], ...] = (
+    # Executive Summary section
+    ("Executive Summary", 0, "exec_summary", True),
+    ("Cluster Overview", 1, None, False),
+    ("Hardware Overview", 1, None, False),
+    # Cluster Information section
+    ("Cluster Information", 0, "cluster_info", True),
+    ("Cluster Details", 1, None, False),
+    ("Operational Status", 1, None, False),
+    ("Feature Configuration", 1, None, False),
+    # Hardware Summary section
+    ("Hardware Summary", 0, "hardware_summary", True),
+    ("Storage Capacity", 1, None, False),
+    ("CBox Inventory", 1, None, False),
+    ("DBox Inventory", 1, None, False),
+    # Physical Rack Layout section (optional)
+    ("Physical Rack Layout", 0, "rack_layout", True),
+    # Network Configuration section
+    ("Network Configuration", 0, "network_config", True),
+    ("Cluster Network", 1, None, False),
+    ("CNode Management Map", 1, None, False),
+    ("DNode Management Map", 1, None, False),
+    ("CNode Network", 1, None, False),
+    ("DNode Network", 1, None, False),
+    # Switch Configuration section
+    ("Switch Configuration", 0, "switch_config", True),
+    ("Switch Details", 1, None, False),
+    ("Port Summary", 1, None, False),
+    # Port Mapping section (optional)
+    ("Port Mapping", 0, "port_mapping", True),
+    ("Device Mapping", 1, None, False),
+    # Logical Network Diagram section
+    ("Logical Network Diagram", 0, "network_diagram", True),
+    # Logical Configuration section
+    ("Logical Configuration", 0, "logical_config", True),
+    ("Tenants & Views", 1, None, False),
+    ("Protection Policies", 1, None, False),
+    # Security & Authentication section
+    ("Security & Authentication", 0, "security_config", True),
+    ("Encryption Configuration", 1, None, False),
+    ("Authentication Services", 1, None, False),
+    # Health Check section (optional)
+    ("Cluster Health Check Results", 0, "health_check", True),
+    # Post Deployment Activities section
+    ("Post Deployment Activities", 0, "post_deploy_activities", True),
+)
+
+# Map TOC section keys to config toggle keys so disabled sections
+# (and their child indent-1 items) are excluded from the TOC.
+_TOC_KEY_TO_CONFIG: Dict[str, str] = {
+    "exec_summary": "executive_summary",
+    "cluster_info": "cluster_information",
+    "hardware_summary": "hardware_inventory",
+    "rack_layout": "hardware_inventory",
+    "network_config": "network_configuration",
+    "switch_config": "switch_configuration",
+    "port_mapping": "port_mapping",
+    "network_diagram": "port_mapping",
+    "logical_config": "logical_configuration",
+    "security_config": "security_authentication",
+    "health_check": "health_check",
+    "post_deploy_activities": "post_deployment_activities",
+}
+
+# First-pass placeholder TOC: (text, indent_level, page_num, is_bold).
+# Replaced by the dynamic TOC once page numbers are captured.
+_TOC_PLACEHOLDER_STRUCTURE: Tuple[Tuple[str, int, Optional[str], bool], ...] = (
+    # Executive Summary section
+    ("Executive Summary", 0, "3", True),
+    ("Cluster Overview", 1, None, False),
+    ("Hardware Overview", 1, None, False),
+    # Cluster Information section
+    ("Cluster Information", 0, "4", True),
+    ("Cluster Details", 1, None, False),
+    ("Operational Status", 1, None, False),
+    ("Feature Configuration", 1, None, False),
+    # Hardware Summary section
+    ("Hardware Summary", 0, "5", True),
+    ("Storage Capacity", 1, None, False),
+    ("CBox Inventory", 1, None, False),
+    ("DBox Inventory", 1, None, False),
+    # Physical Rack Layout section (no subsections)
+    ("Physical Rack Layout", 0, "6", True),
+    # Network Configuration section
+    ("Network Configuration", 0, "7", True),
+    ("Cluster Network", 1, None, False),
+    ("CNode Network", 1, None, False),
+    ("DNode Network", 1, None, False),
+    # Switch Configuration section
+    ("Switch Configuration", 0, "8", True),
+    ("Switch Details", 1, None, False),
+    ("Port Summary", 1, None, False),
+    # Port Mapping section
+    ("Port Mapping", 0, "10", True),
+    ("Device Mapping", 1, None, False),
+    # Logical Network Diagram section (no subsections)
+    ("Logical Network Diagram", 0, "11", True),
+    # Logical Configuration section
+    ("Logical Configuration", 0, "12", True),
+    ("Tenants & Views", 1, None, False),
+    ("Protection Policies", 1, None, False),
+    # Security & Authentication section
+    ("Security & Authentication", 0, "13", True),
+    ("Encryption Configuration", 1, None, False),
+    ("Authentication Services", 1, None, False),
+)
+
+_TOC_LABEL_TO_CONFIG: Dict[str, str] = {
+    "Executive Summary": "executive_summary",
+    "Cluster Information": "cluster_information",
+    "Hardware Summary": "hardware_inventory",
+    "Physical Rack Layout": "hardware_inventory",
+    "Network Configuration": "network_configuration",
+    "Switch Configuration": "switch_configuration",
+    "Port Mapping": "port_mapping",
+    "Logical Network Diagram": "port_mapping",
+    "Logical Configuration": "logical_configuration",
+    "Security & Authentication": "security_authentication",
+}
+
+
+# Shared leading columns of the CNode/DNode tables in the Network Configuration
+# section (see _node_network_summary_table); each adds one node-specific column.
+_NODE_NETWORK_SUMMARY_HEADER = ("ID", "Name", "Mgmt IP", "IPMI IP", "VAST OS")
+
+# Header rows of the per-node network tables (see _cnode_network_row/_dnode_network_row).
+# Node records reach the builder as JSON dicts (the extractor serializes its
+# dataclasses with asdict), and each is read exactly once, so rows are built
+# straight from the dicts rather than through an intermediate typed record.
+_CNODE_NETWORK_HEADER = [
+    "ID",
+    "Hostname",
+    "Mgmt IP",
+    "IPMI IP",
+    "Box Vendor",
+    "VAST OS",
+    "VMS Host",
+    "TPM Support",
+    "Single NIC",
+    "Net Type",
+]
+_DNODE_NETWORK_HEADER = [
+    "ID",
+    "Hostname",
+    "Mgmt IP",
+    "IPMI IP",
+    "Box Vendor",
+    "VAST OS",
+    "Position",
+    "Ceres",
+    "Ceres v2",
+    "Net Type",
+]
+# Column widths shared by both node network tables, as fractions of the frame
+_NODE_NETWORK_COL_FRACTIONS = (0.08, 0.18, 0.12, 0.12, 0.20, 0.12, 0.06, 0.06, 0.06, 0.10)
+
+# Leading rows of each switch's info table, shown verbatim: (switch key, label)
+_SWITCH_INFO_FIELDS = (
+    ("hostname", "Hostname"),
+    ("model", "Model"),
+    ("serial", "Serial Number"),
+    ("firmware_version", "Firmware Version"),
+    ("mgmt_ip", "Management IP"),
+)
+
+# Display order of the switch port summary speeds; other speeds sort last
+_PORT_SPEED_ORDER = {"200G": 0, "100G": 1, "Unconfigured": 2}
+
+
+def _port_number_key(name: str) -> int:
+    """Natural sort key for port names: the digits of ``name`` as an int, else 0."""
+    digits = "".join(filter(str.isdigit, name))
+    return int(digits) if digits else 0
+
+
+def _section_data(data: Dict[str, Any], name: str) -> Dict[str, Any]:
+    """Return ``data["sections"][name]["data"]``, or {} when any level is missing."""
+    section = (data.get("sections") or {}).get(name)
+    return (section.get("data") if isinstance(section, dict) else None) or {}
+
+
+def _normalize_list(container: Any, inner_key: str) -> List[Any]:
+    """Return the item list of a ``{inner_key: [...]}`` wrapper or bare list; [] otherwise."""
+    items = container.get(inner_key, []) if isinstance(container, dict) else container
+    return items if isinstance(items, list) else []
+
+
+def _count_rows(config: Dict[str, Any], fields: Tuple[Tuple[str, str, str, str], ...]) -> List[List[str]]:
+    """Build "<n> <noun> configured" rows for the configured entries of ``fields``."""
+    return [
+        [label, f"{len(_normalize_list(value, inner_key))} {noun} configured"]
+        for key, inner_key, label, noun in fields
+        if (value := config.get(key))
+    ]
+
+
+# Parsed colors by hex string; TOC rows resolve the same few colors over and over
+_HEX_COLORS: Dict[str, Any] = {}
+
+
+def _hex_color(value: str) -> Any:
+    """Return the shared ReportLab color for a "#RRGGBB" string."""
+    color = _HEX_COLORS.get(value)
+    if color is None:
+        color = _HEX_COLORS[value] = colors.HexColor(value)
+    return color
+
+
+# Dot leader markup by dot count; TOC rows of similar width repeat the same counts
+_DOT_LEADERS: Dict[int, str] = {}
+
+
+def _dot_leader(num_dots: int) -> str:
+    """Return a light-gray TOC dot leader of ``num_dots`` dots as paragraph markup."""
+    leader = _DOT_LEADERS.get(num_dots)
+    if leader is None:
+        leader = _DOT_LEADERS[num_dots] = f'<font color="#CCCCCC">{"." * num_dots}</font>'
+    return leader
+
+
+def _truncate_cell(value: str, limit: int = 30) -> str:
+    """Cut ``value`` to ``limit`` characters, marking the cut with "..."."""
+    return value[:limit] + "..." if len(value) > limit else value
+
+
+def _numeric_id(value: Any) -> int:
+    """Return an API id as an int sort key, or 0 when it is not all digits."""
+    return int(value) if str(value).isdigit() else 0
+
+
+def _yes_no(flag: Any) -> str:
+    """Render a boolean-ish flag as "Yes"/"No"."""
+    return _YES_NO[bool(flag)]
+
+
+def _yes_no_unknown(flag: Any) -> str:
+    """Render a flag as "Yes"/"No", or "Unknown" when it was not reported."""
+    return _UNKNOWN if flag is None else _YES_NO[bool(flag)]
+
+
+def _cnode_network_row(cnode: Dict[str, Any]) -> List[str]:
+    """Build one row of the CNodes network table."""
+    get = cnode.get
+    return [
+        str(get("id", "Unknown")),
+        get("hostname", "Unknown"),
+        get("mgmt_ip", "Unknown"),
+        get("ipmi_ip", "Unknown"),
+        _truncate_cell(get("box_vendor", "Unknown")),
+        get("vast_os", "Unknown"),
+        _yes_no(get("is_vms_host", False)),
+        _yes_no(get("tpm_boot_dev_encryption_supported", False)),
+        _yes_no(get("single_nic", False)),
+        get("net_type", "Unknown"),
+    ]
+
+
+def _dnode_network_row(dnode: Dict[str, Any]) -> List[str]:
+    """Build one row of the DNodes network table."""
+    get = dnode.get
+    return [
+        str(get("id", "Unknown")),
+        get("hostname", "Unknown"),
+        get("mgmt_ip", "Unknown"),
+        get("ipmi_ip", "Unknown"),
+        _truncate_cell(get("box_vendor", "Unknown")),
+        get("vast_os", "Unknown"),
+        get("position", "Unknown"),
+        _yes_no(get("is_ceres", False)),
+        _yes_no(get("is_ceres_v2", False)),
+        get("net_type", "Unknown"),
+    ]
+
+
+def _cnodes_by_cbox(hw_cnodes: List[Dict[str, Any]]) -> Dict[Any, List[Dict[str, Any]]]:
+    """Group hardware-inventory CNodes by ``cbox_id``, preserving their order."""
+    grouped: Dict[Any, List[Dict[str, Any]]] = {}
+    for cnode in hw_cnodes:
+        grouped.setdefault(cnode.get("cbox_id"), []).append(cnode)
+    return grouped
+
+
+def _cbox_rack_unit_and_model(
+    cbox_data: Dict[str, Any], cnodes_by_cbox: Dict[Any, List[Dict[str, Any]]]
+) -> Tuple[str, str]:
+    """Return a CBox's rack unit and model, falling back to its CNodes.
+
+    The rack unit comes from the first CNode with a ``rack_position`` and the
+    model from the first CNode of the box, as the rack diagram expects.
+    """
+    box_cnodes = cnodes_by_cbox.get(cbox_data.get("id"), ())
+    rack_unit = cbox_data.get("rack_unit") or ""
+    if not rack_unit:
+        rack_unit = next(
+            (f"U{rp}" for cnode in box_cnodes if (rp := cnode.get("rack_position")) is not None),
+            "",
+        )
+    model = cbox_data.get("model") or "Unknown"
+    if model == "Unknown" and box_cnodes:
+        cnode = box_cnodes[0]
+        model = cnode.get("model", cnode.get("box_vendor", "")) or "Unknown"
+    return rack_unit, model
+
+
+def _hw_cnode_network_entry(cnode: Dict[str, Any]) -> Dict[str, Any]:
+    """Map a hardware-inventory CNode to the network-configuration node shape."""
+    get = cnode.get
+    return {
+        "id": get("id", "Unknown"),
+        "name": get("name", "Unknown"),
+        "mgmt_ip": get("mgmt_ip", "Unknown"),
+        "ipmi_ip": get("ipmi_ip", "Unknown"),
+        "vast_os": get("os_version", "Unknown"),
+        "is_vms_host": get("is_mgmt", False),
+    }
+
+
+def _hw_dnode_network_entry(dnode: Dict[str, Any]) -> Dict[str, Any]:
+    """Map a hardware-inventory DNode to the network-configuration node shape.
+
+    Position is "virtual" for virtual DNodes and "primary" otherwise.
+    """
+    get = dnode.get
+    return {
+        "id": get("id", "Unknown"),
+        "name": get("name", "Unknown"),
+        "mgmt_ip": get("mgmt_ip", "Unknown"),
+        "ipmi_ip": get("ipmi_ip", "Unknown"),
+        "vast_os": get("os_version", "Unknown"),
+        "position": "virtual" if get("position") == "virtual" else "primary",
+    }
+
+
 def _format_mac_cell(mac: Optional[str], paragraph_style: Any, group_size: int = 7) -> Any:
     """Wrap long MAC/GID values so they don't overflow narrow table columns.
 
@@ -119,6 +646,7 @@ class ReportConfig:
     include_timestamp: bool = True
     include_enhanced_features: bool = True
     organization: str = "VAST Professional Services"
+    inventory_rows_per_page: int = 25
     sections: Dict[str, bool] = field(default_factory=dict)
     network_diagram: Dict[str, Any] = field(
         default_factory=lambda: {
@@ -165,6 +693,7 @@ class ReportConfig:
         _set("include_timestamp", report.get("include_timestamp"), bool)
         _set("include_enhanced_features", report.get("include_enhanced_features"), bool)
         _set("organization", report.get("organization"), str)
+        _set("inventory_rows_per_page", pdf.get("inventory_rows_per_page", report.get("inventory_rows_per_page")), int)
 
         dc = config.get("data_collection", {})
         raw_sections = dc.get("sections", {})
@@ -216,6 +745,71 @@ class PageMarker(Flowable):
         self.page_tracker[self.section_key] = page_num
 
 
+class LazyRackFlowable(Flowable):
+    """Rack diagram flowable that defers ``generate_rack_diagram`` until layout.
+
+    ``generate(*args, **kwargs)`` must return ``(drawing, switch_positions)``.
+    The drawing is generated on the first ``wrap`` call and memoized; ``wrap``
+    reports the drawing's own size so the frame centers it via ``hAlign``.
+    A generation error is logged and the flowables returned by
+    ``placeholder()`` are laid out across the available width and drawn
+    instead, so the build does not abort.
+    """
+
+    hAlign = "CENTER"
+
+    def __init__(
+        self,
+        generate: Callable[..., Tuple[Any, Any]],
+        placeholder: Callable[[], List[Any]],
+        *args: Any,
+        **kwargs: Any,
+    ):
+        Flowable.__init__(self)
+        self.generate = generate
+        self.placeholder = placeholder
+        self.args = args
+        self.kwargs = kwargs
+        self.width: float = 0
+        self.height: float = 0
+        self._drawing: Any = None
+        self._fallback: List[Tuple[Any, float]] = []
+
+    def _get_drawing(self) -> Any:
+        if self._drawing is None:
+            try:
+                self._drawing, _ = self.generate(*self.args, **self.kwargs)
+            except Exception as e:
+                get_logger(__name__).error(f"Error generating rack diagram: {e}", exc_info=True)
+                self._drawing = False
+        return self._drawing
+
+    def wrap(self, availWidth, availHeight):
+        drawing = self._get_drawing()
+        if drawing:
+            self.width, self.height = drawing.width, drawing.height
+        else:
+            # Stack the placeholder flowables top to bottom, keeping each one's height
+            self._fallback = []
+            self.width, self.height = availWidth, 0
+            for flowable in self.placeholder():
+                _, height = flowable.wrap(availWidth, availHeight)
+                height += flowable.getSpaceBefore() + flowable.getSpaceAfter()
+                self._fallback.append((flowable, height))
+                self.height += height
+        return self.width, self.height
+
+    def draw(self):
+        drawing = self._get_drawing()
+        if drawing:
+            drawing.drawOn(self.canv, 0, 0)
+            return
+        y = self.height
+        for flowable, height in self._fallback:
+            y -= height
+            flowable.drawOn(self.canv, 0, y + flowable.getSpaceAfter())
+
+
 class VastReportBuilder:
     """
     VAST As-Built Report Builder for generating professional PDF reports.
@@ -249,6 +843,12 @@ class VastReportBuilder:
         self.user_images_dir = user_images_dir
         self.segment_by_cluster = segment_by_cluster
         self.switch_positions: dict[int, Any] = {}
+        self._diagram_cache: Dict[str, Tuple[str, List[str]]] = {}
+        self._images: Dict[Tuple[str, int, int], Tuple[bytes, Tuple[int, int]]] = {}
+        self._toc_styles: Dict[Tuple[Any, ...], Any] = {}
+        self._dot_widths: Dict[float, float] = {}
+        self._rack_gens: Dict[Tuple[Any, ...], RackDiagram] = {}
+        self._rack_cache: "OrderedDict[str, Tuple[Any, Any]]" = OrderedDict()
 
         if not REPORTLAB_AVAILABLE:
             raise ReportGenerationError("ReportLab is not available. Please install it: pip install reportlab")
@@ -256,6 +856,59 @@ class VastReportBuilder:
         # Initialize VAST brand compliance
         self.brand_compliance = create_vast_brand_compliance()
 
+        # Shared styles, built once per builder instead of once per section
+        self._styles = getSampleStyleSheet()
+        self._heading_style = ParagraphStyle(
+            "Section_Heading",
+            parent=self._styles["Heading1"],
+            fontSize=self.config.heading_font_size,
+            spaceAfter=12,
+        )
+        self._normal_style = ParagraphStyle(
+            "Section_Normal",
+            parent=self._styles["Normal"],
+            fontSize=self.config.font_size,
+            spaceAfter=8,
+        )
+        self._overview_style = ParagraphStyle(
+            "Section_Overview",
+            parent=self._styles["Normal"],
+            fontSize=self.config.font_size - 1,
+            textColor=self.brand_compliance.colors.BACKGROUND_DARK,
+            spaceAfter=12,
+            spaceBefore=8,
+            leftIndent=12,
+            rightIndent=12,
+        )
+        self._body_style = ParagraphStyle("Normal", parent=self._styles["Normal"], fontSize=self.config.font_size)
+        self._port_numbers_style = ParagraphStyle(
+            "PortNumbers",
+            parent=self._styles["Normal"],
+            fontSize=9,
+            alignment=0,  # Left alignment
+            wordWrap="CJK",  # Enable word wrapping
+        )
+        self._rack_heading_style = ParagraphStyle(
+            "Rack_Heading",
+            parent=self._styles["Heading2"],
+            fontSize=14,
+            spaceAfter=8,
+            spaceBefore=12,
+            textColor=self.brand_compliance.colors.BACKGROUND_DARK,
+        )
+        self._first_rack_heading_style = ParagraphStyle(
+            "Rack_Heading_First", parent=self._rack_heading_style, spaceBefore=0
+        )
+        # Content frame size until _generate_with_reportlab replaces it with
+        # the page template's effective margins (direct section calls keep it)
+        page_size = A4 if self.config.page_size == "A4" else letter
+        self._frame_width = page_size[0] - 1.0 * inch
+        self._frame_height = page_size[1] - 1.5 * inch
+
+        self._cnode_table_style = self._node_table_style(header_only_bold=True)
+        self._dnode_table_style = self._node_table_style(header_only_bold=False)
+        self._port_summary_style = self._port_summary_table_style()
+
         self.logger.info("Report builder initialized with VAST brand compliance")
 
     def _font(self, variant: str = "normal") -> str:
@@ -313,8 +966,6 @@ class VastReportBuilder:
 
     def _create_landscape_template(self, portrait_size: tuple, margins: Dict[str, float]) -> Any:
         """Build a landscape PageTemplate for wide diagrams."""
-        from reportlab.platypus import Frame, PageTemplate
-
         landscape_w = portrait_size[1]
         landscape_h = portrait_size[0]
         left = margins.get("left", 36)
@@ -338,55 +989,58 @@ class VastReportBuilder:
             pagesize=(landscape_w, landscape_h),
         )
 
-    def _build_report_story(
+    def _iter_report_story(
         self,
         processed_data: Dict[str, Any],
         page_tracker: Optional[Dict[str, int]] = None,
-    ) -> List[Any]:
+    ) -> Iterator[Any]:
         """
-        Build report story with optional page tracking.
+        Yield the report story flowables with optional page tracking.
+
+        Each section is only built when the iterator reaches it, so the
+        per-section content lists are released as soon as they are consumed.
+        Sections are built in-process and in order on purpose: PageMarker
+        flowables record into ``page_tracker`` by reference, the diagram and
+        rack caches on ``self`` are what make the second pass cheap, and
+        neither survives pickling into worker processes.
 
         Args:
             processed_data: Processed cluster data
             page_tracker: Optional dictionary to capture page numbers (for first pass)
 
-        Returns:
-            List of flowables for the PDF story
+        Yields:
+            Flowables for the PDF story, in order
         """
-        story = []
-
         # Determine if we're in first pass (capturing pages) or second pass (using captured pages)
         is_first_pass = page_tracker is not None and len(page_tracker) == 0
 
         # Add title page
-        story.extend(self._create_title_page(processed_data))
-        story.append(PageBreak())
+        yield from self._create_title_page(processed_data)
+        yield PageBreak()
 
         # Add table of contents
         if self.config.include_toc:
             if is_first_pass:
                 # First pass: use placeholder TOC (will be replaced in second pass)
-                story.extend(self._create_table_of_contents(processed_data))
+                yield from self._create_table_of_contents(processed_data)
             else:
                 # Second pass: use dynamic TOC with captured page numbers
-                story.extend(self._create_table_of_contents_dynamic(processed_data, page_tracker or {}))
-            story.append(PageBreak())
+                yield from self._create_table_of_contents_dynamic(processed_data, page_tracker or {})
+            yield PageBreak()
 
         # Add executive summary
         if self.config.section_enabled("executive_summary"):
-            story.extend(
-                self._create_executive_summary(processed_data, page_tracker, "exec_summary" if is_first_pass else None)
+            yield from self._create_executive_summary(
+                processed_data, page_tracker, "exec_summary" if is_first_pass else None
             )
-            story.append(PageBreak())
+            yield PageBreak()
 
         # Add cluster information
         if self.config.section_enabled("cluster_information"):
-            story.extend(
-                self._create_cluster_information(
-                    processed_data, page_tracker, "cluster_info" if is_first_pass else None
-                )
+            yield from self._create_cluster_information(
+                processed_data, page_tracker, "cluster_info" if is_first_pass else None
             )
-            story.append(PageBreak())
+            yield PageBreak()
 
         # Add hardware inventory (includes Physical Rack Layout)
         if self.config.section_enabled("hardware_inventory"):
@@ -399,27 +1053,23 @@ class VastReportBuilder:
                 )
                 else None
             )
-            story.extend(
-                self._create_hardware_inventory(processed_data, page_tracker, hardware_section_key, rack_layout_key)
+            yield from self._create_hardware_inventory(
+                processed_data, page_tracker, hardware_section_key, rack_layout_key
             )
-            story.append(PageBreak())
+            yield PageBreak()
 
         # Add comprehensive network configuration
         if self.config.section_enabled("network_configuration"):
-            story.extend(
-                self._create_comprehensive_network_configuration(
-                    processed_data,
-                    page_tracker,
-                    "network_config" if is_first_pass else None,
-                )
+            yield from self._create_comprehensive_network_configuration(
+                processed_data,
+                page_tracker,
+                "network_config" if is_first_pass else None,
             )
 
         # Add switch configuration section
         if self.config.section_enabled("switch_configuration"):
-            story.extend(
-                self._create_switch_configuration(
-                    processed_data, page_tracker, "switch_config" if is_first_pass else None
-                )
+            yield from self._create_switch_configuration(
+                processed_data, page_tracker, "switch_config" if is_first_pass else None
             )
 
         # Add port mapping (if available and enabled in config)
@@ -433,79 +1083,65 @@ class VastReportBuilder:
             if port_mapping_enabled:
                 hardware = processed_data.get("hardware_inventory", {})
                 switches = hardware.get("switches") or []
-                story.extend(
-                    self._create_port_mapping_section(
-                        port_mapping_data,
-                        switches,
-                        page_tracker,
-                        "port_mapping" if is_first_pass else None,
-                    )
+                yield from self._create_port_mapping_section(
+                    port_mapping_data,
+                    switches,
+                    page_tracker,
+                    "port_mapping" if is_first_pass else None,
                 )
-                story.append(PageBreak())
+                yield PageBreak()
 
-                story.extend(
-                    self._create_logical_network_diagram(
-                        processed_data,
-                        page_tracker,
-                        "network_diagram" if is_first_pass else None,
-                    )
+                yield from self._create_logical_network_diagram(
+                    processed_data,
+                    page_tracker,
+                    "network_diagram" if is_first_pass else None,
                 )
-                story.append(PageBreak())
+                yield PageBreak()
             else:
-                story.append(PageBreak())
+                yield PageBreak()
         else:
-            story.append(PageBreak())
+            yield PageBreak()
 
         # Add logical configuration
         if self.config.section_enabled("logical_configuration"):
-            story.extend(
-                self._create_logical_configuration(
-                    processed_data,
-                    page_tracker,
-                    "logical_config" if is_first_pass else None,
-                )
+            yield from self._create_logical_configuration(
+                processed_data,
+                page_tracker,
+                "logical_config" if is_first_pass else None,
             )
-            story.append(PageBreak())
+            yield PageBreak()
 
         # Add security configuration
         if self.config.section_enabled("security_authentication"):
-            story.extend(
-                self._create_security_configuration(
-                    processed_data,
-                    page_tracker,
-                    "security_config" if is_first_pass else None,
-                )
+            yield from self._create_security_configuration(
+                processed_data,
+                page_tracker,
+                "security_config" if is_first_pass else None,
             )
-            story.append(PageBreak())
+            yield PageBreak()
 
         # Health Check Results (optional)
         sections = processed_data.get("sections", {})
         health_data = sections.get("health_check", {}).get("data")
         if health_data and self.config.section_enabled("health_check"):
-            story.extend(
-                self._create_health_check_section(
-                    health_data,
-                    page_tracker,
-                    "health_check" if is_first_pass else None,
-                    processed_data=processed_data,
-                )
+            yield from self._create_health_check_section(
+                health_data,
+                page_tracker,
+                "health_check" if is_first_pass else None,
+                processed_data=processed_data,
             )
-            story.append(PageBreak())
+            yield PageBreak()
 
         # Post Deployment Activities (next steps checklist)
         activities_data = sections.get("post_deployment_activities", {}).get("data")
         if activities_data and self.config.section_enabled("post_deployment_activities"):
-            story.extend(
-                self._create_post_deployment_activities_section(
-                    activities_data,
-                    page_tracker,
-                    "post_deploy_activities" if is_first_pass else None,
-                    processed_data=processed_data,
-                )
+            yield from self._create_post_deployment_activities_section(
+                activities_data,
+                page_tracker,
+                "post_deploy_activities" if is_first_pass else None,
+                processed_data=processed_data,
             )
-            story.append(PageBreak())
-
-        return story
+            yield PageBreak()
 
     @staticmethod
     def _normalize_boxes_to_dict(boxes: Any) -> Dict[str, Any]:
@@ -625,8 +1261,6 @@ class VastReportBuilder:
         if not isinstance(switches, list) or not switches:
             return
         try:
-            from utils.switch_identity import assign_switch_designators
-
             assign_switch_designators(switches)
         except Exception:  # pragma: no cover - never block report generation
             pass
@@ -662,41 +1296,28 @@ class VastReportBuilder:
             self._frame_height = page_size[1] - em["top"] - em["bottom"]
 
             # Create document with page template
-            from reportlab.platypus import BaseDocTemplate
-            import os
-            import tempfile
-
             # PASS 1: Capture page numbers
             self.logger.info("First pass: Capturing page numbers for dynamic TOC...")
             page_tracker: Dict[str, int] = {}
 
-            # Use mkstemp for first-pass temp PDF (Windows: NamedTemporaryFile can cause PermissionError on save)
-            fd, temp_path = tempfile.mkstemp(suffix=".pdf")
-            try:
-                os.close(fd)
-                temp_doc = BaseDocTemplate(
-                    temp_path,
-                    pagesize=page_size,
-                    rightMargin=em["right"],
-                    leftMargin=em["left"],
-                    topMargin=em["top"],
-                    bottomMargin=em["bottom"],
-                )
-                landscape_template = self._create_landscape_template(page_size, em)
-                temp_doc.addPageTemplates([page_template, landscape_template])
-
-                # Build story with page markers
-                story_pass1 = self._build_report_story(processed_data, page_tracker)
+            # The first-pass PDF is only laid out to capture page numbers, so it
+            # is rendered into memory and discarded instead of a temp file
+            temp_doc = BaseDocTemplate(
+                io.BytesIO(),
+                pagesize=page_size,
+                rightMargin=em["right"],
+                leftMargin=em["left"],
+                topMargin=em["top"],
+                bottomMargin=em["bottom"],
+            )
+            landscape_template = self._create_landscape_template(page_size, em)
+            temp_doc.addPageTemplates([page_template, landscape_template])
 
-                story_pass1.insert(0, NextPageTemplate("VastPage"))
+            # Build story with page markers
+            story_pass1 = [NextPageTemplate("VastPage"), *self._iter_report_story(processed_data, page_tracker)]
 
-                # Build temp PDF to capture page numbers
-                temp_doc.build(story_pass1)
-            finally:
-                try:
-                    os.unlink(temp_path)
-                except OSError:
-                    pass
+            # Build temp PDF to capture page numbers
+            temp_doc.build(story_pass1)
 
             self.logger.info(f"First pass complete: Captured {len(page_tracker)} page numbers")
             # Log captured page numbers for verification
@@ -707,8 +1328,14 @@ class VastReportBuilder:
             # PASS 2: Generate final PDF with dynamic TOC
             self.logger.info("Second pass: Generating final PDF with dynamic TOC...")
 
+            # Build story with captured page numbers (no markers needed in second pass)
+            story_pass2 = [NextPageTemplate("VastPage"), *self._iter_report_story(processed_data, page_tracker)]
+
+            # Build the final PDF in memory and only replace output_path once the
+            # build succeeded, so a failed run never truncates an existing report
+            pdf_buffer = io.BytesIO()
             doc = BaseDocTemplate(
-                output_path,
+                pdf_buffer,
                 pagesize=page_size,
                 rightMargin=em["right"],
                 leftMargin=em["left"],
@@ -717,22 +1344,14 @@ class VastReportBuilder:
             )
             landscape_template = self._create_landscape_template(page_size, em)
             doc.addPageTemplates([page_template, landscape_template])
-
-            # Build story with captured page numbers (no markers needed in second pass)
-            story_pass2 = self._build_report_story(processed_data, page_tracker)
-
-            story_pass2.insert(0, NextPageTemplate("VastPage"))
-
-            # Build final PDF
             doc.build(story_pass2)
+            Path(output_path).write_bytes(pdf_buffer.getvalue())
 
             self.logger.info(f"PDF report generated successfully: {output_path}")
             return True
 
         except Exception as e:
             self.logger.error(f"Error generating PDF with ReportLab: {e}")
-            import traceback
-
             self.logger.error(traceback.format_exc())
             return False
 
@@ -763,77 +1382,60 @@ class VastReportBuilder:
         # Add hardware information when any hardware is present (nodes, boxes, or switches)
         eboxes = hardware_inventory.get("eboxes") or {}
         if cnodes or dnodes or cboxes or dboxes or switches or eboxes:
-            hardware_text = ""
+            hardware_parts: List[str] = []
 
             # EBox cluster: show EBox Hardware + EBox Quantity only (no CBox/DBox lines)
             if eboxes:
-                ebox_vendors = set()
-                for cnode in cnodes:
-                    box_vendor = cnode.get("box_vendor", "") or ""
-                    if box_vendor and box_vendor != "Unknown":
-                        model = box_vendor.split(",")[0].strip()
-                        if model:
-                            ebox_vendors.add(model)
+                ebox_vendors = {
+                    model
+                    for cnode in cnodes
+                    if (box_vendor := cnode.get("box_vendor", "") or "")
+                    and box_vendor != _UNKNOWN
+                    and (model := box_vendor.split(",")[0].strip())
+                }
                 if ebox_vendors:
-                    hardware_text += f"<b>EBox Hardware:</b> {', '.join(sorted(ebox_vendors))}<br/>"
-                hardware_text += f"<b>EBox Quantity:</b> {len(eboxes)}<br/>"
+                    hardware_parts.append(f"<b>EBox Hardware:</b> {', '.join(sorted(ebox_vendors))}<br/>")
+                hardware_parts.append(f"<b>EBox Quantity:</b> {len(eboxes)}<br/>")
             else:
                 # CBox Hardware: from CNode box_vendor when available, else from CBox data
                 if cboxes:
-                    cbox_vendors = set()
-                    cbox_ids = set()
-                    if cnodes:
-                        for cnode in cnodes:
-                            box_vendor = cnode.get("box_vendor", "Unknown")
-                            if box_vendor and box_vendor != "Unknown":
-                                cbox_vendors.add(box_vendor)
-                            cbox_id = cnode.get("id")
-                            if cbox_id:
-                                cbox_ids.add(str(cbox_id))
+                    cbox_vendors = {
+                        box_vendor
+                        for cnode in cnodes
+                        if (box_vendor := cnode.get("box_vendor", _UNKNOWN)) and box_vendor != _UNKNOWN
+                    }
                     if not cbox_vendors:
-                        for _name, cbox_data in cboxes.items():
-                            model = cbox_data.get("model") or cbox_data.get("hardware_type")
-                            if model and model != "Unknown":
-                                cbox_vendors.add(str(model))
-                            cbox_id = cbox_data.get("id")
-                            if cbox_id is not None:
-                                cbox_ids.add(str(cbox_id))
+                        cbox_vendors = {
+                            str(model)
+                            for cbox_data in cboxes.values()
+                            if (model := cbox_data.get("model") or cbox_data.get("hardware_type")) and model != _UNKNOWN
+                        }
                     if cbox_vendors:
-                        hardware_text += f"<b>CBox Hardware:</b> {', '.join(sorted(cbox_vendors))}<br/>"
-                    cbox_qty = len(cboxes) if cboxes else len(cbox_ids)
-                    hardware_text += f"<b>CBox Quantity:</b> {cbox_qty}<br/>"
+                        hardware_parts.append(f"<b>CBox Hardware:</b> {', '.join(sorted(cbox_vendors))}<br/>")
+                    hardware_parts.append(f"<b>CBox Quantity:</b> {len(cboxes)}<br/>")
 
                 # DBox Hardware (from DBox data using hardware_type)
                 if dboxes:
-                    dbox_hardware_types = set()
-                    dbox_ids = set()
-                    for dbox_name, dbox_data in dboxes.items():
-                        hardware_type = dbox_data.get("hardware_type")
-                        if hardware_type and hardware_type != "Unknown":
-                            dbox_hardware_types.add(hardware_type)
-                        dbox_id = dbox_data.get("id")
-                        if dbox_id:
-                            dbox_ids.add(str(dbox_id))
+                    dbox_hardware_types = {
+                        hardware_type
+                        for dbox_data in dboxes.values()
+                        if (hardware_type := dbox_data.get("hardware_type")) and hardware_type != _UNKNOWN
+                    }
+                    dbox_ids = {str(dbox_id) for dbox_data in dboxes.values() if (dbox_id := dbox_data.get("id"))}
                     if dbox_hardware_types:
-                        hardware_text += f"<b>DBox Hardware:</b> {', '.join(sorted(dbox_hardware_types))}<br/>"
-                    hardware_text += f"<b>DBox Quantity:</b> {len(dbox_ids)}<br/>"
+                        hardware_parts.append(f"<b>DBox Hardware:</b> {', '.join(sorted(dbox_hardware_types))}<br/>")
+                    hardware_parts.append(f"<b>DBox Quantity:</b> {len(dbox_ids)}<br/>")
 
             # Switch Hardware (from switch inventory)
-            switches = hardware_inventory.get("switches") or []
             if switches:
-                switch_models = set()
-                switch_count = len(switches)
-
-                for switch in switches:
-                    model = switch.get("model", "Unknown")
-                    if model and model != "Unknown":
-                        switch_models.add(model)
-
+                switch_models = {
+                    model for switch in switches if (model := switch.get("model", _UNKNOWN)) and model != _UNKNOWN
+                }
                 if switch_models:
-                    hardware_text += f"<b>Switch Hardware:</b> {', '.join(sorted(switch_models))}<br/>"
-
-                hardware_text += f"<b>Switch Quantity:</b> {switch_count}"
+                    hardware_parts.append(f"<b>Switch Hardware:</b> {', '.join(sorted(switch_models))}<br/>")
+                hardware_parts.append(f"<b>Switch Quantity:</b> {len(switches)}")
 
+            hardware_text = "".join(hardware_parts)
             if hardware_text:
                 # Create centered hardware information
                 hardware_style = ParagraphStyle(
@@ -854,12 +1456,11 @@ class VastReportBuilder:
         """Create table of contents from Excel file."""
         try:
             import openpyxl
-            from reportlab.pdfbase.pdfmetrics import stringWidth
         except ImportError:
             self.logger.error("openpyxl not available for Excel import")
             return []
 
-        styles = getSampleStyleSheet()
+        styles = self._styles
 
         title_style = ParagraphStyle(
             "TOC_Title",
@@ -871,9 +1472,7 @@ class VastReportBuilder:
             fontName=self._font("bold"),
         )
 
-        content = []
-        content.append(Paragraph("Table of Contents (from Excel)", title_style))
-        content.append(Spacer(1, 8))
+        content = [Paragraph("Table of Contents (from Excel)", title_style), Spacer(1, 8)]
 
         # Load Excel file
         try:
@@ -885,32 +1484,25 @@ class VastReportBuilder:
             return content
 
         # Read TOC data from Excel (A1:C60)
-        available_width = getattr(self, "_frame_width", A4[0] - 1.0 * inch)
+        available_width = self._frame_width
         toc_table_data: list[Any] = []
 
-        for row in range(1, 61):
-            # Read values from columns A, B, C
-            text_cell = ws[f"A{row}"]
-            page_cell = ws[f"C{row}"]
-
-            text = str(text_cell.value).strip() if text_cell.value else ""
-            page_num = str(page_cell.value).strip() if page_cell.value else ""
+        # One pass over A1:C60 instead of three coordinate lookups per row; the
+        # styled (non read-only) workbook is kept because cell formatting is used
+        for text_cell, sep_cell, page_cell in ws.iter_rows(min_row=1, max_row=60, max_col=3):
+            original_text = str(text_cell.value) if text_cell.value else ""
+            text = original_text.strip()
 
             # Skip empty rows or header row
             if not text or text.lower() == "contents":
                 continue
 
+            page_num = str(page_cell.value).strip() if page_cell.value else ""
+
             # Determine indentation level by counting leading spaces
             # Support multiple indentation levels (each 4-5 spaces = 1 level)
-            indent_level = 0
-            original_text = str(text_cell.value) if text_cell.value else ""
-
-            # Count leading spaces to determine indent level
             leading_spaces = len(original_text) - len(original_text.lstrip())
-            if leading_spaces > 0:
-                # Each 4-5 spaces = 1 indent level
-                indent_level = (leading_spaces + 2) // 4  # Round to nearest level
-                text = text.strip()
+            indent_level = (leading_spaces + 2) // 4  # Round to nearest level
 
             # Read Excel cell formatting (bold, font size, color, alignment)
             # Default values
@@ -938,7 +1530,7 @@ class VastReportBuilder:
                             # Remove alpha channel if present
                             if len(rgb) == 8:
                                 rgb = rgb[2:]  # Remove "AA" prefix
-                            text_color_excel = colors.HexColor(f"#{rgb}")
+                            text_color_excel = _hex_color(f"#{rgb}")
 
             # Read cell alignment from Excel
             if text_cell.alignment:
@@ -965,7 +1557,7 @@ class VastReportBuilder:
                 extra_space = 3
             else:
                 text_font = self._font("italic") if is_italic_excel else self._font()
-                text_color = text_color_excel if text_color_excel else colors.HexColor("#000000")
+                text_color = text_color_excel if text_color_excel else _hex_color("#000000")
                 text_size = text_size_excel if text_size_excel else (self.config.font_size - 2)
                 page_font = text_font
                 page_color = text_color
@@ -973,7 +1565,6 @@ class VastReportBuilder:
                 extra_space = 0
 
             # Check column B for special formatting (lines/separators)
-            sep_cell = ws[f"B{row}"]
             separator_text = str(sep_cell.value).strip() if sep_cell.value else ""
 
             # Format text with indentation (only if not center/right aligned)
@@ -993,15 +1584,9 @@ class VastReportBuilder:
                 spacing_buffer = 0.1 * inch
                 available_for_dots = available_width - text_width - page_width - spacing_buffer
 
-                dot_width = stringWidth(".", self._font(), text_size - 1)
-                if dot_width > 0:
-                    num_dots = int(available_for_dots / dot_width)
-                    num_dots = max(3, num_dots)
-                else:
-                    num_dots = 30
+                num_dots = self._dot_count(available_for_dots, text_size - 1, fallback=30)
 
-                dots = '<font color="#CCCCCC">' + ("." * num_dots) + "</font>"
-                text_with_dots = f"{full_text} {dots}"
+                text_with_dots = f"{full_text} {_dot_leader(num_dots)}"
             elif page_num and text_alignment == TA_CENTER:
                 # Center-aligned with page number: text on left, number on right, centered line between
                 if separator_text and separator_text in ["─", "-", "—", "_"]:
@@ -1016,33 +1601,11 @@ class VastReportBuilder:
             else:
                 text_with_dots = full_text
 
-            # Create paragraph styles with Excel alignment
-            text_style = ParagraphStyle(
-                f"TOC_Text_{len(toc_table_data)}",
-                parent=styles["Normal"],
-                fontSize=text_size,
-                fontName=text_font,
-                textColor=text_color,
-                alignment=text_alignment,  # Use Excel alignment
-                spaceBefore=extra_space,
-                spaceAfter=0.5,
-                leading=text_size + 2,
-            )
-
-            # Page number alignment matches text alignment for center, otherwise right
+            # Create paragraph styles with Excel alignment; page number alignment
+            # matches text alignment for center, otherwise right
             page_alignment = text_alignment if text_alignment == TA_CENTER else TA_RIGHT
-
-            page_style = ParagraphStyle(
-                f"TOC_Page_{len(toc_table_data)}",
-                parent=styles["Normal"],
-                fontSize=page_size,
-                fontName=page_font,
-                textColor=page_color,
-                alignment=page_alignment,
-                spaceBefore=extra_space,
-                spaceAfter=0.5,
-                leading=page_size + 2,
-            )
+            text_style = self._toc_style(text_font, text_size, text_color, text_alignment, extra_space, 0.5)
+            page_style = self._toc_style(page_font, page_size, page_color, page_alignment, extra_space, 0.5)
 
             # Create paragraphs
             text_para = Paragraph(text_with_dots, text_style)
@@ -1057,9 +1620,7 @@ class VastReportBuilder:
         text_col_width = available_width - 0.5 * inch
         page_col_width = 0.5 * inch
 
-        from reportlab.platypus import Table as RLTable
-
-        toc_table = RLTable(toc_table_data, colWidths=[text_col_width, page_col_width])
+        toc_table = Table(toc_table_data, colWidths=[text_col_width, page_col_width])
         toc_table.setStyle(
             TableStyle(
                 [
@@ -1088,10 +1649,7 @@ class VastReportBuilder:
         Returns:
             List of flowables for the TOC
         """
-        from reportlab.platypus import Table as RLTable
-        from reportlab.pdfbase.pdfmetrics import stringWidth
-
-        styles = getSampleStyleSheet()
+        styles = self._styles
 
         title_style = ParagraphStyle(
             "TOC_Title",
@@ -1103,84 +1661,15 @@ class VastReportBuilder:
             fontName=self._font("bold"),
         )
 
-        content = []
-        content.append(Paragraph("Table of Contents", title_style))
-        content.append(Spacer(1, 8))
-
-        # TOC structure with section keys for dynamic page lookup
-        # Format: (text, indent_level, section_key, is_bold)
-        # section_key maps to page_tracker dictionary
-        toc_structure = [
-            # Executive Summary section
-            ("Executive Summary", 0, "exec_summary", True),
-            ("Cluster Overview", 1, None, False),
-            ("Hardware Overview", 1, None, False),
-            # Cluster Information section
-            ("Cluster Information", 0, "cluster_info", True),
-            ("Cluster Details", 1, None, False),
-            ("Operational Status", 1, None, False),
-            ("Feature Configuration", 1, None, False),
-            # Hardware Summary section
-            ("Hardware Summary", 0, "hardware_summary", True),
-            ("Storage Capacity", 1, None, False),
-            ("CBox Inventory", 1, None, False),
-            ("DBox Inventory", 1, None, False),
-            # Physical Rack Layout section (optional)
-            ("Physical Rack Layout", 0, "rack_layout", True),
-            # Network Configuration section
-            ("Network Configuration", 0, "network_config", True),
-            ("Cluster Network", 1, None, False),
-            ("CNode Management Map", 1, None, False),
-            ("DNode Management Map", 1, None, False),
-            ("CNode Network", 1, None, False),
-            ("DNode Network", 1, None, False),
-            # Switch Configuration section
-            ("Switch Configuration", 0, "switch_config", True),
-            ("Switch Details", 1, None, False),
-            ("Port Summary", 1, None, False),
-            # Port Mapping section (optional)
-            ("Port Mapping", 0, "port_mapping", True),
-            ("Device Mapping", 1, None, False),
-            # Logical Network Diagram section
-            ("Logical Network Diagram", 0, "network_diagram", True),
-            # Logical Configuration section
-            ("Logical Configuration", 0, "logical_config", True),
-            ("Tenants & Views", 1, None, False),
-            ("Protection Policies", 1, None, False),
-            # Security & Authentication section
-            ("Security & Authentication", 0, "security_config", True),
-            ("Encryption Configuration", 1, None, False),
-            ("Authentication Services", 1, None, False),
-            # Health Check section (optional)
-            ("Cluster Health Check Results", 0, "health_check", True),
-            # Post Deployment Activities section
-            ("Post Deployment Activities", 0, "post_deploy_activities", True),
-        ]
-
-        # Map TOC section keys to config toggle keys so disabled sections
-        # (and their child indent-1 items) are excluded from the TOC.
-        _toc_key_to_config: Dict[str, str] = {
-            "exec_summary": "executive_summary",
-            "cluster_info": "cluster_information",
-            "hardware_summary": "hardware_inventory",
-            "rack_layout": "hardware_inventory",
-            "network_config": "network_configuration",
-            "switch_config": "switch_configuration",
-            "port_mapping": "port_mapping",
-            "network_diagram": "port_mapping",
-            "logical_config": "logical_configuration",
-            "security_config": "security_authentication",
-            "health_check": "health_check",
-            "post_deploy_activities": "post_deployment_activities",
-        }
+        content = [Paragraph("Table of Contents", title_style), Spacer(1, 8)]
 
         # First pass: remove config-disabled sections and their children
         config_filtered: list[tuple[str, int, Optional[str], bool]] = []
         skip_children = False
-        for entry in toc_structure:
+        for entry in _TOC_STRUCTURE:
             _text, indent_level, section_key, _is_bold = entry
             if indent_level == 0:
-                cfg_key = _toc_key_to_config.get(section_key or "", "")
+                cfg_key = _TOC_KEY_TO_CONFIG.get(section_key or "", "")
                 skip_children = not self.config.section_enabled(cfg_key) if cfg_key else False
             if skip_children and indent_level > 0:
                 continue
@@ -1196,24 +1685,9 @@ class VastReportBuilder:
                 filtered_structure.append(entry)
 
         # Build TOC table with calculated dot leaders
-        available_width = getattr(self, "_frame_width", A4[0] - 1.0 * inch)
+        available_width = self._frame_width
         toc_table_data: list[Any] = []
 
-        # List of subsections that should have extra space after them
-        subsections_with_space_after = [
-            "Hardware Overview",
-            "Feature Configuration",
-            "DBox Inventory",
-            "Physical Rack Layout",
-            "DNode Network",
-            "Port Summary",
-            "Device Mapping",
-            "Logical Network Diagram",
-            "Protection Policies",
-            "Authentication Services",
-            "Cluster Health Check Results",
-        ]
-
         for idx, (text, indent_level, section_key, is_bold) in enumerate(filtered_structure):
             # Calculate indentation
             indent_space = "  " * indent_level if indent_level > 0 else ""
@@ -1224,91 +1698,26 @@ class VastReportBuilder:
             if section_key and section_key in page_tracker:
                 page_num = str(page_tracker[section_key])
 
-            # Create styles for text and page number
-            if is_bold:
-                text_font = self._font("bold")
-                text_color = self.brand_compliance.colors.BACKGROUND_DARK
-                text_size = self.config.font_size - 1
-                page_font = self._font("bold")
-                page_color = self.brand_compliance.colors.BACKGROUND_DARK
-                page_size = self.config.font_size - 1
-                extra_space = 0 if idx == 0 else 12
-            else:
-                text_font = self._font()
-                text_color = colors.HexColor("#000000")
-                text_size = self.config.font_size - 2
-                page_font = self._font()
-                page_color = colors.HexColor("#000000")
-                page_size = self.config.font_size - 2
-                extra_space = 0
+            extra_space = 12 if is_bold and idx else 0
+            text_size = self.config.font_size - (1 if is_bold else 2)
 
             # Add extra space after specific subsections
-            if text in subsections_with_space_after:
-                extra_space_after = 8.0
-            else:
-                extra_space_after = 0.5
+            extra_space_after = 8.0 if text in _TOC_SPACE_AFTER else 0.5
 
             # Add dots and page numbers for entries that have page numbers
             if page_num:
                 # Custom dot leader lengths for specific sections
-                if text == "Executive Summary":
-                    dot_leader_length = 5.0 * inch
-                elif text == "Cluster Information":
-                    dot_leader_length = 5.0 * inch
-                elif text == "Hardware Summary":
-                    dot_leader_length = 5.0 * inch
-                elif text == "Physical Rack Layout":
-                    dot_leader_length = 4.92 * inch
-                elif text == "Network Configuration":
-                    dot_leader_length = 4.87 * inch
-                elif text == "Switch Configuration":
-                    dot_leader_length = 4.95 * inch
-                elif text == "Port Mapping":
-                    dot_leader_length = 5.4 * inch
-                elif text == "Logical Network Diagram":
-                    dot_leader_length = 4.78 * inch
-                elif text == "Logical Configuration":
-                    dot_leader_length = 4.95 * inch
-                else:
-                    dot_leader_length = 4.75 * inch
+                dot_leader_length = _TOC_DOT_LEADER_INCHES.get(text, 4.75) * inch
 
                 # Calculate how many dots fit in the specified space
-                dot_width = stringWidth(".", self._font(), text_size - 1)
-                if dot_width > 0:
-                    num_dots = int(dot_leader_length / dot_width)
-                    num_dots = max(3, num_dots)
-                else:
-                    num_dots = 150
+                num_dots = self._dot_count(dot_leader_length, text_size - 1, fallback=150)
 
-                dots = '<font color="#CCCCCC">' + ("." * num_dots) + "</font>"
-                text_with_dots = f"{full_text} {dots}"
+                text_with_dots = f"{full_text} {_dot_leader(num_dots)}"
             else:
                 # Subsections without page numbers - no dots needed
                 text_with_dots = full_text
 
-            text_style = ParagraphStyle(
-                f"TOC_Text_{len(toc_table_data)}",
-                parent=styles["Normal"],
-                fontSize=text_size,
-                fontName=text_font,
-                textColor=text_color,
-                alignment=TA_LEFT,
-                spaceBefore=extra_space,
-                spaceAfter=extra_space_after,
-                leading=text_size + 2,
-            )
-
-            page_style = ParagraphStyle(
-                f"TOC_Page_{len(toc_table_data)}",
-                parent=styles["Normal"],
-                fontSize=page_size,
-                fontName=page_font,
-                textColor=page_color,
-                alignment=TA_RIGHT,
-                spaceBefore=extra_space,
-                spaceAfter=extra_space_after,
-                leading=page_size + 2,
-            )
+            text_style, page_style = self._toc_entry_styles(is_bold, extra_space, extra_space_after)
 
             # Create paragraphs
             text_para = Paragraph(text_with_dots, text_style)
@@ -1323,7 +1732,7 @@ class VastReportBuilder:
         text_col_width = available_width - 0.15 * inch
         page_col_width = 0.15 * inch
 
-        toc_table = RLTable(toc_table_data, colWidths=[text_col_width, page_col_width])
+        toc_table = Table(toc_table_data, colWidths=[text_col_width, page_col_width])
         toc_table.setStyle(
             TableStyle(
                 [
@@ -1341,11 +1750,60 @@ class VastReportBuilder:
         content.append(toc_table)
         return content
 
+    def _dot_width(self, size: float) -> float:
+        """Return the width of one dot leader character at ``size`` points."""
+        width = self._dot_widths.get(size)
+        if width is None:
+            width = self._dot_widths[size] = stringWidth(".", self._font(), size)
+        return width
+
+    def _dot_count(self, length: float, size: float, fallback: int) -> int:
+        """Return how many dots (at least 3) fill ``length`` points at ``size`` points."""
+        dot_width = self._dot_width(size)
+        return max(3, int(length / dot_width)) if dot_width > 0 else fallback
+
+    def _toc_style(
+        self, font: str, size: float, color: Any, alignment: int, space_before: float, space_after: float
+    ) -> Any:
+        """Return the shared ParagraphStyle of a TOC cell with these attributes.
+
+        TOC rows only use a handful of font/size/color/spacing combinations,
+        so each is built once and reused by every row and both story passes.
+        """
+        key = (font, size, color.hexval(), alignment, space_before, space_after)
+        style = self._toc_styles.get(key)
+        if style is None:
+            style = self._toc_styles[key] = ParagraphStyle(
+                f"TOC_Row_{len(self._toc_styles)}",
+                parent=self._styles["Normal"],
+                fontSize=size,
+                fontName=font,
+                textColor=color,
+                alignment=alignment,
+                spaceBefore=space_before,
+                spaceAfter=space_after,
+                leading=size + 2,
+            )
+        return style
+
+    def _toc_entry_styles(self, is_bold: bool, space_before: float, space_after: float) -> Tuple[Any, Any]:
+        """Return the (text, page number) styles of a dynamic or static TOC row."""
+        if is_bold:
+            font = self._font("bold")
+            color = self.brand_compliance.colors.BACKGROUND_DARK
+            size = self.config.font_size - 1
+        else:
+            font = self._font()
+            color = _hex_color("#000000")
+            size = self.config.font_size - 2
+        return (
+            self._toc_style(font, size, color, TA_LEFT, space_before, space_after),
+            self._toc_style(font, size, color, TA_RIGHT, space_before, space_after),
+        )
+
     def _create_table_of_contents(self, data: Dict[str, Any]) -> List[Any]:
         """Create enhanced table of contents with dot leaders and perfect alignment."""
-        from reportlab.platypus import Table as RLTable
-
-        styles = getSampleStyleSheet()
+        styles = self._styles
 
         title_style = ParagraphStyle(
             "TOC_Title",
@@ -1357,73 +1815,14 @@ class VastReportBuilder:
             fontName=self._font("bold"),
         )
 
-        content = []
-
-        content.append(Paragraph("Table of Contents", title_style))
-        content.append(Spacer(1, 8))
-
-        # TOC structure with sections, subsections, and page numbers
-        # Format: (text, indent_level, page_num, is_bold)
-        # Structure: Parent section first, then its subsections indented below
-        toc_structure = [
-            # Executive Summary section
-            ("Executive Summary", 0, "3", True),
-            ("Cluster Overview", 1, None, False),
-            ("Hardware Overview", 1, None, False),
-            # Cluster Information section
-            ("Cluster Information", 0, "4", True),
-            ("Cluster Details", 1, None, False),
-            ("Operational Status", 1, None, False),
-            ("Feature Configuration", 1, None, False),
-            # Hardware Summary section
-            ("Hardware Summary", 0, "5", True),
-            ("Storage Capacity", 1, None, False),
-            ("CBox Inventory", 1, None, False),
-            ("DBox Inventory", 1, None, False),
-            # Physical Rack Layout section (no subsections)
-            ("Physical Rack Layout", 0, "6", True),
-            # Network Configuration section
-            ("Network Configuration", 0, "7", True),
-            ("Cluster Network", 1, None, False),
-            ("CNode Network", 1, None, False),
-            ("DNode Network", 1, None, False),
-            # Switch Configuration section
-            ("Switch Configuration", 0, "8", True),
-            ("Switch Details", 1, None, False),
-            ("Port Summary", 1, None, False),
-            # Port Mapping section
-            ("Port Mapping", 0, "10", True),
-            ("Device Mapping", 1, None, False),
-            # Logical Network Diagram section (no subsections)
-            ("Logical Network Diagram", 0, "11", True),
-            # Logical Configuration section
-            ("Logical Configuration", 0, "12", True),
-            ("Tenants & Views", 1, None, False),
-            ("Protection Policies", 1, None, False),
-            # Security & Authentication section
-            ("Security & Authentication", 0, "13", True),
-            ("Encryption Configuration", 1, None, False),
-            ("Authentication Services", 1, None, False),
-        ]
+        content = [Paragraph("Table of Contents", title_style), Spacer(1, 8)]
 
-        _label_to_config: Dict[str, str] = {
-            "Executive Summary": "executive_summary",
-            "Cluster Information": "cluster_information",
-            "Hardware Summary": "hardware_inventory",
-            "Physical Rack Layout": "hardware_inventory",
-            "Network Configuration": "network_configuration",
-            "Switch Configuration": "switch_configuration",
-            "Port Mapping": "port_mapping",
-            "Logical Network Diagram": "port_mapping",
-            "Logical Configuration": "logical_configuration",
-            "Security & Authentication": "security_authentication",
-        }
         config_filtered_ph: list[tuple[str, int, Optional[str], bool]] = []
         skip_children = False
-        for entry in toc_structure:
+        for entry in _TOC_PLACEHOLDER_STRUCTURE:
             _text, indent_level, _page, _bold = entry
             if indent_level == 0:
-                cfg_key = _label_to_config.get(_text, "")
+                cfg_key = _TOC_LABEL_TO_CONFIG.get(_text, "")
                 skip_children = not self.config.section_enabled(cfg_key) if cfg_key else False
             if skip_children:
                 continue
@@ -1431,117 +1830,37 @@ class VastReportBuilder:
         toc_structure = config_filtered_ph
 
         # Build TOC table with calculated dot leaders for perfect alignment
-        from reportlab.pdfbase.pdfmetrics import stringWidth
-
-        available_width = getattr(self, "_frame_width", A4[0] - 1.0 * inch)
+        available_width = self._frame_width
         toc_table_data: list[Any] = []
 
-        # List of subsections that should have extra space after them (to separate section groups)
-        subsections_with_space_after = [
-            "Hardware Overview",
-            "Feature Configuration",
-            "DBox Inventory",
-            "Physical Rack Layout",
-            "DNode Network",
-            "Port Summary",
-            "Device Mapping",
-            "Logical Network Diagram",
-            "Protection Policies",
-            "Authentication Services",
-            "Cluster Health Check Results",
-        ]
-
         for idx, (text, indent_level, page_num, is_bold) in enumerate(toc_structure):
             # Calculate indentation using spaces (smaller indent for compact view)
             indent_space = "  " * indent_level if indent_level > 0 else ""
             full_text = f"{indent_space}{text}"
 
-            # Create styles for text and page number
-            if is_bold:
-                text_font = self._font("bold")
-                text_color = self.brand_compliance.colors.BACKGROUND_DARK
-                text_size = self.config.font_size - 1  # Slightly smaller for compact view
-                page_font = self._font("bold")
-                page_color = self.brand_compliance.colors.BACKGROUND_DARK
-                page_size = self.config.font_size - 1
-                # More space before main sections (except first one) to separate from subsections above
-                extra_space = 0 if idx == 0 else 12
-            else:
-                text_font = self._font()
-                text_color = colors.HexColor("#000000")
-                text_size = self.config.font_size - 2  # Smaller for subsections
-                page_font = self._font()
-                page_color = colors.HexColor("#000000")
-                page_size = self.config.font_size - 2
-                extra_space = 0
+            # Slightly smaller text for the compact view; more space before main
+            # sections (except the first one) to separate them from subsections above
+            text_size = self.config.font_size - (1 if is_bold else 2)
+            extra_space = 12 if is_bold and idx else 0
 
             # Add extra space after specific subsections to separate section groups
-            if text in subsections_with_space_after:
-                extra_space_after = 8.0  # Extra space after these subsections
-            else:
-                extra_space_after = 0.5
+            extra_space_after = 8.0 if text in _TOC_SPACE_AFTER else 0.5
 
             # Only add dots and page numbers for entries that have page numbers
             if page_num:
                 # Custom dot leader lengths for specific sections
-                if text == "Executive Summary":
-                    dot_leader_length = 5.0 * inch
-                elif text == "Cluster Information":
-                    dot_leader_length = 5.0 * inch
-                elif text == "Hardware Summary":
-                    dot_leader_length = 5.0 * inch
-                elif text == "Physical Rack Layout":
-                    dot_leader_length = 4.92 * inch
-                elif text == "Network Configuration":
-                    dot_leader_length = 4.87 * inch
-                elif text == "Switch Configuration":
-                    dot_leader_length = 4.95 * inch
-                elif text == "Port Mapping":
-                    dot_leader_length = 5.4 * inch
-                elif text == "Logical Network Diagram":
-                    dot_leader_length = 4.78 * inch
-                elif text == "Logical Configuration":
-                    dot_leader_length = 4.95 * inch
-                else:
-                    dot_leader_length = 4.75 * inch  # Default for all other entries
+                dot_leader_length = _TOC_DOT_LEADER_INCHES.get(text, 4.75) * inch
 
                 # Calculate how many dots fit in the specified space
-                dot_width = stringWidth(".", self._font(), text_size - 1)
-                if dot_width > 0:
-                    num_dots = int(dot_leader_length / dot_width)
-                    num_dots = max(3, num_dots)  # Minimum 3 dots
-                else:
-                    num_dots = 150  # Fallback for 5 inches
+                num_dots = self._dot_count(dot_leader_length, text_size - 1, fallback=150)
 
-                dots = '<font color="#CCCCCC">' + ("." * num_dots) + "</font>"
-                text_with_dots = f"{full_text} {dots}"
+                text_with_dots = f"{full_text} {_dot_leader(num_dots)}"
             else:
                 # Subsections without page numbers - no dots needed
                 text_with_dots = full_text
 
-            text_style = ParagraphStyle(
-                f"TOC_Text_{len(toc_table_data)}",
-                parent=styles["Normal"],
-                fontSize=text_size,
-                fontName=text_font,
-                textColor=text_color,
-                alignment=TA_LEFT,
-                spaceBefore=extra_space,
-                spaceAfter=extra_space_after,  # Variable spacing based on subsection
-                leading=text_size + 2,  # Compact line spacing
-            )
-
-            page_style = ParagraphStyle(
-                f"TOC_Page_{len(toc_table_data)}",
-                parent=styles["Normal"],
-                fontSize=page_size,
-                fontName=page_font,
-                textColor=page_color,
-                alignment=TA_RIGHT,
-                spaceBefore=extra_space,
-                spaceAfter=extra_space_after,  # Variable spacing based on subsection
-                leading=page_size + 2,
-            )
+            # Variable spacing after, based on subsection
+            text_style, page_style = self._toc_entry_styles(is_bold, extra_space, extra_space_after)
 
             # Create paragraphs
             text_para = Paragraph(text_with_dots, text_style)
@@ -1558,7 +1877,7 @@ class VastReportBuilder:
         text_col_width = available_width - 0.15 * inch
         page_col_width = 0.15 * inch
 
-        toc_table = RLTable(toc_table_data, colWidths=[text_col_width, page_col_width])
+        toc_table = Table(toc_table_data, colWidths=[text_col_width, page_col_width])
         toc_table.setStyle(
             TableStyle(
                 [
@@ -1584,36 +1903,25 @@ class VastReportBuilder:
         section_key: Optional[str] = None,
     ) -> List[Any]:
         """Create VAST brand-compliant executive summary section."""
-        content = []
-
         # Add section heading with VAST styling
-        heading_elements = self.brand_compliance.create_vast_section_heading("Executive Summary", level=1)
-        content.extend(heading_elements)
+        content: List[Any] = [*self.brand_compliance.create_vast_section_heading("Executive Summary", level=1)]
 
         # Place page marker immediately after heading to capture section start page
         if page_tracker is not None and section_key:
             content.append(PageMarker(section_key, page_tracker))
 
         # Section Overview
-        styles = getSampleStyleSheet()
-        overview_style = ParagraphStyle(
-            "Section_Overview",
-            parent=styles["Normal"],
-            fontSize=self.config.font_size - 1,
-            textColor=self.brand_compliance.colors.BACKGROUND_DARK,
-            spaceAfter=12,
-            spaceBefore=8,
-            leftIndent=12,
-            rightIndent=12,
-        )
+        overview_style = self._overview_style
 
-        content.append(
-            Paragraph(
-                "This VAST As-Built Report provides a comprehensive technical documentation of the deployed VAST Data cluster infrastructure, configuration, and operational status. The report serves as a critical reference for system administrators, storage engineers, and technical stakeholders to understand the current state of the cluster deployment, validate configuration compliance, and support ongoing operations and troubleshooting. The Executive Summary consolidates key operational metrics, hardware inventory, and cluster health indicators into high-level overview tables that enable rapid assessment of cluster status and capacity utilization.",
-                overview_style,
+        content.extend(
+            (
+                Paragraph(
+                    "This VAST As-Built Report provides a comprehensive technical documentation of the deployed VAST Data cluster infrastructure, configuration, and operational status. The report serves as a critical reference for system administrators, storage engineers, and technical stakeholders to understand the current state of the cluster deployment, validate configuration compliance, and support ongoing operations and troubleshooting. The Executive Summary consolidates key operational metrics, hardware inventory, and cluster health indicators into high-level overview tables that enable rapid assessment of cluster status and capacity utilization.",
+                    overview_style,
+                ),
+                Spacer(1, 8),
             )
         )
-        content.append(Spacer(1, 8))
 
         # Cluster overview table - resequenced to match screenshot order
         cluster_info = data.get("cluster_summary", {})
@@ -1643,8 +1951,7 @@ class VastReportBuilder:
 
         # Create cluster overview table with same style as Cluster Information
         cluster_table_elements = self._create_cluster_info_table(cluster_overview_data, "Cluster Overview")
-        content.extend(cluster_table_elements)
-        content.append(Spacer(1, 12))
+        content.extend([*cluster_table_elements, Spacer(1, 12)])
 
         # Hardware overview table
         hardware = data.get("hardware_inventory", {})
@@ -1700,20 +2007,13 @@ class VastReportBuilder:
 
         # Create hardware overview table with same style as Cluster Information
         hardware_table_elements = self._create_cluster_info_table(hardware_overview_data, "Hardware Overview")
-        content.extend(hardware_table_elements)
-        content.append(Spacer(1, 12))
+        content.extend([*hardware_table_elements, Spacer(1, 12)])
 
         return content
 
     def _create_cluster_info_table(self, table_data: List[List[str]], title: str) -> List[Any]:
         """Create a cluster information style table with VAST branding."""
-        content = []
-
-        # Create table with VAST styling
-        table_elements = self.brand_compliance.create_vast_table(table_data, title, ["Description", "Value"])
-        content.extend(table_elements)
-
-        return content
+        return cast(List[Any], self.brand_compliance.create_vast_table(table_data, title, ["Description", "Value"]))
 
     def _create_ebox_only_inventory_table(
         self,
@@ -1786,8 +2086,6 @@ class VastReportBuilder:
 
         # Switches at bottom
         if switches:
-            from utils.switch_identity import switch_identity_key
-
             manual_rack_map = getattr(self, "manual_rack_placements", {})
             # Key the manual switch->rack lookup by the stable switch_id so two
             # same-named switches map to their own rack independently.
@@ -1822,7 +2120,9 @@ class VastReportBuilder:
             return None
         return cast(
             List[Any],
-            self.brand_compliance.create_vast_hardware_table_with_pagination(all_rows, "Hardware Inventory", headers_5),
+            self.brand_compliance.create_vast_hardware_table_with_pagination(
+                all_rows, "Hardware Inventory", headers_5, rows_per_page=self.config.inventory_rows_per_page
+            ),
         )
 
     def _create_consolidated_inventory_table(
@@ -1860,7 +2160,7 @@ class VastReportBuilder:
             # Fall through to standard table if no rows produced (e.g. no rack_unit)
 
         # Prepare table data - will be grouped by rack
-        all_rows = []
+        all_rows: List[List[Any]] = []
         headers = ["Rack", "Node", "Model", "Name/Serial Number", "Status", "Height"]
 
         # Build mapping of cbox_id to rack_name for CNodes
@@ -1902,10 +2202,9 @@ class VastReportBuilder:
                     cbox_vendor_map[cbox_id] = box_vendor
                     cbox_status_map[cbox_id] = status
                     # Build list of CNode names for this CBox
-                    if cbox_id not in cbox_to_cnode_names:
-                        cbox_to_cnode_names[cbox_id] = []
-                    cbox_to_cnode_names[cbox_id].append(cnode_name)
+                    cbox_to_cnode_names.setdefault(cbox_id, []).append(cnode_name)
 
+            # Rows carry (rack, numeric id, node name) so sorting needs no key function
             cbox_rows = []
             for cbox_name, cbox_data in cboxes.items():
                 cbox_id = cbox_data.get("id", "Unknown")
@@ -1921,19 +2220,20 @@ class VastReportBuilder:
 
                 # Get CNode names for this CBox - create one row per CNode with Model
                 cnode_names = cbox_to_cnode_names.get(cbox_id, [])
+                id_key = _numeric_id(cbox_id)
                 if cnode_names:
                     # Create one row for each CNode
                     for cnode_name in cnode_names:
                         row = [rack_name, cnode_name, model, name, status, rack_unit]
-                        cbox_rows.append((rack_name, cbox_id, cnode_name, row))
+                        cbox_rows.append((rack_name, id_key, cnode_name, row))
                 else:
                     # No CNodes found, create one row with N/A
                     row = [rack_name, "N/A", model, name, status, rack_unit]
-                    cbox_rows.append((rack_name, cbox_id, "N/A", row))
+                    cbox_rows.append((rack_name, id_key, "N/A", row))
 
             # Sort by rack name, then by numeric ID, then by CNode name
-            cbox_rows.sort(key=lambda x: (x[0], int(x[1]) if str(x[1]).isdigit() else 0, x[2]))
-            all_rows.extend([row for _, _, _, row in cbox_rows])
+            cbox_rows.sort(key=itemgetter(0, 1, 2))
+            all_rows.extend(row for _, _, _, row in cbox_rows)
 
         # Add DBoxes with DNode names
         if dboxes and dnodes:
@@ -1944,9 +2244,7 @@ class VastReportBuilder:
                 dnode_name = dnode.get("name") or f"dnode-{dnode.get('id', 'Unknown')}"
                 dnode_state = dnode.get("status") or dnode.get("state") or "Unknown"
                 if dbox_id:
-                    if dbox_id not in dbox_to_dnodes:
-                        dbox_to_dnodes[dbox_id] = []
-                    dbox_to_dnodes[dbox_id].append((dnode_name, dnode_state))
+                    dbox_to_dnodes.setdefault(dbox_id, []).append((dnode_name, dnode_state))
 
             dbox_rows = []
             for dbox_name, dbox_data in dboxes.items():
@@ -1961,6 +2259,7 @@ class VastReportBuilder:
 
                 # Get DNodes for this DBox - create one row per DNode with Model and Status (ACTIVE/FAILED)
                 dnode_list = dbox_to_dnodes.get(dbox_id, [])
+                id_key = _numeric_id(dbox_id)
                 if dnode_list:
                     for dnode_name, dnode_state in dnode_list:
                         row = [
@@ -1971,15 +2270,15 @@ class VastReportBuilder:
                             dnode_state,
                             rack_unit,
                         ]
-                        dbox_rows.append((rack_name, dbox_id, dnode_name, row))
+                        dbox_rows.append((rack_name, id_key, dnode_name, row))
                 else:
                     # No DNodes found, create one row with N/A
                     row = [rack_name, "N/A", hardware_type, name, state, rack_unit]
-                    dbox_rows.append((rack_name, dbox_id, "N/A", row))
+                    dbox_rows.append((rack_name, id_key, "N/A", row))
 
             # Sort by rack name, then by numeric ID, then by DNode name
-            dbox_rows.sort(key=lambda x: (x[0], int(x[1]) if str(x[1]).isdigit() else 0, x[2]))
-            all_rows.extend([row for _, _, _, row in dbox_rows])
+            dbox_rows.sort(key=itemgetter(0, 1, 2))
+            all_rows.extend(row for _, _, _, row in dbox_rows)
         elif dboxes:
             # Fallback if no dnodes data available
             dbox_rows = []
@@ -1995,11 +2294,11 @@ class VastReportBuilder:
 
                 # Create row data with N/A for DNode column (4-tuple to match dnode branch)
                 row = [rack_name, "N/A", hardware_type, name, state, rack_unit]
-                dbox_rows.append((rack_name, dbox_id, "N/A", row))
+                dbox_rows.append((rack_name, _numeric_id(dbox_id), "N/A", row))
 
             # Sort by rack name, then by numeric ID
-            dbox_rows.sort(key=lambda x: (x[0], int(x[1]) if str(x[1]).isdigit() else 0))
-            all_rows.extend([row for _, _, _, row in dbox_rows])
+            dbox_rows.sort(key=itemgetter(0, 1))
+            all_rows.extend(row for _, _, _, row in dbox_rows)
 
         # Add EBoxes (enclosures; one row per EBox)
         if eboxes:
@@ -2010,14 +2309,12 @@ class VastReportBuilder:
                 state = ebox_data.get("state", "Unknown")
                 rack_unit = ebox_data.get("rack_unit", "N/A")
                 row = [rack_name, "EBox", "Enclosure", name, state, rack_unit]
-                ebox_rows.append((rack_name, ebox_data.get("id"), row))
-            ebox_rows.sort(key=lambda x: (x[0], int(x[1]) if x[1] is not None and str(x[1]).isdigit() else 0))
-            all_rows.extend([row for _, _, row in ebox_rows])
+                ebox_rows.append((rack_name, _numeric_id(ebox_data.get("id")), row))
+            ebox_rows.sort(key=itemgetter(0, 1))
+            all_rows.extend(row for _, _, row in ebox_rows)
 
         # Add Switches
         if switches:
-            from utils.switch_identity import switch_identity_key
-
             manual_rack_map = getattr(self, "manual_rack_placements", {})
 
             # Build per-switch rack lookup from manual placements, keyed by the
@@ -2061,14 +2358,14 @@ class VastReportBuilder:
                 row = [rack_name, "N/A", model, serial, state, position]
                 switch_rows.append((rack_name, hostname, row))
 
-            switch_rows.sort(key=lambda x: (x[0], x[1]))
+            switch_rows.sort(key=itemgetter(0, 1))
 
+            # Renumber positions in sorted order while moving the rows over
+            switch_positions = getattr(self, "switch_positions", {})
             for idx, (_rn, _hn, row) in enumerate(switch_rows, start=1):
-                if hasattr(self, "switch_positions") and idx in self.switch_positions:
-                    u_pos = self.switch_positions[idx]
-                    row[5] = f"U{u_pos}"
-
-            all_rows.extend([row for _, _, row in switch_rows])
+                if idx in switch_positions:
+                    row[5] = f"U{switch_positions[idx]}"
+                all_rows.append(row)
 
         if not all_rows:
             return []
@@ -2106,7 +2403,9 @@ class VastReportBuilder:
         # Create table with VAST styling
         return cast(
             List[Any],
-            self.brand_compliance.create_vast_hardware_table_with_pagination(all_rows, "Hardware Inventory", headers),
+            self.brand_compliance.create_vast_hardware_table_with_pagination(
+                all_rows, "Hardware Inventory", headers, rows_per_page=self.config.inventory_rows_per_page
+            ),
         )
 
     def _create_cluster_information(
@@ -2116,36 +2415,25 @@ class VastReportBuilder:
         section_key: Optional[str] = None,
     ) -> List[Any]:
         """Create VAST brand-compliant cluster information section."""
-        content = []
-
         # Add section heading with VAST styling
-        heading_elements = self.brand_compliance.create_vast_section_heading("Cluster Information", level=1)
-        content.extend(heading_elements)
+        content: List[Any] = [*self.brand_compliance.create_vast_section_heading("Cluster Information", level=1)]
 
         # Place page marker immediately after heading to capture section start page
         if page_tracker is not None and section_key:
             content.append(PageMarker(section_key, page_tracker))
 
         # Section Overview
-        styles = getSampleStyleSheet()
-        overview_style = ParagraphStyle(
-            "Section_Overview",
-            parent=styles["Normal"],
-            fontSize=self.config.font_size - 1,
-            textColor=self.brand_compliance.colors.BACKGROUND_DARK,
-            spaceAfter=12,
-            spaceBefore=8,
-            leftIndent=12,
-            rightIndent=12,
-        )
+        overview_style = self._overview_style
 
-        content.append(
-            Paragraph(
-                "The Cluster Information section provides detailed operational status and configuration parameters for the VAST Data cluster. This section captures essential cluster metadata including cluster identification, operational state, management network configuration, and feature flags that define the cluster's capabilities and current operational mode. The information presented here is critical for understanding the cluster's current operational status, validating proper configuration, and supporting troubleshooting activities. This data is collected directly from the cluster's management API and represents the real-time operational state of the system.",
-                overview_style,
+        content.extend(
+            (
+                Paragraph(
+                    "The Cluster Information section provides detailed operational status and configuration parameters for the VAST Data cluster. This section captures essential cluster metadata including cluster identification, operational state, management network configuration, and feature flags that define the cluster's capabilities and current operational mode. The information presented here is critical for understanding the cluster's current operational status, validating proper configuration, and supporting troubleshooting activities. This data is collected directly from the cluster's management API and represents the real-time operational state of the system.",
+                    overview_style,
+                ),
+                Spacer(1, 8),
             )
         )
-        content.append(Spacer(1, 8))
 
         cluster_info = data.get("cluster_summary", {})
 
@@ -2161,73 +2449,12 @@ class VastReportBuilder:
         else:
             capacity_format = "Unknown"
 
+        get = cluster_info.get
         cluster_data = [
-            ["State", cluster_info.get("state", "Unknown")],
-            ["SSD RAID State", cluster_info.get("ssd_raid_state", "Unknown")],
-            ["NVRAM RAID State", cluster_info.get("nvram_raid_state", "Unknown")],
-            ["Memory RAID State", cluster_info.get("memory_raid_state", "Unknown")],
-            ["Leader State", cluster_info.get("leader_state", "Unknown")],
-            ["Leader CNode", cluster_info.get("leader_cnode", "Unknown")],
-            ["Management CNode", cluster_info.get("mgmt_cnode", "Unknown")],
-            ["Management Inner VIP", cluster_info.get("mgmt_inner_vip", "Unknown")],
-            [
-                "Management Inner VIP CNode",
-                cluster_info.get("mgmt_inner_vip_cnode", "Unknown"),
-            ],
-            [
-                "Enabled",
-                (
-                    "Yes"
-                    if cluster_info.get("enabled")
-                    else ("No" if cluster_info.get("enabled") is not None else "Unknown")
-                ),
-            ],
-            [
-                "Similarity Enabled",
-                (
-                    "Yes"
-                    if cluster_info.get("enable_similarity")
-                    else ("No" if cluster_info.get("enable_similarity") is not None else "Unknown")
-                ),
-            ],
-            [
-                "Write-Back RAID Enabled",
-                (
-                    "Yes"
-                    if cluster_info.get("is_wb_raid_enabled")
-                    else ("No" if cluster_info.get("is_wb_raid_enabled") is not None else "Unknown")
-                ),
-            ],
-            [
-                "Write-Back RAID Layout",
-                cluster_info.get("wb_raid_layout", "Unknown"),
-            ],
-            [
-                "DBox HA Support",
-                (
-                    "Yes"
-                    if cluster_info.get("dbox_ha_support")
-                    else ("No" if cluster_info.get("dbox_ha_support") is not None else "Unknown")
-                ),
-            ],
-            [
-                "Rack Level Resiliency",
-                (
-                    "Yes"
-                    if cluster_info.get("enable_rack_level_resiliency")
-                    else ("No" if cluster_info.get("enable_rack_level_resiliency") is not None else "Unknown")
-                ),
-            ],
-            [
-                "Metrics Disabled",
-                (
-                    "Yes"
-                    if cluster_info.get("disable_metrics")
-                    else ("No" if cluster_info.get("disable_metrics") is not None else "Unknown")
-                ),
-            ],
-            ["Capacity-Base 10", capacity_format],
+            [label, _yes_no_unknown(get(key)) if is_flag else get(key, _UNKNOWN)]
+            for key, label, is_flag in _CLUSTER_STATUS_FIELDS
         ]
+        cluster_data.append(["Capacity-Base 10", capacity_format])
 
         table_elements = self.brand_compliance.create_vast_table(
             cluster_data, f"Cluster Name: {cluster_name}", ["Function", "Status"]
@@ -2255,36 +2482,30 @@ class VastReportBuilder:
             content.append(PageMarker(section_key, page_tracker))
 
         # Section Overview
-        styles = getSampleStyleSheet()
-        overview_style = ParagraphStyle(
-            "Section_Overview",
-            parent=styles["Normal"],
-            fontSize=self.config.font_size - 1,
-            textColor=self.brand_compliance.colors.BACKGROUND_DARK,
-            spaceAfter=12,
-            spaceBefore=8,
-            leftIndent=12,
-            rightIndent=12,
-        )
+        overview_style = self._overview_style
 
-        content.append(
-            Paragraph(
-                "The Hardware Summary section provides comprehensive inventory and operational status of all physical hardware components within the VAST Data cluster. This section includes detailed information about storage capacity utilization, compute nodes (CNodes), data nodes (DNodes), and their respective hardware specifications, operational status, and physical rack positioning. The capacity metrics show both logical and physical storage utilization, enabling capacity planning and performance optimization. Hardware inventory data is essential for understanding cluster scale, identifying hardware failures, planning maintenance windows, and ensuring proper rack organization for optimal cooling and cable management.",
-                overview_style,
+        content.extend(
+            (
+                Paragraph(
+                    "The Hardware Summary section provides comprehensive inventory and operational status of all physical hardware components within the VAST Data cluster. This section includes detailed information about storage capacity utilization, compute nodes (CNodes), data nodes (DNodes), and their respective hardware specifications, operational status, and physical rack positioning. The capacity metrics show both logical and physical storage utilization, enabling capacity planning and performance optimization. Hardware inventory data is essential for understanding cluster scale, identifying hardware failures, planning maintenance windows, and ensuring proper rack organization for optimal cooling and cable management.",
+                    overview_style,
+                ),
+                Spacer(1, 8),
             )
         )
-        content.append(Spacer(1, 8))
 
         hardware = data.get("hardware_inventory", {})
         eboxes_for_note = hardware.get("eboxes") or {}
         if eboxes_for_note:
-            content.append(
-                Paragraph(
-                    "For clusters with EBox enclosures, DBox U height is documented in the inventory table below; the Physical Rack Layout diagram uses EBox U height and does not show DBox positions.",
-                    overview_style,
+            content.extend(
+                (
+                    Paragraph(
+                        "For clusters with EBox enclosures, DBox U height is documented in the inventory table below; the Physical Rack Layout diagram uses EBox U height and does not show DBox positions.",
+                        overview_style,
+                    ),
+                    Spacer(1, 8),
                 )
             )
-            content.append(Spacer(1, 8))
 
         # Extract hardware collections early (used by inventory table and switch placement)
         cboxes = hardware.get("cboxes") or {}
@@ -2296,110 +2517,18 @@ class VastReportBuilder:
 
         # Add storage capacity section
         cluster_info = data.get("cluster_summary", {})
-        if any(
-            cluster_info.get(field) is not None
-            for field in [
-                "usable_capacity_tb",
-                "free_usable_capacity_tb",
-                "drr_text",
-                "physical_space_tb",
-                "physical_space_in_use_tb",
-                "free_physical_space_tb",
-                "physical_space_in_use_percent",
-                "logical_space_tb",
-                "logical_space_in_use_tb",
-                "free_logical_space_tb",
-                "logical_space_in_use_percent",
-            ]
-        ):
-            # Storage capacity table
-            storage_data = []
-
+        storage_rows = [(label, kind, cluster_info.get(key)) for key, label, kind in _STORAGE_ROWS]
+        if any(value is not None for _, _, value in storage_rows):
             # Determine capacity unit based on capacity_base_10 setting
             capacity_unit = "TB" if cluster_info.get("capacity_base_10", True) else "TiB"
+            suffixes = {"capacity": f" {capacity_unit}", "percent": "%"}
 
-            # Usable capacity section
-            if cluster_info.get("usable_capacity_tb") is not None:
-                storage_data.append(
-                    [
-                        "Usable Capacity",
-                        f"{round(cluster_info.get('usable_capacity_tb', 0))} {capacity_unit}",
-                    ]
-                )
-            if cluster_info.get("free_usable_capacity_tb") is not None:
-                storage_data.append(
-                    [
-                        "Free Usable Capacity",
-                        f"{round(cluster_info.get('free_usable_capacity_tb', 0))} {capacity_unit}",
-                    ]
-                )
-            if cluster_info.get("drr_text") and cluster_info.get("drr_text") != "Unknown":
-                storage_data.append(
-                    [
-                        "Data Reduction Ratio (DRR)",
-                        cluster_info.get("drr_text", "Unknown"),
-                    ]
-                )
-
-            # Physical space section
-            if cluster_info.get("physical_space_tb") is not None:
-                storage_data.append(
-                    [
-                        "Physical Space",
-                        f"{round(cluster_info.get('physical_space_tb', 0))} {capacity_unit}",
-                    ]
-                )
-            if cluster_info.get("physical_space_in_use_tb") is not None:
-                storage_data.append(
-                    [
-                        "Physical Space In Use",
-                        f"{round(cluster_info.get('physical_space_in_use_tb', 0))} {capacity_unit}",
-                    ]
-                )
-            if cluster_info.get("free_physical_space_tb") is not None:
-                storage_data.append(
-                    [
-                        "Free Physical Space",
-                        f"{round(cluster_info.get('free_physical_space_tb', 0))} {capacity_unit}",
-                    ]
-                )
-            if cluster_info.get("physical_space_in_use_percent") is not None:
-                storage_data.append(
-                    [
-                        "Physical Space In Use %",
-                        f"{round(cluster_info.get('physical_space_in_use_percent', 0))}%",
-                    ]
-                )
-
-            # Logical space section
-            if cluster_info.get("logical_space_tb") is not None:
-                storage_data.append(
-                    [
-                        "Logical Space",
-                        f"{round(cluster_info.get('logical_space_tb', 0))} {capacity_unit}",
-                    ]
-                )
-            if cluster_info.get("logical_space_in_use_tb") is not None:
-                storage_data.append(
-                    [
-                        "Logical Space In Use",
-                        f"{round(cluster_info.get('logical_space_in_use_tb', 0))} {capacity_unit}",
-                    ]
-                )
-            if cluster_info.get("free_logical_space_tb") is not None:
-                storage_data.append(
-                    [
-                        "Free Logical Space",
-                        f"{round(cluster_info.get('free_logical_space_tb', 0))} {capacity_unit}",
-                    ]
-                )
-            if cluster_info.get("logical_space_in_use_percent") is not None:
-                storage_data.append(
-                    [
-                        "Logical Space In Use %",
-                        f"{round(cluster_info.get('logical_space_in_use_percent', 0))}%",
-                    ]
-                )
+            # Storage capacity table; "text" rows (DRR) are shown verbatim
+            storage_data = [
+                [label, value if kind == "text" else f"{round(value)}{suffixes[kind]}"]
+                for label, kind, value in storage_rows
+                if value is not None and (kind != "text" or (value and value != "Unknown"))
+            ]
 
             if storage_data:
                 storage_table_elements = self.brand_compliance.create_vast_table(
@@ -2417,8 +2546,6 @@ class VastReportBuilder:
                 # Resolve placements by the stable switch_id (mgmt_ip) first so
                 # two switches that share a name map to distinct inventory
                 # entries; fall back to switch_name for older profiles.
-                from utils.switch_identity import switch_identity_key
-
                 sw_by_id = {switch_identity_key(sw): sw for sw in switches} if switches else {}
                 sw_by_name = {sw.get("name", sw.get("hostname", "")): sw for sw in switches} if switches else {}
                 for idx, mp in enumerate(manual_placements, start=1):
@@ -2450,7 +2577,7 @@ class VastReportBuilder:
                 self.logger.info("Manual switch placement: %s", self.switch_positions)
             if (not manual_placements) and switches and len(switches) == 2:
                 # --- Auto placement: cascade through racks (same logic for ebox: above ebox then below ebox) ---
-                hw_cnodes = hardware.get("cnodes") or []
+                placement_cnodes_by_cbox = _cnodes_by_cbox(hardware.get("cnodes") or [])
                 hw_dboxes_raw = hardware.get("dboxes") or {}
                 hw_eboxes_raw = hardware.get("eboxes") or {}
                 racks_info_auto = data.get("racks", [])
@@ -2461,22 +2588,9 @@ class VastReportBuilder:
                     rack_name = cbox_data.get("rack_name") or "Unknown"
                     if rack_name == "Unknown" and vms_rack_names_auto and len(vms_rack_names_auto) == 1:
                         rack_name = next(iter(vms_rack_names_auto))
-                    rack_unit = cbox_data.get("rack_unit") or ""
-                    if not rack_unit and hw_cnodes:
-                        for cnode in hw_cnodes:
-                            if cnode.get("cbox_id") == cbox_data.get("id"):
-                                rp = cnode.get("rack_position")
-                                if rp is not None:
-                                    rack_unit = f"U{rp}"
-                                    break
+                    rack_unit, model = _cbox_rack_unit_and_model(cbox_data, placement_cnodes_by_cbox)
                     if not rack_unit:
                         continue
-                    model = cbox_data.get("model") or "Unknown"
-                    if model == "Unknown" and hw_cnodes:
-                        for cnode in hw_cnodes:
-                            if cnode.get("cbox_id") == cbox_data.get("id"):
-                                model = cnode.get("model", cnode.get("box_vendor", "")) or "Unknown"
-                                break
                     cbox_entry = {
                         "id": cbox_data.get("id"),
                         "model": model,
@@ -2524,10 +2638,7 @@ class VastReportBuilder:
                     rack_ebox = per_rack_eboxes.get(try_rack, [])
                     if not rack_cb and not rack_db and not rack_ebox:
                         continue
-                    temp_rack_gen = RackDiagram(
-                        library_path=self.library_path,
-                        user_images_dir=self.user_images_dir,
-                    )
+                    temp_rack_gen = self._rack_generator()
                     calculated_positions = temp_rack_gen._calculate_switch_positions(
                         rack_cb, rack_db, len(switches), switches=switches, eboxes=rack_ebox
                     )
@@ -2570,18 +2681,12 @@ class VastReportBuilder:
 
                 # Get CBox information and group by rack (one entry per CBox, not per CNode)
                 hw_cnodes = hardware.get("cnodes") or []
+                layout_cnodes_by_cbox = _cnodes_by_cbox(hw_cnodes)
                 for cbox_name, cbox_data in cboxes.items():
                     rack_name = cbox_data.get("rack_name") or "Unknown"
                     if rack_name == "Unknown" and vms_rack_names and len(vms_rack_names) == 1:
                         rack_name = next(iter(vms_rack_names))
-                    rack_unit = cbox_data.get("rack_unit") or ""
-                    if not rack_unit and hw_cnodes:
-                        for cnode in hw_cnodes:
-                            if cnode.get("cbox_id") == cbox_data.get("id"):
-                                rp = cnode.get("rack_position")
-                                if rp is not None:
-                                    rack_unit = f"U{rp}"
-                                    break
+                    rack_unit, model = _cbox_rack_unit_and_model(cbox_data, layout_cnodes_by_cbox)
                     if not rack_unit:
                         continue
                     if rack_name not in racks_data:
@@ -2591,12 +2696,6 @@ class VastReportBuilder:
                             "eboxes": [],
                             "switches": [],
                         }
-                    model = cbox_data.get("model") or "Unknown"
-                    if model == "Unknown" and hw_cnodes:
-                        for cnode in hw_cnodes:
-                            if cnode.get("cbox_id") == cbox_data.get("id"):
-                                model = cnode.get("model", cnode.get("box_vendor", "")) or "Unknown"
-                                break
                     cbox_entry = {
                         "id": cbox_data.get("id"),
                         "name": cbox_name,
@@ -2833,40 +2932,21 @@ class VastReportBuilder:
                             # Create rack diagram generator with appropriate rack height
                             # Reserve headroom for the heading, spacer, and table padding
                             # that share the page with the diagram
-                            fw = getattr(self, "_frame_width", 7.27 * inch)
-                            fh = getattr(self, "_frame_height", 8.5 * inch)
+                            fw = self._frame_width
+                            fh = self._frame_height
                             rack_page_h = fh - 1.0 * inch
-                            rack_gen = RackDiagram(
-                                page_width=fw,
-                                page_height=rack_page_h,
-                                rack_height_u=rack_height_u,
-                                library_path=self.library_path,
-                                user_images_dir=self.user_images_dir,
+                            rack_gen = self._rack_generator(
+                                page_width=fw, page_height=rack_page_h, rack_height_u=rack_height_u
                             )
 
                             # EBox clusters: use ebox U height in diagram; disregard dbox in diagram
                             diagram_dboxes = [] if is_ebox_cluster else rack_dboxes
                             diagram_eboxes = rack_eboxes if is_ebox_cluster else []
 
-                            rack_drawing, switch_positions_map = rack_gen.generate_rack_diagram(
-                                rack_cboxes,
-                                diagram_dboxes,
-                                rack_switches,
-                                rack_name=rack_name,
-                                eboxes=diagram_eboxes,
-                                node_status_map=node_status_map,
-                            )
-
                             # Add rack name heading before diagram
                             # First rack gets combined heading, subsequent racks get simple heading
-                            rack_heading_style = ParagraphStyle(
-                                "Rack_Heading",
-                                parent=styles["Heading2"],
-                                fontSize=14,
-                                spaceAfter=8,
-                                spaceBefore=(12 if idx > 0 else 0),  # No space before first heading
-                                textColor=self.brand_compliance.colors.BACKGROUND_DARK,
-                            )
+                            # No space before the first heading
+                            rack_heading_style = self._rack_heading_style if idx else self._first_rack_heading_style
 
                             if idx == 0:
                                 # First rack: Combined heading with section title
@@ -2881,27 +2961,20 @@ class VastReportBuilder:
                             content.append(Paragraph(heading_text, rack_heading_style))
                             content.append(Spacer(1, 0.2 * inch))
 
-                            # Center the rack diagram on the page using a table
-                            from reportlab.platypus import Table as RLTable
-
-                            fw = getattr(self, "_frame_width", 7.5 * inch)
-                            rack_table = RLTable(
-                                [[rack_drawing]],
-                                colWidths=[fw],
-                            )
-                            rack_table.setStyle(
-                                TableStyle(
-                                    [
-                                        ("ALIGN", (0, 0), (-1, -1), "CENTER"),
-                                        ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
-                                        ("LEFTPADDING", (0, 0), (-1, -1), 0),
-                                        ("RIGHTPADDING", (0, 0), (-1, -1), 0),
-                                        ("TOPPADDING", (0, 0), (-1, -1), 0),
-                                        ("BOTTOMPADDING", (0, 0), (-1, -1), 0),
-                                    ]
+                            # The diagram is generated when Platypus first lays it out
+                            content.append(
+                                LazyRackFlowable(
+                                    self._cached_rack_diagram,
+                                    self._rack_diagram_placeholder,
+                                    rack_gen,
+                                    rack_cboxes,
+                                    diagram_dboxes,
+                                    rack_switches,
+                                    rack_name=rack_name,
+                                    eboxes=diagram_eboxes,
+                                    node_status_map=node_status_map,
                                 )
                             )
-                            content.append(rack_table)
 
                             # Add page break between racks (except for last one)
                             if rack_name != sorted_racks[-1]:
@@ -2923,364 +2996,162 @@ class VastReportBuilder:
             except Exception as e:
                 self.logger.error(f"Error generating rack diagram: {e}", exc_info=True)
                 # Fallback to placeholder on error
-                layout_elements = self.brand_compliance.create_vast_2d_diagram_placeholder(
-                    "Physical Rack Layout",
-                    "Visual representation of hardware positioning in the rack with U-number assignments.",
-                )
-                content.extend(layout_elements)
+                content.extend(self._rack_diagram_placeholder())
 
         return content
 
-    def _create_network_configuration(self, data: Dict[str, Any]) -> List[Any]:
-        """Create network configuration section."""
-        styles = getSampleStyleSheet()
-
-        heading_style = ParagraphStyle(
-            "Section_Heading",
-            parent=styles["Heading1"],
-            fontSize=self.config.heading_font_size,
-            spaceAfter=12,
+    def _rack_diagram_placeholder(self) -> List[Any]:
+        """Return the placeholder shown when a rack diagram cannot be generated."""
+        return cast(
+            List[Any],
+            self.brand_compliance.create_vast_2d_diagram_placeholder(
+                "Physical Rack Layout",
+                "Visual representation of hardware positioning in the rack with U-number assignments.",
+            ),
         )
 
-        normal_style = ParagraphStyle(
-            "Section_Normal",
-            parent=styles["Normal"],
-            fontSize=self.config.font_size,
-            spaceAfter=8,
-        )
+    def _rack_generator(self, **dims: Any) -> RackDiagram:
+        """Return the RackDiagram for these page/rack dimensions, built once per builder."""
+        key = tuple(sorted(dims.items()))
+        rack_gen = self._rack_gens.get(key)
+        if rack_gen is None:
+            rack_gen = RackDiagram(library_path=self.library_path, user_images_dir=self.user_images_dir, **dims)
+            self._rack_gens[key] = rack_gen
+        return rack_gen
 
-        content = []
+    def _cached_rack_diagram(self, rack_gen: RackDiagram, *args: Any, **kwargs: Any) -> Tuple[Any, Any]:
+        """Call ``rack_gen.generate_rack_diagram``, memoizing results by input hash.
 
-        content.append(Paragraph("Network Configuration", heading_style))
-        content.append(Spacer(1, 12))
+        The last ``_RACK_CACHE_SIZE`` results are kept, so the second PDF pass
+        (and re-renders of an unchanged cluster) reuse the finished Drawing.
+        """
+        dims = (rack_gen.page_width, rack_gen.page_height, rack_gen.rack_height_u)
+        try:
+            payload = json.dumps([dims, args, kwargs], sort_keys=True, default=str)
+        except TypeError:
+            # Mixed-type dict keys cannot be sorted; skip the cache for these inputs
+            return cast(Tuple[Any, Any], rack_gen.generate_rack_diagram(*args, **kwargs))
+        key = hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+        cached = self._rack_cache.get(key)
+        if cached is not None:
+            self._rack_cache.move_to_end(key)
+            return cached
+        result: Tuple[Any, Any] = rack_gen.generate_rack_diagram(*args, **kwargs)
+        self._rack_cache[key] = result
+        if len(self._rack_cache) > _RACK_CACHE_SIZE:
+            self._rack_cache.popitem(last=False)
+        return result
+
+    @staticmethod
+    def _display_or_not_configured(value: Any, unknown_is_nc: bool = True) -> Any:
+        """Return ``value`` for display, or "Not Configured" when it is unset."""
+        if unknown_is_nc:
+            return value if value and value != _UNKNOWN else _NOT_CONFIGURED
+        return value if value is not None else _NOT_CONFIGURED
+
+    @staticmethod
+    def _security_display(value: Any, missing: Optional[Tuple[Any, ...]]) -> str:
+        """Format one _SECURITY_SUMMARY_FIELDS value for the security table."""
+        if missing is None:
+            return str(value if value is not None else _NOT_CONFIGURED)
+        if isinstance(value, list):
+            return ", ".join(str(v) for v in value) if value else _NOT_CONFIGURED
+        return str(value) if value and value not in missing else _NOT_CONFIGURED
+
+    def _create_network_configuration(self, data: Dict[str, Any]) -> List[Any]:
+        """Create network configuration section."""
+        heading_style = self._heading_style
+        normal_style = self._normal_style
+
+        content = [Paragraph("Network Configuration", heading_style), Spacer(1, 12)]
 
-        sections = data.get("sections", {})
-        network_config = sections.get("network_configuration", {}).get("data", {})
+        network_config = _section_data(data, "network_configuration")
 
         # DNS Configuration
         dns_config = network_config.get("dns")
         if dns_config:
-            content.append(Paragraph("<b>DNS Configuration:</b>", normal_style))
-            content.append(Paragraph(f"• Enabled: {dns_config.get('enabled', False)}", normal_style))
+            lines = ["<b>DNS Configuration:</b>", f"• Enabled: {dns_config.get('enabled', False)}"]
             servers = dns_config.get("servers", [])
             if servers:
-                content.append(Paragraph(f"• Servers: {', '.join(servers)}", normal_style))
+                lines.append(f"• Servers: {', '.join(servers)}")
             search_domains = dns_config.get("search_domains", [])
             if search_domains:
-                content.append(Paragraph(f"• Search Domains: {', '.join(search_domains)}", normal_style))
-            content.append(Spacer(1, 8))
+                lines.append(f"• Search Domains: {', '.join(search_domains)}")
+            content.extend((Paragraph("<br/>".join(lines), normal_style), Spacer(1, 8)))
 
         # NTP Configuration
         ntp_config = network_config.get("ntp")
         if ntp_config:
-            content.append(Paragraph("<b>NTP Configuration:</b>", normal_style))
-            content.append(Paragraph(f"• Enabled: {ntp_config.get('enabled', False)}", normal_style))
+            lines = ["<b>NTP Configuration:</b>", f"• Enabled: {ntp_config.get('enabled', False)}"]
             servers = ntp_config.get("servers", [])
             if servers:
-                content.append(Paragraph(f"• Servers: {', '.join(servers)}", normal_style))
-            content.append(Spacer(1, 8))
+                lines.append(f"• Servers: {', '.join(servers)}")
+            content.extend((Paragraph("<br/>".join(lines), normal_style), Spacer(1, 8)))
 
         # VIP Pools
         vippool_config = network_config.get("vippools")
         if vippool_config:
             pools = vippool_config.get("pools", [])
             pool_count = len(pools) if isinstance(pools, list) else 0
-            content.append(Paragraph(f"<b>VIP Pools:</b> {pool_count} pools configured", normal_style))
-            content.append(Spacer(1, 8))
+            content.extend((Paragraph(f"<b>VIP Pools:</b> {pool_count} pools configured", normal_style), Spacer(1, 8)))
 
         # Cluster Network Configuration
         cluster_summary = data.get("cluster_summary", {})
         if cluster_summary:
-            content.append(Paragraph("<b>Cluster Network Configuration:</b>", normal_style))
-
-            # Management and Gateway Configuration - Always show placeholders
-            management_vips = cluster_summary.get("management_vips")
-            management_vips_display = (
-                management_vips if management_vips and management_vips != "Unknown" else "Not Configured"
-            )
-            content.append(Paragraph(f"• Management VIPs: {management_vips_display}", normal_style))
-
-            external_gateways = cluster_summary.get("external_gateways")
-            external_gateways_display = (
-                external_gateways if external_gateways and external_gateways != "Unknown" else "Not Configured"
-            )
-            content.append(Paragraph(f"• External Gateways: {external_gateways_display}", normal_style))
-
-            # DNS and NTP Configuration - Always show placeholders
-            dns = cluster_summary.get("dns")
-            dns_display = dns if dns and dns != "Unknown" else "Not Configured"
-            content.append(Paragraph(f"• DNS Server: {dns_display}", normal_style))
-
-            ntp = cluster_summary.get("ntp")
-            ntp_display = ntp if ntp and ntp != "Unknown" else "Not Configured"
-            content.append(Paragraph(f"• NTP Server: {ntp_display}", normal_style))
-
-            # Network Interface Configuration - Always show placeholders
-            ext_netmask = cluster_summary.get("ext_netmask")
-            ext_netmask_display = ext_netmask if ext_netmask and ext_netmask != "Unknown" else "Not Configured"
-            content.append(Paragraph(f"• External Netmask: {ext_netmask_display}", normal_style))
-
-            auto_ports_ext_iface = cluster_summary.get("auto_ports_ext_iface")
-            auto_ports_ext_iface_display = (
-                auto_ports_ext_iface if auto_ports_ext_iface and auto_ports_ext_iface != "Unknown" else "Not Configured"
-            )
-            content.append(
-                Paragraph(
-                    f"• Auto Ports External Interface: {auto_ports_ext_iface_display}",
-                    normal_style,
-                )
+            lines = ["<b>Cluster Network Configuration:</b>"]
+            lines += (
+                f"• {label}: {self._display_or_not_configured(cluster_summary.get(key), unknown_is_nc)}"
+                for key, label, unknown_is_nc in _NET_FIELDS
             )
-
-            # IPMI Configuration - Always show placeholders
-            b2b_ipmi = cluster_summary.get("b2b_ipmi")
-            b2b_ipmi_display = b2b_ipmi if b2b_ipmi is not None else "Not Configured"
-            content.append(Paragraph(f"• B2B IPMI: {b2b_ipmi_display}", normal_style))
-
-            ipmi_gateway = cluster_summary.get("ipmi_gateway")
-            ipmi_gateway_display = ipmi_gateway if ipmi_gateway and ipmi_gateway != "Unknown" else "Not Configured"
-            content.append(Paragraph(f"• IPMI Gateway: {ipmi_gateway_display}", normal_style))
-
-            ipmi_netmask = cluster_summary.get("ipmi_netmask")
-            ipmi_netmask_display = ipmi_netmask if ipmi_netmask and ipmi_netmask != "Unknown" else "Not Configured"
-            content.append(Paragraph(f"• IPMI Netmask: {ipmi_netmask_display}", normal_style))
-
-            # MTU Configuration - Always show placeholders
-            eth_mtu = cluster_summary.get("eth_mtu")
-            eth_mtu_display = eth_mtu if eth_mtu is not None else "Not Configured"
-            content.append(Paragraph(f"• Ethernet MTU: {eth_mtu_display}", normal_style))
-
-            ib_mtu = cluster_summary.get("ib_mtu")
-            ib_mtu_display = ib_mtu if ib_mtu is not None else "Not Configured"
-            content.append(Paragraph(f"• InfiniBand MTU: {ib_mtu_display}", normal_style))
-
-            nb_eth_mtu = cluster_summary.get("nb_eth_mtu")
-            nb_eth_mtu_display = nb_eth_mtu if nb_eth_mtu is not None else "Not Configured"
-            content.append(Paragraph(f"• NVMe/TCP Ethernet MTU: {nb_eth_mtu_display}", normal_style))
+            content.append(Paragraph("<br/>".join(lines), normal_style))
 
         return content
 
     def _create_cluster_network_configuration(self, data: Dict[str, Any]) -> List[Any]:
         """Create cluster-wide network configuration section."""
-        styles = getSampleStyleSheet()
+        heading_style = self._heading_style
+        normal_style = self._normal_style
 
-        heading_style = ParagraphStyle(
-            "Section_Heading",
-            parent=styles["Heading1"],
-            fontSize=self.config.heading_font_size,
-            spaceAfter=12,
-        )
+        content = [Paragraph("Cluster Network Configuration", heading_style), Spacer(1, 12)]
 
-        normal_style = ParagraphStyle(
-            "Section_Normal",
-            parent=styles["Normal"],
-            fontSize=self.config.font_size,
-            spaceAfter=8,
-        )
-
-        content = []
-
-        content.append(Paragraph("Cluster Network Configuration", heading_style))
-        content.append(Spacer(1, 12))
-
-        sections = data.get("sections", {})
-        cluster_network_config = sections.get("cluster_network_configuration", {}).get("data", {})
+        cluster_network_config = _section_data(data, "cluster_network_configuration")
 
         if cluster_network_config:
-            # Management VIPs
-            management_vips = cluster_network_config.get("management_vips", "Not Configured")
-            if management_vips != "Not Configured":
-                content.append(Paragraph(f"• Management VIPs: {management_vips}", normal_style))
-            else:
-                content.append(Paragraph("• Management VIPs: Not Configured", normal_style))
-
-            # Management VIP (single)
-            mgmt_vip = cluster_network_config.get("mgmt_vip", "Not Configured")
-            if mgmt_vip != "Not Configured":
-                content.append(Paragraph(f"• Management VIP: {mgmt_vip}", normal_style))
-
-            # Management Inner VIP
-            mgmt_inner_vip = cluster_network_config.get("mgmt_inner_vip", "Not Configured")
-            if mgmt_inner_vip != "Not Configured":
-                content.append(Paragraph(f"• Management Inner VIP: {mgmt_inner_vip}", normal_style))
-
-            # Management Inner VIP CNode
-            mgmt_inner_vip_cnode = cluster_network_config.get("mgmt_inner_vip_cnode", "Not Configured")
-            if mgmt_inner_vip_cnode != "Not Configured":
-                content.append(
-                    Paragraph(
-                        f"• Management Inner VIP CNode: {mgmt_inner_vip_cnode}",
-                        normal_style,
-                    )
-                )
-
-            # External Gateways
-            external_gateways = cluster_network_config.get("external_gateways", "Not Configured")
-            if external_gateways != "Not Configured":
-                content.append(Paragraph(f"• External Gateways: {external_gateways}", normal_style))
-            else:
-                content.append(Paragraph("• External Gateways: Not Configured", normal_style))
-
-            # DNS Servers
-            dns = cluster_network_config.get("dns", "Not Configured")
-            if dns != "Not Configured":
-                content.append(Paragraph(f"• DNS Servers: {dns}", normal_style))
-            else:
-                content.append(Paragraph("• DNS Servers: Not Configured", normal_style))
-
-            # NTP Servers
-            ntp = cluster_network_config.get("ntp", "Not Configured")
-            if ntp != "Not Configured":
-                content.append(Paragraph(f"• NTP Servers: {ntp}", normal_style))
-            else:
-                content.append(Paragraph("• NTP Servers: Not Configured", normal_style))
-
-            # Network Interface Configuration
-            ext_netmask = cluster_network_config.get("ext_netmask", "Unknown")
-            ext_netmask_display = ext_netmask if ext_netmask != "Unknown" else "Not Configured"
-            content.append(Paragraph(f"• External Netmask: {ext_netmask_display}", normal_style))
-
-            auto_ports_ext_iface = cluster_network_config.get("auto_ports_ext_iface", "Unknown")
-            auto_ports_ext_iface_display = (
-                auto_ports_ext_iface if auto_ports_ext_iface != "Unknown" else "Not Configured"
-            )
-            content.append(
-                Paragraph(
-                    f"• Auto Ports External Interface: {auto_ports_ext_iface_display}",
-                    normal_style,
-                )
-            )
-
-            # IPMI Configuration
-            b2b_ipmi = cluster_network_config.get("b2b_ipmi", False)
-            content.append(Paragraph(f"• B2B IPMI: {b2b_ipmi}", normal_style))
-
-            # MTU Configuration
-            eth_mtu = cluster_network_config.get("eth_mtu", "Unknown")
-            eth_mtu_display = eth_mtu if eth_mtu != "Unknown" else "Not Configured"
-            content.append(Paragraph(f"• Ethernet MTU: {eth_mtu_display}", normal_style))
-
-            ib_mtu = cluster_network_config.get("ib_mtu", "Unknown")
-            ib_mtu_display = ib_mtu if ib_mtu != "Unknown" else "Not Configured"
-            content.append(Paragraph(f"• InfiniBand MTU: {ib_mtu_display}", normal_style))
-
-            nb_eth_mtu = cluster_network_config.get("nb_eth_mtu", "Unknown")
-            nb_eth_mtu_display = nb_eth_mtu if nb_eth_mtu != "Unknown" else "Not Configured"
-            content.append(Paragraph(f"• NVMe/TCP Ethernet MTU: {nb_eth_mtu_display}", normal_style))
-
-            # IPMI Gateway and Netmask
-            ipmi_gateway = cluster_network_config.get("ipmi_gateway", "Unknown")
-            ipmi_gateway_display = ipmi_gateway if ipmi_gateway != "Unknown" else "Not Configured"
-            content.append(Paragraph(f"• IPMI Gateway: {ipmi_gateway_display}", normal_style))
-
-            ipmi_netmask = cluster_network_config.get("ipmi_netmask", "Unknown")
-            ipmi_netmask_display = ipmi_netmask if ipmi_netmask != "Unknown" else "Not Configured"
-            content.append(Paragraph(f"• IPMI Netmask: {ipmi_netmask_display}", normal_style))
+            lines = []
+            for key, label, default, optional in _CLUSTER_NET_FIELDS:
+                value = cluster_network_config.get(key, default)
+                if value == _UNKNOWN:
+                    value = _NOT_CONFIGURED
+                if optional and value == _NOT_CONFIGURED:
+                    continue
+                lines.append(f"• {label}: {value}")
+            content.append(Paragraph("<br/>".join(lines), normal_style))
 
         return content
 
     def _create_cnodes_network_configuration(self, data: Dict[str, Any]) -> List[Any]:
         """Create CNodes network configuration section with scale-out support."""
-        styles = getSampleStyleSheet()
-
-        heading_style = ParagraphStyle(
-            "Section_Heading",
-            parent=styles["Heading1"],
-            fontSize=self.config.heading_font_size,
-            spaceAfter=12,
-        )
-
-        normal_style = ParagraphStyle(
-            "Section_Normal",
-            parent=styles["Normal"],
-            fontSize=self.config.font_size,
-            spaceAfter=8,
-        )
-
-        content = []
+        heading_style = self._heading_style
+        normal_style = self._normal_style
 
-        content.append(Paragraph("CNodes Network Configuration", heading_style))
-        content.append(Spacer(1, 12))
+        content = [Paragraph("CNodes Network Configuration", heading_style), Spacer(1, 12)]
 
-        sections = data.get("sections", {})
-        cnodes_network_config = sections.get("cnodes_network_configuration", {}).get("data", {})
+        cnodes_network_config = _section_data(data, "cnodes_network_configuration")
 
         cnodes = cnodes_network_config.get("cnodes", [])
         total_cnodes = cnodes_network_config.get("total_cnodes", 0)
 
         if cnodes:
-            content.append(Paragraph(f"<b>Total CNodes:</b> {total_cnodes}", normal_style))
-            content.append(Spacer(1, 12))
+            content.extend((Paragraph(f"<b>Total CNodes:</b> {total_cnodes}", normal_style), Spacer(1, 12)))
 
             # Create table for CNodes with scale-out support
-            table_data = [
-                [
-                    "ID",
-                    "Hostname",
-                    "Mgmt IP",
-                    "IPMI IP",
-                    "Box Vendor",
-                    "VAST OS",
-                    "VMS Host",
-                    "TPM Support",
-                    "Single NIC",
-                    "Net Type",
-                ]
-            ]
-
-            for cnode in cnodes:
-                table_data.append(
-                    [
-                        str(cnode.get("id", "Unknown")),
-                        cnode.get("hostname", "Unknown"),
-                        cnode.get("mgmt_ip", "Unknown"),
-                        cnode.get("ipmi_ip", "Unknown"),
-                        (
-                            cnode.get("box_vendor", "Unknown")[:30] + "..."
-                            if len(cnode.get("box_vendor", "")) > 30
-                            else cnode.get("box_vendor", "Unknown")
-                        ),
-                        cnode.get("vast_os", "Unknown"),
-                        "Yes" if cnode.get("is_vms_host", False) else "No",
-                        ("Yes" if cnode.get("tpm_boot_dev_encryption_supported", False) else "No"),
-                        "Yes" if cnode.get("single_nic", False) else "No",
-                        cnode.get("net_type", "Unknown"),
-                    ]
-                )
-
-            page_width = getattr(self, "_frame_width", A4[0] - 1.0 * inch)
-            table = Table(
-                table_data,
-                colWidths=[
-                    page_width * 0.08,  # ID
-                    page_width * 0.18,  # Hostname
-                    page_width * 0.12,  # Mgmt IP
-                    page_width * 0.12,  # IPMI IP
-                    page_width * 0.20,  # Box Vendor
-                    page_width * 0.12,  # VAST OS
-                    page_width * 0.06,  # VMS Host
-                    page_width * 0.06,  # TPM Support
-                    page_width * 0.06,  # Single NIC
-                    page_width * 0.10,  # Net Type
-                ],
-            )
-            table.setStyle(
-                TableStyle(
-                    [
-                        ("BACKGROUND", (0, 0), (-1, 0), colors.grey),
-                        ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
-                        ("ALIGN", (0, 0), (-1, -1), "CENTER"),
-                        ("FONTNAME", (0, 0), (-1, 0), self._font("bold")),
-                        ("FONTSIZE", (0, 0), (-1, 0), 8),
-                        ("BOTTOMPADDING", (0, 0), (-1, 0), 12),
-                        ("BACKGROUND", (0, 1), (-1, -1), colors.beige),
-                        ("FONTSIZE", (0, 1), (-1, -1), 7),
-                        ("GRID", (0, 0), (-1, -1), 1, colors.black),
-                        ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
-                        ("WORDWRAP", (0, 0), (-1, -1), "CJK"),
-                    ]
-                )
-            )
+            rows = [_cnode_network_row(cnode) for cnode in cnodes]
 
+            page_width = self._frame_width
+            col_widths = [page_width * f for f in _NODE_NETWORK_COL_FRACTIONS]
+            table = Table([_CNODE_NETWORK_HEADER, *rows], colWidths=col_widths)
+            table.setStyle(self._cnode_table_style)
             content.append(table)
         else:
             content.append(Paragraph("No CNodes network configuration data available", normal_style))
@@ -3289,114 +3160,132 @@ class VastReportBuilder:
 
     def _create_dnodes_network_configuration(self, data: Dict[str, Any]) -> List[Any]:
         """Create DNodes network configuration section with scale-out support."""
-        styles = getSampleStyleSheet()
-
-        heading_style = ParagraphStyle(
-            "Section_Heading",
-            parent=styles["Heading1"],
-            fontSize=self.config.heading_font_size,
-            spaceAfter=12,
-        )
-
-        normal_style = ParagraphStyle(
-            "Section_Normal",
-            parent=styles["Normal"],
-            fontSize=self.config.font_size,
-            spaceAfter=8,
-        )
+        heading_style = self._heading_style
+        normal_style = self._normal_style
 
-        content = []
-
-        content.append(Paragraph("DNodes Network Configuration", heading_style))
-        content.append(Spacer(1, 12))
+        content = [Paragraph("DNodes Network Configuration", heading_style), Spacer(1, 12)]
 
-        sections = data.get("sections", {})
-        dnodes_network_config = sections.get("dnodes_network_configuration", {}).get("data", {})
+        dnodes_network_config = _section_data(data, "dnodes_network_configuration")
 
         dnodes = dnodes_network_config.get("dnodes", [])
         total_dnodes = dnodes_network_config.get("total_dnodes", 0)
 
         if dnodes:
-            content.append(Paragraph(f"<b>Total DNodes:</b> {total_dnodes}", normal_style))
-            content.append(Spacer(1, 12))
+            content.extend((Paragraph(f"<b>Total DNodes:</b> {total_dnodes}", normal_style), Spacer(1, 12)))
 
             # Create table for DNodes with scale-out support
-            table_data = [
-                [
-                    "ID",
-                    "Hostname",
-                    "Mgmt IP",
-                    "IPMI IP",
-                    "Box Vendor",
-                    "VAST OS",
-                    "Position",
-                    "Ceres",
-                    "Ceres v2",
-                    "Net Type",
-                ]
-            ]
-
-            for dnode in dnodes:
-                table_data.append(
-                    [
-                        str(dnode.get("id", "Unknown")),
-                        dnode.get("hostname", "Unknown"),
-                        dnode.get("mgmt_ip", "Unknown"),
-                        dnode.get("ipmi_ip", "Unknown"),
-                        (
-                            dnode.get("box_vendor", "Unknown")[:30] + "..."
-                            if len(dnode.get("box_vendor", "")) > 30
-                            else dnode.get("box_vendor", "Unknown")
-                        ),
-                        dnode.get("vast_os", "Unknown"),
-                        dnode.get("position", "Unknown"),
-                        "Yes" if dnode.get("is_ceres", False) else "No",
-                        "Yes" if dnode.get("is_ceres_v2", False) else "No",
-                        dnode.get("net_type", "Unknown"),
-                    ]
-                )
-
-            page_width = getattr(self, "_frame_width", A4[0] - 1.0 * inch)
-            table = Table(
-                table_data,
-                colWidths=[
-                    page_width * 0.08,  # ID
-                    page_width * 0.18,  # Hostname
-                    page_width * 0.12,  # Mgmt IP
-                    page_width * 0.12,  # IPMI IP
-                    page_width * 0.20,  # Box Vendor
-                    page_width * 0.12,  # VAST OS
-                    page_width * 0.06,  # Position
-                    page_width * 0.06,  # Ceres
-                    page_width * 0.06,  # Ceres v2
-                    page_width * 0.10,  # Net Type
-                ],
-            )
-            table.setStyle(
-                TableStyle(
-                    [
-                        ("BACKGROUND", (0, 0), (-1, 0), colors.grey),
-                        ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
-                        ("ALIGN", (0, 0), (-1, -1), "CENTER"),
-                        ("FONTNAME", (0, 0), (-1, -1), self._font("bold")),
-                        ("FONTSIZE", (0, 0), (-1, 0), 8),
-                        ("BOTTOMPADDING", (0, 0), (-1, 0), 12),
-                        ("BACKGROUND", (0, 1), (-1, -1), colors.beige),
-                        ("FONTSIZE", (0, 1), (-1, -1), 7),
-                        ("GRID", (0, 0), (-1, -1), 1, colors.black),
-                        ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
-                        ("WORDWRAP", (0, 0), (-1, -1), "CJK"),
-                    ]
-                )
-            )
+            rows = [_dnode_network_row(dnode) for dnode in dnodes]
 
+            page_width = self._frame_width
+            col_widths = [page_width * f for f in _NODE_NETWORK_COL_FRACTIONS]
+            table = Table([_DNODE_NETWORK_HEADER, *rows], colWidths=col_widths)
+            table.setStyle(self._dnode_table_style)
             content.append(table)
         else:
             content.append(Paragraph("No DNodes network configuration data available", normal_style))
 
         return content
 
-    def _safe_table_value(self, value: Any, default: str = "Not Configured") -> str:
+    def _port_summary_table_style(self) -> Any:
+        """Return the VAST-branded style of the per-switch port summary tables."""
+        return TableStyle(
+            [
+                # Header row styling
+                (
+                    "BACKGROUND",
+                    (0, 0),
+                    (-1, 0),
+                    self.brand_compliance.colors.BACKGROUND_DARK,
+                ),
+                (
+                    "TEXTCOLOR",
+                    (0, 0),
+                    (-1, 0),
+                    self.brand_compliance.colors.PURE_WHITE,
+                ),
+                (
+                    "FONTNAME",
+                    (0, 0),
+                    (-1, 0),
+                    self.brand_compliance.typography.PRIMARY_FONT,
+                ),
+                (
+                    "FONTSIZE",
+                    (0, 0),
+                    (-1, 0),
+                    self.brand_compliance.typography.BODY_SIZE,
+                ),
+                ("ALIGN", (0, 0), (-1, -1), "CENTER"),
+                ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+                # Data rows styling
+                (
+                    "BACKGROUND",
+                    (0, 1),
+                    (-1, -1),
+                    self.brand_compliance.colors.VAST_BLUE_LIGHTEST,
+                ),
+                (
+                    "TEXTCOLOR",
+                    (0, 1),
+                    (-1, -1),
+                    self.brand_compliance.colors.DARK_GRAY,
+                ),
+                (
+                    "FONTNAME",
+                    (0, 1),
+                    (-1, -1),
+                    self.brand_compliance.typography.BODY_FONT,
+                ),
+                (
+                    "FONTSIZE",
+                    (0, 1),
+                    (-1, -1),
+                    self.brand_compliance.typography.BODY_SIZE,
+                ),
+                # Borders and spacing
+                (
+                    "GRID",
+                    (0, 0),
+                    (-1, -1),
+                    1,
+                    self.brand_compliance.colors.BACKGROUND_DARK,
+                ),
+                (
+                    "ROWBACKGROUNDS",
+                    (0, 1),
+                    (-1, -1),
+                    [
+                        self.brand_compliance.colors.PURE_WHITE,
+                        self.brand_compliance.colors.ALTERNATING_ROW,
+                    ],
+                ),
+                ("PADDING", (0, 0), (-1, -1), 8),
+                ("LEFTPADDING", (0, 0), (-1, -1), 12),
+                ("RIGHTPADDING", (0, 0), (-1, -1), 12),
+                ("WORDWRAP", (0, 0), (-1, -1), "CJK"),
+            ]
+        )
+
+    def _node_table_style(self, header_only_bold: bool) -> Any:
+        """Return the grey/beige grid style shared by the CNode and DNode tables."""
+        bold_end = (-1, 0) if header_only_bold else (-1, -1)
+        return TableStyle(
+            [
+                ("BACKGROUND", (0, 0), (-1, 0), _NODE_TABLE_HEADER_BG),
+                ("TEXTCOLOR", (0, 0), (-1, 0), _NODE_TABLE_HEADER_FG),
+                ("ALIGN", (0, 0), (-1, -1), "CENTER"),
+                ("FONTNAME", (0, 0), bold_end, self._font("bold")),
+                ("FONTSIZE", (0, 0), (-1, 0), 8),
+                ("BOTTOMPADDING", (0, 0), (-1, 0), 12),
+                ("BACKGROUND", (0, 1), (-1, -1), _NODE_TABLE_BODY_BG),
+                ("FONTSIZE", (0, 1), (-1, -1), 7),
+                ("GRID", (0, 0), (-1, -1), 1, _NODE_TABLE_GRID),
+                ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+                ("WORDWRAP", (0, 0), (-1, -1), "CJK"),
+            ]
+        )
+
+    def _safe_table_value(self, value: Any, default: str = _NOT_CONFIGURED) -> str:
         """
         Safely convert any value to a string for use in table cells.
         Handles lists, None, and other types that could cause ReportLab errors.
@@ -3417,7 +3306,7 @@ class VastReportBuilder:
         if isinstance(value, (dict,)):
             return str(value) if value else default
         value_str = str(value)
-        if not value_str or value_str in ("Unknown", "null", "None"):
+        if not value_str or value_str in _EMPTY_VALUE_STRINGS:
             return default
         return value_str
 
@@ -3451,29 +3340,6 @@ class VastReportBuilder:
         section_key: Optional[str] = None,
     ) -> List[Any]:
         """Create comprehensive network configuration section consolidating all network data."""
-        styles = getSampleStyleSheet()
-
-        heading_style = ParagraphStyle(
-            "Section_Heading",
-            parent=styles["Heading1"],
-            fontSize=self.config.heading_font_size,
-            spaceAfter=12,
-        )
-
-        subheading_style = ParagraphStyle(
-            "Subsection_Heading",
-            parent=styles["Heading2"],
-            fontSize=self.config.heading_font_size - 2,
-            spaceAfter=8,
-        )
-
-        normal_style = ParagraphStyle(
-            "Section_Normal",
-            parent=styles["Normal"],
-            fontSize=self.config.font_size,
-            spaceAfter=8,
-        )
-
         content = []
 
         # Note: PageBreak is handled by main build function, no need to add here
@@ -3487,98 +3353,56 @@ class VastReportBuilder:
             content.append(PageMarker(section_key, page_tracker))
 
         # Section Overview
-        overview_style = ParagraphStyle(
-            "Section_Overview",
-            parent=styles["Normal"],
-            fontSize=self.config.font_size - 1,
-            textColor=self.brand_compliance.colors.BACKGROUND_DARK,
-            spaceAfter=12,
-            spaceBefore=8,
-            leftIndent=12,
-            rightIndent=12,
-        )
+        overview_style = self._overview_style
 
-        content.append(
-            Paragraph(
-                "The Network Configuration section provides comprehensive documentation of all network-related settings and connectivity parameters for the VAST Data cluster. This section includes cluster-wide network configuration, individual node network settings for both compute nodes (CNodes) and data nodes (DNodes), and network service configurations such as DNS and NTP. The network configuration data is essential for understanding cluster connectivity, troubleshooting network issues, validating network security settings, and ensuring proper network segmentation. This information supports network administrators in maintaining optimal network performance and security posture for the storage infrastructure.",
-                overview_style,
+        content.extend(
+            (
+                Paragraph(
+                    "The Network Configuration section provides comprehensive documentation of all network-related settings and connectivity parameters for the VAST Data cluster. This section includes cluster-wide network configuration, individual node network settings for both compute nodes (CNodes) and data nodes (DNodes), and network service configurations such as DNS and NTP. The network configuration data is essential for understanding cluster connectivity, troubleshooting network issues, validating network security settings, and ensuring proper network segmentation. This information supports network administrators in maintaining optimal network performance and security posture for the storage infrastructure.",
+                    overview_style,
+                ),
+                Spacer(1, 8),
             )
         )
-        content.append(Spacer(1, 8))
 
-        sections = data.get("sections", {})
+        # Skip every sub-table probe when neither the network sections nor the
+        # hardware inventory carry anything to show.
+        cluster_network_config = _section_data(data, "cluster_network_configuration")
+        hw_inv = data.get("hardware_inventory") or {}
+        if not (
+            cluster_network_config
+            or hw_inv.get("cnodes")
+            or hw_inv.get("dnodes")
+            or _section_data(data, "cnodes_network_configuration")
+            or _section_data(data, "dnodes_network_configuration")
+        ):
+            content.append(Paragraph("No network configuration data available.", self._body_style))
+            return content
 
         # Add Network Configuration summary table (similar to Storage Capacity)
-        cluster_network_config = sections.get("cluster_network_configuration", {}).get("data", {})
         if cluster_network_config:
-            network_summary_data = []
-
-            # Management and Gateway settings - use _safe_table_value for potential list values
-            mgmt_vips = self._safe_table_value(cluster_network_config.get("management_vips"))
-            if mgmt_vips != "Not Configured":
-                network_summary_data.append(["Management VIPs", mgmt_vips])
-
-            ext_gateways = self._safe_table_value(cluster_network_config.get("external_gateways"))
-            if ext_gateways != "Not Configured":
-                network_summary_data.append(["External Gateways", ext_gateways])
-
-            # DNS and NTP settings - use _safe_table_value for potential list values
-            dns_servers = self._safe_table_value(cluster_network_config.get("dns"))
-            if dns_servers != "Not Configured":
-                network_summary_data.append(["DNS Servers", dns_servers])
-
-            ntp_servers = self._safe_table_value(cluster_network_config.get("ntp"))
-            if ntp_servers != "Not Configured":
-                network_summary_data.append(["NTP Servers", ntp_servers])
-
-            # Network interface settings - use _safe_table_value for potential list values
-            ext_netmask = self._safe_table_value(cluster_network_config.get("ext_netmask"))
-            if ext_netmask != "Not Configured":
-                network_summary_data.append(["External Netmask", ext_netmask])
-
-            auto_ports = self._safe_table_value(cluster_network_config.get("auto_ports_ext_iface"))
-            if auto_ports != "Not Configured":
-                network_summary_data.append(["Auto Ports Ext Interface", auto_ports])
-
+            get = cluster_network_config.get
+            # Management, gateway, DNS/NTP and interface settings, shown when configured
+            network_summary_data = [
+                [label, display]
+                for key, label in _NETWORK_SUMMARY_FIELDS
+                if (display := self._safe_table_value(get(key))) != _NOT_CONFIGURED
+            ]
             # MTU settings
-            if cluster_network_config.get("eth_mtu") and cluster_network_config.get("eth_mtu") != "Not Configured":
-                network_summary_data.append(
-                    [
-                        "Ethernet MTU",
-                        str(cluster_network_config.get("eth_mtu", "Not Configured")),
-                    ]
-                )
-            if cluster_network_config.get("ib_mtu") and cluster_network_config.get("ib_mtu") != "Not Configured":
-                network_summary_data.append(
-                    [
-                        "InfiniBand MTU",
-                        str(cluster_network_config.get("ib_mtu", "Not Configured")),
-                    ]
-                )
-            if (
-                cluster_network_config.get("nb_eth_mtu")
-                and cluster_network_config.get("nb_eth_mtu") != "Not Configured"
-            ):
-                network_summary_data.append(
-                    [
-                        "NVMe/TCP Ethernet MTU",
-                        str(cluster_network_config.get("nb_eth_mtu", "Not Configured")),
-                    ]
-                )
-
-            # IPMI settings (always show, even if Not Configured) - use _safe_table_value
-            ipmi_gateway = self._safe_table_value(cluster_network_config.get("ipmi_gateway"))
-            network_summary_data.append(["IPMI Gateway", ipmi_gateway])
-            ipmi_netmask = self._safe_table_value(cluster_network_config.get("ipmi_netmask"))
-            network_summary_data.append(["IPMI Netmask", ipmi_netmask])
+            network_summary_data += [
+                [label, str(mtu)] for key, label in _NETWORK_MTU_FIELDS if (mtu := get(key)) and mtu != _NOT_CONFIGURED
+            ]
+            # IPMI settings (always show, even if Not Configured)
+            network_summary_data += [[label, self._safe_table_value(get(key))] for key, label in _NETWORK_IPMI_FIELDS]
 
             # B2B IPMI setting
-            if cluster_network_config.get("b2b_ipmi") is not None:
-                network_summary_data.append(["B2B IPMI", str(cluster_network_config.get("b2b_ipmi", False))])
+            b2b_ipmi = get("b2b_ipmi")
+            if b2b_ipmi is not None:
+                network_summary_data.append(["B2B IPMI", str(b2b_ipmi)])
 
             # Net Type setting - use _safe_table_value for potential list values
-            net_type = self._safe_table_value(cluster_network_config.get("net_type"))
-            if net_type != "Not Configured":
+            net_type = self._safe_table_value(get("net_type"))
+            if net_type != _NOT_CONFIGURED:
                 network_summary_data.append(["Net Type", net_type])
 
             if network_summary_data:
@@ -3591,20 +3415,17 @@ class VastReportBuilder:
         # Node Management Map: VMS device name -> assigned hostname -> external mgmt IP.
         # Sourced from hardware_inventory so all three identifiers appear together;
         # the per-node network tables below show name + mgmt IP but not hostname.
-        hw_inv = data.get("hardware_inventory", {})
         map_headers = ["Device Name (VMS)", "Hostname", "Mgmt IP"]
 
         def _management_map_rows(nodes: Any) -> List[List[str]]:
-            rows: List[List[str]] = []
-            for node in sorted(nodes or [], key=self._ip_sort_key):
-                rows.append(
-                    [
-                        node.get("name") or node.get("hostname", "Unknown"),
-                        node.get("hostname", "Unknown"),
-                        node.get("mgmt_ip", "Unknown"),
-                    ]
-                )
-            return rows
+            return [
+                [
+                    node.get("name") or node.get("hostname", "Unknown"),
+                    node.get("hostname", "Unknown"),
+                    node.get("mgmt_ip", "Unknown"),
+                ]
+                for node in sorted(nodes or [], key=self._ip_sort_key)
+            ]
 
         cnode_map_rows = _management_map_rows(hw_inv.get("cnodes"))
         if cnode_map_rows:
@@ -3624,164 +3445,67 @@ class VastReportBuilder:
             )
             content.append(Spacer(1, 16))
 
-        # 1. CNodes Network Configuration
-        # For EBox clusters, use hardware_inventory directly (from /api/v7/cnodes/)
-        # For non-EBox clusters, try network_settings first then fallback
-        hardware_inventory = data.get("hardware_inventory", {})
-        eboxes = hardware_inventory.get("eboxes", {})
-        is_ebox_cluster = bool(eboxes)
+        # CNode and DNode network tables.  For EBox clusters, use
+        # hardware_inventory directly (from /api/v7/cnodes/ and /api/v7/dnodes/);
+        # for non-EBox clusters, try network_settings first then fall back.
+        is_ebox_cluster = bool(hw_inv.get("eboxes"))
 
-        cnodes = []
-        if is_ebox_cluster:
-            # EBox clusters: use hardware_inventory cnodes (from /api/v7/cnodes/)
-            hw_cnodes = hardware_inventory.get("cnodes", [])
-            for c in hw_cnodes:
-                cnodes.append(
-                    {
-                        "id": c.get("id", "Unknown"),
-                        "name": c.get("name", "Unknown"),
-                        "mgmt_ip": c.get("mgmt_ip", "Unknown"),
-                        "ipmi_ip": c.get("ipmi_ip", "Unknown"),
-                        "vast_os": c.get("os_version", "Unknown"),
-                        "is_vms_host": c.get("is_mgmt", False),
-                    }
-                )
-        else:
-            # Non-EBox clusters: try network_settings, fallback to hardware_inventory
-            cnodes_network_config = sections.get("cnodes_network_configuration", {}).get("data", {})
-            cnodes = cnodes_network_config.get("cnodes", [])
-            if not cnodes:
-                hw_cnodes = hardware_inventory.get("cnodes", [])
-                for c in hw_cnodes:
-                    cnodes.append(
-                        {
-                            "id": c.get("id", "Unknown"),
-                            "name": c.get("name", "Unknown"),
-                            "mgmt_ip": c.get("mgmt_ip", "Unknown"),
-                            "ipmi_ip": c.get("ipmi_ip", "Unknown"),
-                            "vast_os": c.get("os_version", "Unknown"),
-                            "is_vms_host": c.get("is_mgmt", False),
-                        }
-                    )
-
-        if cnodes:
-            # Sort CNodes by Mgmt IP (lowest to highest)
-            cnodes = sorted(cnodes, key=self._ip_sort_key)
+        def _network_nodes(kind: str, hw_entry: Callable[[Dict[str, Any]], Dict[str, Any]]) -> List[Dict[str, Any]]:
+            nodes = [] if is_ebox_cluster else _section_data(data, f"{kind}_network_configuration").get(kind, [])
+            return nodes or [hw_entry(node) for node in hw_inv.get(kind) or []]
 
-            # Create table for CNodes with scale-out support
-            headers = [
-                "ID",
-                "Name",
-                "Mgmt IP",
-                "IPMI IP",
-                "VAST OS",
+        content.extend(
+            self._node_network_summary_table(
+                _network_nodes("cnodes", _hw_cnode_network_entry),
+                "CNode Network Configuration",
                 "VMS Host",
-            ]
-
-            table_data = []
-            for cnode in cnodes:
-                # Use 'name' field; fall back to 'hostname' for backward compatibility
-                cnode_name = cnode.get("name") or cnode.get("hostname", "Unknown")
-                table_data.append(
-                    [
-                        cnode.get("id", "Unknown"),
-                        cnode_name,
-                        cnode.get("mgmt_ip", "Unknown"),
-                        cnode.get("ipmi_ip", "Unknown"),
-                        cnode.get("vast_os", "Unknown"),
-                        str(cnode.get("is_vms_host", False)),
-                    ]
-                )
-
-            # Create table with pagination support
-            table_elements = self.brand_compliance.create_vast_hardware_table_with_pagination(
-                table_data, "CNode Network Configuration", headers
+                lambda cnode: str(cnode.get("is_vms_host", False)),
             )
-            content.extend(table_elements)
-            content.append(Spacer(1, 16))
-
-        # 2. DNodes Network Configuration
-        # For EBox clusters, use hardware_inventory directly (from /api/v7/dnodes/)
-        dnodes = []
-        if is_ebox_cluster:
-            # EBox clusters: use hardware_inventory dnodes (from /api/v7/dnodes/)
-            hw_dnodes = hardware_inventory.get("dnodes", [])
-            for d in hw_dnodes:
-                # Position: "primary" (when empty) or "virtual"
-                raw_pos = d.get("position") or ""
-                pos = "virtual" if raw_pos == "virtual" else "primary"
-                dnodes.append(
-                    {
-                        "id": d.get("id", "Unknown"),
-                        "name": d.get("name", "Unknown"),
-                        "mgmt_ip": d.get("mgmt_ip", "Unknown"),
-                        "ipmi_ip": d.get("ipmi_ip", "Unknown"),
-                        "vast_os": d.get("os_version", "Unknown"),
-                        "position": pos,
-                    }
-                )
-        else:
-            # Non-EBox clusters: try network_settings, fallback to hardware_inventory
-            dnodes_network_config = sections.get("dnodes_network_configuration", {}).get("data", {})
-            dnodes = dnodes_network_config.get("dnodes", [])
-            if not dnodes:
-                hw_dnodes = hardware_inventory.get("dnodes", [])
-                for d in hw_dnodes:
-                    # Position: "primary" (when empty) or "virtual"
-                    raw_pos = d.get("position") or ""
-                    pos = "virtual" if raw_pos == "virtual" else "primary"
-                    dnodes.append(
-                        {
-                            "id": d.get("id", "Unknown"),
-                            "name": d.get("name", "Unknown"),
-                            "mgmt_ip": d.get("mgmt_ip", "Unknown"),
-                            "ipmi_ip": d.get("ipmi_ip", "Unknown"),
-                            "vast_os": d.get("os_version", "Unknown"),
-                            "position": pos,
-                        }
-                    )
-
-        if dnodes:
-            # Sort DNodes by Mgmt IP (lowest to highest)
-            dnodes = sorted(dnodes, key=self._ip_sort_key)
-
-            # Create table for DNodes with scale-out support
-            headers = [
-                "ID",
-                "Name",
-                "Mgmt IP",
-                "IPMI IP",
-                "VAST OS",
+        )
+        # Position is "virtual" or "primary".
+        content.extend(
+            self._node_network_summary_table(
+                _network_nodes("dnodes", _hw_dnode_network_entry),
+                "DNode Network Configuration",
                 "Position",
-            ]
-
-            table_data = []
-            for dnode in dnodes:
-                # Use 'name' field; fall back to 'hostname' for backward compatibility
-                dnode_name = dnode.get("name") or dnode.get("hostname", "Unknown")
-                # Position: "primary" or "virtual"
-                raw_pos = dnode.get("position") or ""
-                position = "virtual" if raw_pos == "virtual" else "primary"
-                table_data.append(
-                    [
-                        dnode.get("id", "Unknown"),
-                        dnode_name,
-                        dnode.get("mgmt_ip", "Unknown"),
-                        dnode.get("ipmi_ip", "Unknown"),
-                        dnode.get("vast_os", "Unknown"),
-                        position,
-                    ]
-                )
-
-            # Create table with pagination support
-            table_elements = self.brand_compliance.create_vast_hardware_table_with_pagination(
-                table_data, "DNode Network Configuration", headers
+                lambda dnode: "virtual" if dnode.get("position") == "virtual" else "primary",
             )
-            content.extend(table_elements)
-            content.append(Spacer(1, 16))
+        )
 
         return content
 
+    def _node_network_summary_table(
+        self,
+        nodes: List[Dict[str, Any]],
+        title: str,
+        last_header: str,
+        last_cell: Callable[[Dict[str, Any]], str],
+    ) -> List[Any]:
+        """Build one Mgmt-IP-sorted CNode/DNode table of the Network Configuration section.
+
+        The tables share their first five columns and differ only in the last
+        one (VMS Host for CNodes, Position for DNodes).  Returns an empty list
+        when there are no nodes.
+        """
+        if not nodes:
+            return []
+        # Use 'name' field; fall back to 'hostname' for backward compatibility
+        table_data = [
+            [
+                node.get("id", _UNKNOWN),
+                node.get("name") or node.get("hostname", _UNKNOWN),
+                node.get("mgmt_ip", _UNKNOWN),
+                node.get("ipmi_ip", _UNKNOWN),
+                node.get("vast_os", _UNKNOWN),
+                last_cell(node),
+            ]
+            for node in sorted(nodes, key=self._ip_sort_key)
+        ]
+        table_elements = self.brand_compliance.create_vast_hardware_table_with_pagination(
+            table_data, title, [*_NODE_NETWORK_SUMMARY_HEADER, last_header]
+        )
+        return [*table_elements, Spacer(1, 16)]
+
     def _resolve_diagrams_dir(self, data: Dict[str, Any]) -> Path:
         """Resolve the diagram output directory.
 
@@ -3792,12 +3516,37 @@ class VastReportBuilder:
         """
         data_dir = get_data_dir()
         if self.segment_by_cluster:
-            from utils.cluster_paths import cluster_paths, resolve_cluster_key_from_summary
-
             key = resolve_cluster_key_from_summary(data)
             return Path(cluster_paths(data_dir, key).diagrams)
         return Path(data_dir) / "output" / "diagrams"
 
+    @staticmethod
+    def _diagram_cache_key(mode: str, output_dir: Path, *inputs: Any) -> str:
+        """Hash the diagram renderer inputs into a stable cache key."""
+        payload = json.dumps([mode, str(output_dir), *inputs], sort_keys=True, default=str)
+        return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+    def _load_image(self, path: Any) -> Optional[Tuple[bytes, Tuple[int, int]]]:
+        """Return an image's raw bytes and pixel size, or None if it is missing.
+
+        Entries are cached per (path, mtime, size) so both story passes share
+        one read and one PIL open per diagram page while regenerated files
+        are re-read.
+        """
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        key = (str(path), st.st_mtime_ns, st.st_size)
+        entry = self._images.get(key)
+        if entry is None:
+            from PIL import Image as PILImage
+
+            raw = Path(path).read_bytes()
+            with PILImage.open(io.BytesIO(raw)) as pil_img:
+                entry = self._images[key] = (raw, pil_img.size)
+        return entry
+
     def _create_logical_network_diagram(
         self,
         data: Dict[str, Any],
@@ -3826,43 +3575,35 @@ class VastReportBuilder:
             content.append(PageMarker(section_key, page_tracker))
 
         # Section Overview
-        styles = getSampleStyleSheet()
-        overview_style = ParagraphStyle(
-            "Section_Overview",
-            parent=styles["Normal"],
-            fontSize=self.config.font_size - 1,
-            textColor=self.brand_compliance.colors.BACKGROUND_DARK,
-            spaceAfter=12,
-            spaceBefore=8,
-            leftIndent=12,
-            rightIndent=12,
-        )
+        styles = self._styles
+        overview_style = self._overview_style
 
-        content.append(
-            Paragraph(
-                "The Logical Network Diagram provides a visual "
-                "representation of the cluster's network topology, "
-                "illustrating the connectivity between compute nodes "
-                "(CBoxes), data nodes (DBoxes), network switches, "
-                "and the customer network. This diagram shows the "
-                "redundant network paths, switch interconnections, "
-                "and how data flows through the storage infrastructure. "
-                "Understanding the logical network topology "
-                "is essential for network planning, troubleshooting "
-                "connectivity issues, validating redundancy "
-                "configurations, and ensuring optimal network performance "
-                "across the storage cluster.",
-                overview_style,
+        content.extend(
+            (
+                Paragraph(
+                    "The Logical Network Diagram provides a visual "
+                    "representation of the cluster's network topology, "
+                    "illustrating the connectivity between compute nodes "
+                    "(CBoxes), data nodes (DBoxes), network switches, "
+                    "and the customer network. This diagram shows the "
+                    "redundant network paths, switch interconnections, "
+                    "and how data flows through the storage infrastructure. "
+                    "Understanding the logical network topology "
+                    "is essential for network planning, troubleshooting "
+                    "connectivity issues, validating redundancy "
+                    "configurations, and ensuring optimal network performance "
+                    "across the storage cluster.",
+                    overview_style,
+                ),
+                Spacer(1, 16),
             )
         )
-        content.append(Spacer(1, 16))
 
         # Determine diagram mode from config
         diagram_mode = self.config.network_diagram.get("mode", "detailed")
 
         # Prepare shared data for either renderer
-        port_mapping_section = data.get("sections", {}).get("port_mapping", {})
-        port_mapping_data = port_mapping_section.get("data", {}) if isinstance(port_mapping_section, dict) else {}
+        port_mapping_data = _section_data(data, "port_mapping")
         hardware_inventory = data.get("hardware_inventory", {})
 
         cboxes_data = hardware_inventory.get("cboxes") or {}
@@ -3900,8 +3641,18 @@ class VastReportBuilder:
 
         generated_paths: list = []
 
+        # The story is built twice (page capture + final pass); reuse the
+        # rasterised diagrams from the first pass when the inputs are unchanged.
+        cache_key = self._diagram_cache_key(
+            diagram_mode, diagrams_dir, port_mapping_data, hardware_data, data.get("manual_switch_placements")
+        )
+        cached = self._diagram_cache.get(cache_key)
+        if cached and all(Path(gp).exists() for gp in cached[1]):
+            diagram_mode, generated_paths = cached[0], list(cached[1])
+            self.logger.info("Reusing %d cached network diagram page(s)", len(generated_paths))
+
         # ---------- Detailed mode (rack-centric SVG) ----------
-        if diagram_mode == "detailed":
+        if diagram_mode == "detailed" and not generated_paths:
             try:
                 from network_diagram_v2 import create_rack_centric_diagram_generator
 
@@ -3923,7 +3674,7 @@ class VastReportBuilder:
                 diagram_mode = "compact"
 
         # ---------- Compact mode (legacy ReportLab) ----------
-        if diagram_mode == "compact" or not generated_paths:
+        if not generated_paths:
             try:
                 from network_diagram import NetworkDiagramGenerator
 
@@ -3947,21 +3698,24 @@ class VastReportBuilder:
             except Exception as e:
                 self.logger.error("Error generating compact network diagram: %s", e, exc_info=True)
 
+        if generated_paths:
+            self._diagram_cache[cache_key] = (diagram_mode, list(generated_paths))
+
         # Generate network diagram dynamically
         try:
             # NET-3: the redundant text color key was removed — the rendered
             # diagram carries its own subnet-pill legend at the bottom, which
             # is authoritative (per-/24 subnet) and avoids a stale duplicate.
             if generated_paths:
-                from PIL import Image as PILImage
-
                 for gp in generated_paths:
-                    if not Path(gp).exists():
+                    image = self._load_image(gp)
+                    if image is None:
                         continue
+                    image_bytes, image_size = image
                     self.logger.info(f"Network diagram generated: {gp}")
 
-                    available_width = getattr(self, "_frame_width", 7.5 * inch)
-                    available_height = getattr(self, "_frame_height", 10.19 * inch)
+                    available_width = self._frame_width
+                    available_height = self._frame_height
 
                     orientation = self.config.network_diagram.get("orientation", "portrait")
                     use_landscape = orientation == "landscape"
@@ -3971,9 +3725,8 @@ class VastReportBuilder:
 
                     max_diagram_height = available_height - 1.5 * inch
 
-                    with PILImage.open(str(gp)) as pil_img:
-                        img_width, img_height = pil_img.size
-                        aspect_ratio = img_width / img_height
+                    img_width, img_height = image_size
+                    aspect_ratio = img_width / img_height
 
                     target_width = available_width * 0.95
                     target_height = target_width / aspect_ratio
@@ -3987,22 +3740,13 @@ class VastReportBuilder:
                         f"available={available_width:.1f}x{max_diagram_height:.1f}"
                     )
 
-                    img = Image(str(gp), width=target_width, height=target_height)
-
-                    from reportlab.platypus import Table as RLTable
+                    img = Image(io.BytesIO(image_bytes), width=target_width, height=target_height)
 
-                    image_table = RLTable(
+                    image_table = Table(
                         [[img]],
                         colWidths=[available_width],
                     )
-                    image_table.setStyle(
-                        TableStyle(
-                            [
-                                ("ALIGN", (0, 0), (-1, -1), "CENTER"),
-                                ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
-                            ]
-                        )
-                    )
+                    image_table.setStyle(_CENTERED_CELL_STYLE)
 
                     if use_landscape and diagram_mode == "detailed":
                         content.append(NextPageTemplate("landscape"))
@@ -4137,14 +3881,16 @@ class VastReportBuilder:
             spaceBefore=4,
             textColor=self.brand_compliance.colors.BACKGROUND_DARK,
         )
-        content.append(
-            Paragraph(
-                f"<b>Topology Discovery:</b> Mapping nodes <b>{len(unique_nodes)}</b> "
-                f"Switches <b>{len(unique_switches)}</b>",
-                summary_style,
+        content.extend(
+            (
+                Paragraph(
+                    f"<b>Topology Discovery:</b> Mapping nodes <b>{len(unique_nodes)}</b> "
+                    f"Switches <b>{len(unique_switches)}</b>",
+                    summary_style,
+                ),
+                Spacer(1, 8),
             )
         )
-        content.append(Spacer(1, 8))
 
         # SR-5: ParagraphStyle for the MAC cell so long IB GIDs wrap inside
         # the column instead of overflowing into Interface / Net neighbors.
@@ -4166,19 +3912,18 @@ class VastReportBuilder:
         # Proportional weights: Node(wide) | Switch IP | Port(narrow) | Data IP | Interface | MAC | Net(narrow)
         full_headers = ["Node", "Switch Mgmt IP", "Port", "Data IP", "Interface", "MAC", "Net"]
         full_col_weights = [5, 3, 1.2, 2.5, 2, 3.5, 0.8]
-        full_data = []
-        for e in sorted(port_map, key=lambda x: (x.get("node_hostname", ""), x.get("network", ""))):
-            full_data.append(
-                [
-                    e.get("node_hostname", ""),
-                    _switch_mgmt_ip(e),
-                    e.get("port", ""),
-                    e.get("node_ip", ""),
-                    e.get("interface", ""),
-                    _format_mac_cell(e.get("mac", ""), mac_cell_style),
-                    e.get("network", ""),
-                ]
-            )
+        full_data = [
+            [
+                e.get("node_hostname", ""),
+                _switch_mgmt_ip(e),
+                e.get("port", ""),
+                e.get("node_ip", ""),
+                e.get("interface", ""),
+                _format_mac_cell(e.get("mac", ""), mac_cell_style),
+                e.get("network", ""),
+            ]
+            for e in sorted(port_map, key=lambda x: (x.get("node_hostname", ""), x.get("network", "")))
+        ]
 
         full_topo_elements = self.brand_compliance.create_vast_table(
             full_data,
@@ -4207,18 +3952,17 @@ class VastReportBuilder:
             net_label = ", ".join(networks) if networks else "?"
 
             sw_headers = ["Node", "Port", "Data IP", "Interface", "MAC", "Net"]
-            sw_data = []
-            for e in sorted(entries, key=lambda x: (x.get("node_hostname", ""), x.get("port", ""))):
-                sw_data.append(
-                    [
-                        e.get("node_hostname", ""),
-                        e.get("port", ""),
-                        e.get("node_ip", ""),
-                        e.get("interface", ""),
-                        _format_mac_cell(e.get("mac", ""), mac_cell_style),
-                        e.get("network", ""),
-                    ]
-                )
+            sw_data = [
+                [
+                    e.get("node_hostname", ""),
+                    e.get("port", ""),
+                    e.get("node_ip", ""),
+                    e.get("interface", ""),
+                    _format_mac_cell(e.get("mac", ""), mac_cell_style),
+                    e.get("network", ""),
+                ]
+                for e in sorted(entries, key=lambda x: (x.get("node_hostname", ""), x.get("port", "")))
+            ]
 
             subnet_display = ", ".join(subnets) if subnets else ""
             # Switch identity: name (primary) + mgmt IP + GUID, resolved from the
@@ -4267,7 +4011,7 @@ class VastReportBuilder:
             List of ReportLab elements for port mapping section
         """
         content = []
-        styles = getSampleStyleSheet()
+        styles = self._styles
 
         # Add page break to ensure Port Mapping starts at top of new page
         content.append(PageBreak())
@@ -4281,16 +4025,7 @@ class VastReportBuilder:
             content.append(PageMarker(section_key, page_tracker))
 
         # Section Overview
-        overview_style = ParagraphStyle(
-            "Section_Overview",
-            parent=styles["Normal"],
-            fontSize=self.config.font_size - 1,
-            textColor=self.brand_compliance.colors.BACKGROUND_DARK,
-            spaceAfter=12,
-            spaceBefore=8,
-            leftIndent=12,
-            rightIndent=12,
-        )
+        overview_style = self._overview_style
 
         content.append(
             Paragraph(
@@ -4382,32 +4117,32 @@ class VastReportBuilder:
                 rightIndent=20,
             )
 
-            content.append(
-                Paragraph(
-                    f"<b>Summary:</b> {cross_summary}",
-                    issue_style,
+            content.extend(
+                (
+                    Paragraph(
+                        f"<b>Summary:</b> {cross_summary}",
+                        issue_style,
+                    ),
+                    Spacer(1, 8),
                 )
             )
-            content.append(Spacer(1, 8))
 
             # List specific cross-connection issues
-            issue_list_data = []
             issue_headers = [
                 "Switch Port",
                 "Node",
                 "Actual Network",
                 "Expected Network",
             ]
-
-            for issue in cross_connections:
-                issue_list_data.append(
-                    [
-                        issue.get("port", "Unknown"),
-                        issue.get("node", issue.get("node_designation", "Unknown")),
-                        f"Network {issue.get('actual_network', '?')}",
-                        f"Network {issue.get('expected_network', '?')}",
-                    ]
-                )
+            issue_list_data = [
+                [
+                    issue.get("port", "Unknown"),
+                    issue.get("node", issue.get("node_designation", "Unknown")),
+                    f"Network {issue.get('actual_network', '?')}",
+                    f"Network {issue.get('expected_network', '?')}",
+                ]
+                for issue in cross_connections
+            ]
 
             issue_table_elements = self.brand_compliance.create_vast_table(
                 issue_list_data, "Cross-Connection Details", issue_headers
@@ -4433,8 +4168,6 @@ class VastReportBuilder:
     @staticmethod
     def _derive_port_mtu(ports: List[Dict[str, Any]]) -> str:
         """Return the most common non-zero MTU across ports, or 'Unknown'."""
-        from collections import Counter
-
         counts: Counter = Counter()
         for p in ports or []:
             mtu = str(p.get("mtu", "")).strip()
@@ -4465,25 +4198,18 @@ class VastReportBuilder:
             content.append(PageMarker(section_key, page_tracker))
 
         # Section Overview
-        styles = getSampleStyleSheet()
-        overview_style = ParagraphStyle(
-            "Section_Overview",
-            parent=styles["Normal"],
-            fontSize=self.config.font_size - 1,
-            textColor=self.brand_compliance.colors.BACKGROUND_DARK,
-            spaceAfter=12,
-            spaceBefore=8,
-            leftIndent=12,
-            rightIndent=12,
-        )
+        styles = self._styles
+        overview_style = self._overview_style
 
-        content.append(
-            Paragraph(
-                "The Switch Configuration section provides detailed information about the network switches that form the fabric interconnecting the VAST cluster nodes. This section documents switch hardware specifications, port configurations, operational status, and connectivity details. Understanding the switch topology is critical for network troubleshooting, capacity planning, and validating proper network segmentation. The port-level details enable network administrators to trace physical connectivity, identify unused ports, and plan for cluster expansion.",
-                overview_style,
+        content.extend(
+            (
+                Paragraph(
+                    "The Switch Configuration section provides detailed information about the network switches that form the fabric interconnecting the VAST cluster nodes. This section documents switch hardware specifications, port configurations, operational status, and connectivity details. Understanding the switch topology is critical for network troubleshooting, capacity planning, and validating proper network segmentation. The port-level details enable network administrators to trace physical connectivity, identify unused ports, and plan for cluster expansion.",
+                    overview_style,
+                ),
+                Spacer(1, 8),
             )
         )
-        content.append(Spacer(1, 8))
 
         # Get switch data
         hardware = data.get("hardware_inventory", {})
@@ -4502,22 +4228,14 @@ class VastReportBuilder:
             # Get switch name first to use in consolidated heading. Prefer the
             # disambiguated display_name so two same-named switches read as
             # "Spine-B (a)"/"(b)".
-            switch_name = switch.get("display_name") or switch.get("name", "Unknown")
-
-            hostname = switch.get("hostname", "Unknown")
-            model = switch.get("model", "Unknown")
-            serial = switch.get("serial", "Unknown")
-            firmware_version = switch.get("firmware_version", "Unknown")
-            mgmt_ip = switch.get("mgmt_ip", "Unknown")
-            switch_type = switch.get("switch_type", "Unknown")
-            state = switch.get("state", "Unknown")
-            configured = switch.get("configured", False)
-            role = switch.get("role", "Unknown")
-            total_ports = switch.get("total_ports", 0)
-            active_ports = switch.get("active_ports", 0)
-            mtu = switch.get("mtu", "Unknown")
-            port_speeds = switch.get("port_speeds", {})
-            ports = switch.get("ports", [])
+            get = switch.get
+            switch_name = get("display_name") or get("name", "Unknown")
+
+            switch_type = get("switch_type", "Unknown")
+            role = get("role", "Unknown")
+            active_ports = get("active_ports", 0)
+            mtu = get("mtu", "Unknown")
+            ports = get("ports", [])
 
             # Defensive recompute for replayed/older JSON where these were not
             # populated at collection time (e.g. IB ports counted only "up").
@@ -4534,21 +4252,14 @@ class VastReportBuilder:
             else:
                 switch_type_display = switch_type
 
-            # Format configuration status
-            config_status = "Configured" if configured else "Not Configured"
-
             # Switch header info
-            switch_info_data = [
-                ["Hostname", hostname],
-                ["Model", model],
-                ["Serial Number", serial],
-                ["Firmware Version", firmware_version],
-                ["Management IP", mgmt_ip],
+            switch_info_data = [[label, get(key, "Unknown")] for key, label in _SWITCH_INFO_FIELDS]
+            switch_info_data += [
                 ["Switch Type", switch_type_display],
-                ["State", state],
-                ["Configuration Status", config_status],
+                ["State", get("state", "Unknown")],
+                ["Configuration Status", "Configured" if get("configured", False) else _NOT_CONFIGURED],
                 ["Role", role if role else "Not Assigned"],
-                ["Total Ports", str(total_ports)],
+                ["Total Ports", str(get("total_ports", 0))],
                 ["Active Ports", str(active_ports)],
                 ["Port MTU", mtu],
             ]
@@ -4570,33 +4281,20 @@ class VastReportBuilder:
             if ports:
                 # Aggregate ports by speed, collecting port names
                 port_summary: dict[str, Any] = {}
-
                 for port in ports:
-                    speed = port.get("speed")
-                    if not speed or speed == "":
-                        speed = "Unconfigured"
-
-                    port_name = port.get("name", "Unknown")
-
-                    if speed not in port_summary:
-                        port_summary[speed] = []
-                    port_summary[speed].append(port_name)
+                    port_summary.setdefault(port.get("speed") or "Unconfigured", []).append(port.get("name", "Unknown"))
 
                 # Create summary table with port count and port numbers
                 summary_table_data = []
                 headers = ["Port Count", "Speed", "Port Numbers"]
 
                 # Sort by speed (200G, 100G, Unconfigured, then others)
-                speed_order = {"200G": 0, "100G": 1, "Unconfigured": 2}
-                sorted_summary = sorted(port_summary.items(), key=lambda x: speed_order.get(x[0], 3))
+                sorted_summary = sorted(port_summary.items(), key=lambda x: _PORT_SPEED_ORDER.get(x[0], 3))
 
                 for speed, port_list in sorted_summary:
                     # Sort port names naturally (swp1, swp2, ..., swp10, swp11, ...)
                     try:
-                        sorted_ports = sorted(
-                            port_list,
-                            key=lambda x: (int("".join(filter(str.isdigit, x))) if any(c.isdigit() for c in x) else 0),
-                        )
+                        sorted_ports = sorted(port_list, key=_port_number_key)
                     except Exception:
                         sorted_ports = sorted(port_list)
 
@@ -4604,14 +4302,7 @@ class VastReportBuilder:
                     ports_str = ", ".join(sorted_ports)
 
                     # Use Paragraph for port numbers to enable text wrapping
-                    port_style = ParagraphStyle(
-                        "PortNumbers",
-                        parent=styles["Normal"],
-                        fontSize=9,
-                        alignment=0,  # Left alignment
-                        wordWrap="CJK",  # Enable word wrapping
-                    )
-                    port_para = Paragraph(ports_str, port_style)
+                    port_para = Paragraph(ports_str, self._port_numbers_style)
 
                     # Count ports for this speed
                     port_count = len(port_list)
@@ -4620,7 +4311,7 @@ class VastReportBuilder:
 
                 # Create custom port summary table with specific column widths
                 # Port Count: 15%, Speed: 15%, Port Numbers: 70%
-                page_width = getattr(self, "_frame_width", A4[0] - 1.0 * inch)
+                page_width = self._frame_width
                 col_widths = [
                     page_width * 0.15,  # Port Count (matches Speed column)
                     page_width * 0.15,  # Speed (reduced by 50%)
@@ -4634,85 +4325,7 @@ class VastReportBuilder:
                 port_table = Table(full_table_data, colWidths=col_widths, repeatRows=1)
 
                 # Apply VAST brand table styling
-                table_style = TableStyle(
-                    [
-                        # Header row styling
-                        (
-                            "BACKGROUND",
-                            (0, 0),
-                            (-1, 0),
-                            self.brand_compliance.colors.BACKGROUND_DARK,
-                        ),
-                        (
-                            "TEXTCOLOR",
-                            (0, 0),
-                            (-1, 0),
-                            self.brand_compliance.colors.PURE_WHITE,
-                        ),
-                        (
-                            "FONTNAME",
-                            (0, 0),
-                            (-1, 0),
-                            self.brand_compliance.typography.PRIMARY_FONT,
-                        ),
-                        (
-                            "FONTSIZE",
-                            (0, 0),
-                            (-1, 0),
-                            self.brand_compliance.typography.BODY_SIZE,
-                        ),
-                        ("ALIGN", (0, 0), (-1, -1), "CENTER"),
-                        ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
-                        # Data rows styling
-                        (
-                            "BACKGROUND",
-                            (0, 1),
-                            (-1, -1),
-                            self.brand_compliance.colors.VAST_BLUE_LIGHTEST,
-                        ),
-                        (
-                            "TEXTCOLOR",
-                            (0, 1),
-                            (-1, -1),
-                            self.brand_compliance.colors.DARK_GRAY,
-                        ),
-                        (
-                            "FONTNAME",
-                            (0, 1),
-                            (-1, -1),
-                            self.brand_compliance.typography.BODY_FONT,
-                        ),
-                        (
-                            "FONTSIZE",
-                            (0, 1),
-                            (-1, -1),
-                            self.brand_compliance.typography.BODY_SIZE,
-                        ),
-                        # Borders and spacing
-                        (
-                            "GRID",
-                            (0, 0),
-                            (-1, -1),
-                            1,
-                            self.brand_compliance.colors.BACKGROUND_DARK,
-                        ),
-                        (
-                            "ROWBACKGROUNDS",
-                            (0, 1),
-                            (-1, -1),
-                            [
-                                self.brand_compliance.colors.PURE_WHITE,
-                                self.brand_compliance.colors.ALTERNATING_ROW,
-                            ],
-                        ),
-                        ("PADDING", (0, 0), (-1, -1), 8),
-                        ("LEFTPADDING", (0, 0), (-1, -1), 12),
-                        ("RIGHTPADDING", (0, 0), (-1, -1), 12),
-                        ("WORDWRAP", (0, 0), (-1, -1), "CJK"),
-                    ]
-                )
-
-                port_table.setStyle(table_style)
+                port_table.setStyle(self._port_summary_style)
 
                 # Create title and wrap with table in KeepTogether
                 table_title = f"Port Summary: {switch_name}"
@@ -4735,139 +4348,47 @@ class VastReportBuilder:
         section_key: Optional[str] = None,
     ) -> List[Any]:
         """Create logical configuration section."""
-        styles = getSampleStyleSheet()
-
-        heading_style = ParagraphStyle(
-            "Section_Heading",
-            parent=styles["Heading1"],
-            fontSize=self.config.heading_font_size,
-            spaceAfter=12,
-        )
-
-        content = []
+        heading_style = self._heading_style
 
-        content.append(Paragraph("Logical Configuration", heading_style))
-        content.append(Spacer(1, 12))
+        content = [Paragraph("Logical Configuration", heading_style), Spacer(1, 12)]
 
         # Place page marker immediately after heading to capture section start page
         if page_tracker is not None and section_key:
             content.append(PageMarker(section_key, page_tracker))
 
         # Section Overview
-        overview_style = ParagraphStyle(
-            "Section_Overview",
-            parent=styles["Normal"],
-            fontSize=self.config.font_size - 1,
-            textColor=self.brand_compliance.colors.BACKGROUND_DARK,
-            spaceAfter=12,
-            spaceBefore=8,
-            leftIndent=12,
-            rightIndent=12,
-        )
+        overview_style = self._overview_style
 
-        content.append(
-            Paragraph(
-                "The Logical Configuration section documents the logical organization and data protection policies configured within the VAST Data cluster. This section provides visibility into tenant configurations, data views, access policies, VIP pools, and data protection settings including snapshot programs and protection policies. Understanding the logical configuration is crucial for data governance, access control validation, backup and recovery planning, and ensuring compliance with organizational data protection requirements. This information enables administrators to verify proper data isolation, validate backup schedules, and ensure that data protection policies align with business continuity objectives.",
-                overview_style,
+        content.extend(
+            (
+                Paragraph(
+                    "The Logical Configuration section documents the logical organization and data protection policies configured within the VAST Data cluster. This section provides visibility into tenant configurations, data views, access policies, VIP pools, and data protection settings including snapshot programs and protection policies. Understanding the logical configuration is crucial for data governance, access control validation, backup and recovery planning, and ensuring compliance with organizational data protection requirements. This information enables administrators to verify proper data isolation, validate backup schedules, and ensure that data protection policies align with business continuity objectives.",
+                    overview_style,
+                ),
+                Spacer(1, 8),
             )
         )
-        content.append(Spacer(1, 8))
-
-        sections = data.get("sections", {})
-        logical_config = sections.get("logical_configuration", {}).get("data", {})
-
-        # Prepare table data
-        table_data = []
 
-        # Tenants
-        tenants = logical_config.get("tenants")
-        if tenants:
-            tenant_list = tenants.get("tenants", []) if isinstance(tenants, dict) else tenants
-            tenant_count = len(tenant_list) if isinstance(tenant_list, list) else 0
-            table_data.append(["Tenants", f"{tenant_count} tenants configured"])
-
-        # Views
-        views = logical_config.get("views")
-        if views:
-            view_list = views.get("views", []) if isinstance(views, dict) else views
-            view_count = len(view_list) if isinstance(view_list, list) else 0
-            table_data.append(["Views", f"{view_count} views configured"])
-
-        # View Policies
-        policies = logical_config.get("view_policies")
-        if policies:
-            policy_list = policies.get("policies", []) if isinstance(policies, dict) else policies
-            policy_count = len(policy_list) if isinstance(policy_list, list) else 0
-            table_data.append(["View Policies", f"{policy_count} policies configured"])
+        logical_config = _section_data(data, "logical_configuration")
 
-        # Protection Policies
-        protection_policies = logical_config.get("protection_policies")
-        if protection_policies:
-            protection_policy_list = (
-                protection_policies.get("policies", [])
-                if isinstance(protection_policies, dict)
-                else protection_policies
-            )
-            protection_policy_count = len(protection_policy_list) if isinstance(protection_policy_list, list) else 0
-            table_data.append(
-                [
-                    "Protection Policies",
-                    f"{protection_policy_count} policies configured",
-                ]
-            )
+        # Tenants, views and policies
+        table_data = _count_rows(logical_config, _LOGICAL_COUNT_FIELDS)
 
         # Network Services (VIP Pools, DNS and NTP from network configuration)
-        network_config = sections.get("network_configuration", {}).get("data", {})
+        network_config = _section_data(data, "network_configuration")
         if network_config:
-            # VIP Pools
-            vippools = network_config.get("vippools")
-            if vippools:
-                vippool_list = vippools.get("pools", []) if isinstance(vippools, dict) else vippools
-                vippool_count = len(vippool_list) if isinstance(vippool_list, list) else 0
-                table_data.append(["VIP Pools", f"{vippool_count} pools configured"])
-            # DNS Configuration
-            dns = network_config.get("dns")
-            if dns:
-                dns_list = dns.get("dns_servers", []) if isinstance(dns, dict) else dns
-                if dns_list:
-                    dns_servers = ", ".join(dns_list) if isinstance(dns_list, list) else str(dns_list)
-                    table_data.append(["DNS Servers", dns_servers])
-
-            # NTP Configuration
-            ntp = network_config.get("ntp")
-            if ntp:
-                ntp_list = ntp.get("ntp_servers", []) if isinstance(ntp, dict) else ntp
-                if ntp_list:
-                    ntp_servers = ", ".join(ntp_list) if isinstance(ntp_list, list) else str(ntp_list)
-                    table_data.append(["NTP Servers", ntp_servers])
-
-        # Data Protection information
-        protection_config = sections.get("data_protection_configuration", {}).get("data", {})
+            table_data += _count_rows(network_config, _NETWORK_SERVICE_COUNT_FIELDS)
+            for key, inner_key, label in (("dns", "dns_servers", "DNS Servers"), ("ntp", "ntp_servers", "NTP Servers")):
+                servers = network_config.get(key)
+                if servers:
+                    server_list = servers.get(inner_key, []) if isinstance(servers, dict) else servers
+                    if server_list:
+                        table_data.append(
+                            [label, ", ".join(server_list) if isinstance(server_list, list) else str(server_list)]
+                        )
 
-        # Snapshot Programs
-        snapshots = protection_config.get("snapshot_programs")
-        if snapshots:
-            snapshot_list = snapshots.get("programs", []) if isinstance(snapshots, dict) else snapshots
-            snapshot_count = len(snapshot_list) if isinstance(snapshot_list, list) else 0
-            table_data.append(["Snapshot Programs", f"{snapshot_count} programs configured"])
-
-        # Data Protection Protection Policies (from data protection configuration)
-        data_protection_policies = protection_config.get("protection_policies")
-        if data_protection_policies:
-            data_protection_policy_list = (
-                data_protection_policies.get("policies", [])
-                if isinstance(data_protection_policies, dict)
-                else data_protection_policies
-            )
-            data_protection_policy_count = (
-                len(data_protection_policy_list) if isinstance(data_protection_policy_list, list) else 0
-            )
-            table_data.append(
-                [
-                    "Data Protection Policies",
-                    f"{data_protection_policy_count} policies configured",
-                ]
-            )
+        # Snapshot programs and protection policies (from data protection configuration)
+        table_data += _count_rows(_section_data(data, "data_protection_configuration"), _DATA_PROTECTION_COUNT_FIELDS)
 
         # Create table if we have data
         if table_data:
@@ -4878,11 +4399,7 @@ class VastReportBuilder:
             content.append(
                 Paragraph(
                     "No logical configuration data available.",
-                    ParagraphStyle(
-                        "Normal",
-                        parent=styles["Normal"],
-                        fontSize=self.config.font_size,
-                    ),
+                    self._body_style,
                 )
             )
 
@@ -4895,46 +4412,40 @@ class VastReportBuilder:
         section_key: Optional[str] = None,
     ) -> List[Any]:
         """Create security configuration section."""
-        styles = getSampleStyleSheet()
-
-        heading_style = ParagraphStyle(
-            "Section_Heading",
-            parent=styles["Heading1"],
-            fontSize=self.config.heading_font_size,
-            spaceAfter=12,
-        )
+        heading_style = self._heading_style
 
-        content = []
-
-        content.append(Paragraph("Security & Authentication", heading_style))
-        content.append(Spacer(1, 12))
+        content = [Paragraph("Security & Authentication", heading_style), Spacer(1, 12)]
 
         # Place page marker immediately after heading to capture section start page
         if page_tracker is not None and section_key:
             content.append(PageMarker(section_key, page_tracker))
 
         # Section Overview
-        overview_style = ParagraphStyle(
-            "Section_Overview",
-            parent=styles["Normal"],
-            fontSize=self.config.font_size - 1,
-            textColor=self.brand_compliance.colors.BACKGROUND_DARK,
-            spaceAfter=12,
-            spaceBefore=8,
-            leftIndent=12,
-            rightIndent=12,
-        )
+        overview_style = self._overview_style
 
-        content.append(
-            Paragraph(
-                "The Security & Authentication section provides comprehensive documentation of all security-related configurations and authentication mechanisms implemented within the VAST Data cluster. This section covers authentication services including Active Directory, LDAP, and NIS integration, as well as security features such as data encryption settings, external key management (EKM) configuration, and security policy enforcement. Understanding the security configuration is essential for compliance auditing, security posture assessment, access control validation, and ensuring that the storage infrastructure meets organizational security requirements and industry best practices. This information supports security administrators in maintaining a robust security framework for the storage environment.",
-                overview_style,
+        content.extend(
+            (
+                Paragraph(
+                    "The Security & Authentication section provides comprehensive documentation of all security-related configurations and authentication mechanisms implemented within the VAST Data cluster. This section covers authentication services including Active Directory, LDAP, and NIS integration, as well as security features such as data encryption settings, external key management (EKM) configuration, and security policy enforcement. Understanding the security configuration is essential for compliance auditing, security posture assessment, access control validation, and ensuring that the storage infrastructure meets organizational security requirements and industry best practices. This information supports security administrators in maintaining a robust security framework for the storage environment.",
+                    overview_style,
+                ),
+                Spacer(1, 8),
             )
         )
-        content.append(Spacer(1, 8))
 
-        sections = data.get("sections", {})
-        security_config = sections.get("security_configuration", {}).get("data", {})
+        security_config = _section_data(data, "security_configuration")
+        cluster_summary = data.get("cluster_summary", {})
+
+        # Skip the row builders when neither the authentication services nor
+        # the cluster summary carry anything to show.
+        if not (
+            cluster_summary
+            or security_config.get("active_directory")
+            or security_config.get("ldap")
+            or security_config.get("nis")
+        ):
+            content.append(Paragraph("No security configuration data available.", self._body_style))
+            return content
 
         # Prepare table data
         table_data = []
@@ -4942,150 +4453,30 @@ class VastReportBuilder:
         # Active Directory
         ad_config = security_config.get("active_directory")
         if ad_config:
-            table_data.append(
-                [
-                    "Authentication",
-                    "Active Directory",
-                    "Enabled",
-                    str(ad_config.get("enabled", False)),
-                ]
-            )
-            if ad_config.get("domain"):
-                table_data.append(
-                    [
-                        "Authentication",
-                        "Active Directory",
-                        "Domain",
-                        ad_config.get("domain"),
-                    ]
-                )
-            servers = ad_config.get("servers", [])
+            ad_get = ad_config.get
+            table_data.append(["Authentication", "Active Directory", "Enabled", str(ad_get("enabled", False))])
+            domain = ad_get("domain")
+            if domain:
+                table_data.append(["Authentication", "Active Directory", "Domain", domain])
+            servers = ad_get("servers", [])
             if servers:
-                table_data.append(
-                    [
-                        "Authentication",
-                        "Active Directory",
-                        "Servers",
-                        ", ".join(servers),
-                    ]
-                )
+                table_data.append(["Authentication", "Active Directory", "Servers", ", ".join(servers)])
 
-        # LDAP
-        ldap_config = security_config.get("ldap")
-        if ldap_config:
-            table_data.append(
-                [
-                    "Authentication",
-                    "LDAP",
-                    "Enabled",
-                    str(ldap_config.get("enabled", False)),
-                ]
-            )
-
-        # NIS
-        nis_config = security_config.get("nis")
-        if nis_config:
-            table_data.append(
-                [
-                    "Authentication",
-                    "NIS",
-                    "Enabled",
-                    str(nis_config.get("enabled", False)),
-                ]
-            )
+        # LDAP and NIS
+        for key, service in (("ldap", "LDAP"), ("nis", "NIS")):
+            service_config = security_config.get(key)
+            if service_config:
+                table_data.append(["Authentication", service, "Enabled", str(service_config.get("enabled", False))])
 
-        # Encryption Configuration
-        cluster_summary = data.get("cluster_summary", {})
+        # Encryption Configuration; fields the cluster did not report (None)
+        # are left out rather than listed as "Not Configured".
         if cluster_summary:
-            # Basic encryption settings
-            enable_encryption = cluster_summary.get("enable_encryption")
-            enable_encryption_display = enable_encryption if enable_encryption is not None else "Not Configured"
-            table_data.append(["Security", "Encryption", "Enabled", str(enable_encryption_display)])
-
-            encryption_type = cluster_summary.get("encryption_type")
-            # Handle potential list values from API
-            if isinstance(encryption_type, list):
-                encryption_type_display = (
-                    ", ".join(str(t) for t in encryption_type) if encryption_type else "Not Configured"
-                )
-            else:
-                encryption_type_display = (
-                    str(encryption_type) if encryption_type and encryption_type != "Unknown" else "Not Configured"
-                )
-            table_data.append(["Security", "Encryption", "Type", encryption_type_display])
-
-            s3_aes_ciphers = cluster_summary.get("s3_enable_only_aes_ciphers")
-            s3_aes_ciphers_display = s3_aes_ciphers if s3_aes_ciphers is not None else "Not Configured"
-            table_data.append(
-                [
-                    "Security",
-                    "Encryption",
-                    "S3 AES Ciphers Only",
-                    str(s3_aes_ciphers_display),
-                ]
-            )
-
-            # External Key Management (EKM) settings
-            ekm_servers = cluster_summary.get("ekm_servers")
-            # Handle list values from API - convert to comma-separated string
-            if isinstance(ekm_servers, list):
-                ekm_servers_display = ", ".join(str(s) for s in ekm_servers) if ekm_servers else "Not Configured"
-            else:
-                ekm_servers_display = (
-                    str(ekm_servers)
-                    if ekm_servers and ekm_servers != "Unknown" and ekm_servers != ""
-                    else "Not Configured"
-                )
-            table_data.append(["Security", "EKM", "Servers", ekm_servers_display])
-
-            ekm_address = cluster_summary.get("ekm_address")
-            # Handle list values from API - convert to comma-separated string
-            if isinstance(ekm_address, list):
-                ekm_address_display = ", ".join(str(a) for a in ekm_address) if ekm_address else "Not Configured"
-            else:
-                ekm_address_display = (
-                    str(ekm_address)
-                    if ekm_address and ekm_address != "Unknown" and ekm_address != ""
-                    else "Not Configured"
-                )
-            table_data.append(["Security", "EKM", "Address", ekm_address_display])
-
-            ekm_port = cluster_summary.get("ekm_port")
-            ekm_port_display = ekm_port if ekm_port is not None else "Not Configured"
-            table_data.append(["Security", "EKM", "Port", str(ekm_port_display)])
-
-            ekm_auth_domain = cluster_summary.get("ekm_auth_domain")
-            # Handle potential list values from API
-            if isinstance(ekm_auth_domain, list):
-                ekm_auth_domain_display = (
-                    ", ".join(str(d) for d in ekm_auth_domain) if ekm_auth_domain else "Not Configured"
-                )
-            else:
-                ekm_auth_domain_display = (
-                    str(ekm_auth_domain)
-                    if ekm_auth_domain and ekm_auth_domain != "Unknown" and ekm_auth_domain != ""
-                    else "Not Configured"
-                )
-            table_data.append(["Security", "EKM", "Auth Domain", ekm_auth_domain_display])
-
-            # Secondary EKM settings
-            secondary_ekm_address = cluster_summary.get("secondary_ekm_address")
-            # Handle potential list values from API
-            if isinstance(secondary_ekm_address, list):
-                secondary_ekm_address_display = (
-                    ", ".join(str(a) for a in secondary_ekm_address) if secondary_ekm_address else "Not Configured"
-                )
-            else:
-                secondary_ekm_address_display = (
-                    str(secondary_ekm_address)
-                    if secondary_ekm_address and secondary_ekm_address != "null"
-                    else "Not Configured"
-                )
-            table_data.append(["Security", "Secondary EKM", "Address", secondary_ekm_address_display])
-
-            secondary_ekm_port = cluster_summary.get("secondary_ekm_port")
-            secondary_ekm_port_display = secondary_ekm_port if secondary_ekm_port is not None else "Not Configured"
-            table_data.append(["Security", "Secondary EKM", "Port", str(secondary_ekm_port_display)])
+            get = cluster_summary.get
+            table_data += [
+                ["Security", group, label, self._security_display(value, missing)]
+                for key, group, label, missing in _SECURITY_SUMMARY_FIELDS
+                if (value := get(key)) is not None
+            ]
 
         # Create table if we have data
         if table_data:
@@ -5100,11 +4491,7 @@ class VastReportBuilder:
             content.append(
                 Paragraph(
                     "No security configuration data available.",
-                    ParagraphStyle(
-                        "Normal",
-                        parent=styles["Normal"],
-                        fontSize=self.config.font_size,
-                    ),
+                    self._body_style,
                 )
             )
 
@@ -5225,25 +4612,10 @@ class VastReportBuilder:
             List of flowables for the section.
         """
         self._fixup_health_results(health_data, processed_data)
-        styles = getSampleStyleSheet()
-
-        heading_style = ParagraphStyle(
-            "Section_Heading",
-            parent=styles["Heading1"],
-            fontSize=self.config.heading_font_size,
-            spaceAfter=12,
-        )
+        styles = self._styles
 
-        overview_style = ParagraphStyle(
-            "Section_Overview",
-            parent=styles["Normal"],
-            fontSize=self.config.font_size - 1,
-            textColor=self.brand_compliance.colors.BACKGROUND_DARK,
-            spaceAfter=12,
-            spaceBefore=8,
-            leftIndent=12,
-            rightIndent=12,
-        )
+        heading_style = self._heading_style
+        overview_style = self._overview_style
 
         content: List[Any] = []
         content.append(Paragraph("Cluster Health Check Results", heading_style))
@@ -5252,17 +4624,19 @@ class VastReportBuilder:
         if page_tracker is not None and section_key:
             content.append(PageMarker(section_key, page_tracker))
 
-        content.append(
-            Paragraph(
-                "This section presents the results of automated cluster health checks "
-                "performed against the VAST Data cluster. Each check validates a specific "
-                "aspect of cluster health including connectivity, service status, and "
-                "configuration consistency. Results are summarised below with individual "
-                "check details following the summary table.",
-                overview_style,
+        content.extend(
+            (
+                Paragraph(
+                    "This section presents the results of automated cluster health checks "
+                    "performed against the VAST Data cluster. Each check validates a specific "
+                    "aspect of cluster health including connectivity, service status, and "
+                    "configuration consistency. Results are summarised below with individual "
+                    "check details following the summary table.",
+                    overview_style,
+                ),
+                Spacer(1, 8),
             )
         )
-        content.append(Spacer(1, 8))
 
         # Colour helpers for status cells
         status_colors = {
@@ -5286,7 +4660,7 @@ class VastReportBuilder:
                 self._safe_table_value(summary.get("total", 0)),
             ]
 
-            page_width = getattr(self, "_frame_width", A4[0] - 1.0 * inch)
+            page_width = self._frame_width
             col_width = page_width / len(summary_headers)
             summary_table = Table(
                 [summary_headers, summary_row],
@@ -5357,7 +4731,7 @@ class VastReportBuilder:
                     ]
                 )
 
-            page_width = getattr(self, "_frame_width", A4[0] - 1.0 * inch)
+            page_width = self._frame_width
             col_widths = [
                 page_width * 0.22,  # Check Name
                 page_width * 0.12,  # Category
@@ -5407,7 +4781,7 @@ class VastReportBuilder:
             content.append(
                 Paragraph(
                     "No health check data available.",
-                    ParagraphStyle("Normal", parent=styles["Normal"], fontSize=self.config.font_size),
+                    self._body_style,
                 )
             )
 
@@ -5431,25 +4805,10 @@ class VastReportBuilder:
         Returns:
             List of flowables for the section.
         """
-        styles = getSampleStyleSheet()
-
-        heading_style = ParagraphStyle(
-            "Section_Heading",
-            parent=styles["Heading1"],
-            fontSize=self.config.heading_font_size,
-            spaceAfter=12,
-        )
+        styles = self._styles
 
-        overview_style = ParagraphStyle(
-            "Section_Overview",
-            parent=styles["Normal"],
-            fontSize=self.config.font_size - 1,
-            textColor=self.brand_compliance.colors.BACKGROUND_DARK,
-            spaceAfter=12,
-            spaceBefore=8,
-            leftIndent=12,
-            rightIndent=12,
-        )
+        heading_style = self._heading_style
+        overview_style = self._overview_style
 
         content: List[Any] = []
         content.append(Paragraph("Post Deployment Activities", heading_style))
@@ -5458,16 +4817,18 @@ class VastReportBuilder:
         if page_tracker is not None and section_key:
             content.append(PageMarker(section_key, page_tracker))
 
-        content.append(
-            Paragraph(
-                "This section outlines the recommended next steps to complete after "
-                "cluster installation and validation. Each item should be addressed "
-                "before handing the cluster over to the customer for production use. "
-                "Refer to the VAST Installation Template for detailed procedures.",
-                overview_style,
+        content.extend(
+            (
+                Paragraph(
+                    "This section outlines the recommended next steps to complete after "
+                    "cluster installation and validation. Each item should be addressed "
+                    "before handing the cluster over to the customer for production use. "
+                    "Refer to the VAST Installation Template for detailed procedures.",
+                    overview_style,
+                ),
+                Spacer(1, 8),
             )
         )
-        content.append(Spacer(1, 8))
 
         next_steps = activities_data.get("next_steps", [])
 
@@ -5525,7 +4886,7 @@ class VastReportBuilder:
                     ]
                 )
 
-            page_width = getattr(self, "_frame_width", A4[0] - 1.0 * inch)
+            page_width = self._frame_width
             col_widths = [page_width * 0.25, page_width * 0.55, page_width * 0.20]
 
             checklist_table = Table(checklist_data, colWidths=col_widths, repeatRows=1)
@@ -5567,7 +4928,7 @@ class VastReportBuilder:
             content.append(
                 Paragraph(
                     "No post-deployment activity items available.",
-                    ParagraphStyle("Normal", parent=styles["Normal"], fontSize=self.config.font_size),
+                    self._body_style,
                 )
             )
 
@@ -5577,8 +4938,7 @@ class VastReportBuilder:
     def _resolve_post_deploy_status_at_render(next_steps: List[Dict[str, Any]], processed_data: Dict[str, Any]) -> None:
         """Render-time fallback: resolve post-deploy status from health check data in the report JSON."""
         hc_results: Dict[str, str] = {}
-        hc_section = processed_data.get("sections", {}).get("health_check", {})
-        for r in hc_section.get("data", {}).get("results", []):
+        for r in _section_data(processed_data, "health_check").get("results", []):
             hc_results[r.get("check_name", "")] = r.get("status", "")
 
         cluster = processed_data.get("cluster_summary", {})
@@ -5609,185 +4969,99 @@ class VastReportBuilder:
 
     def _create_data_protection_configuration(self, data: Dict[str, Any]) -> List[Any]:
         """Create data protection configuration section."""
-        styles = getSampleStyleSheet()
-
-        heading_style = ParagraphStyle(
-            "Section_Heading",
-            parent=styles["Heading1"],
-            fontSize=self.config.heading_font_size,
-            spaceAfter=12,
-        )
-
-        normal_style = ParagraphStyle(
-            "Section_Normal",
-            parent=styles["Normal"],
-            fontSize=self.config.font_size,
-            spaceAfter=8,
-        )
-
-        content = []
+        heading_style = self._heading_style
+        normal_style = self._normal_style
 
-        content.append(Paragraph("Data Protection", heading_style))
-        content.append(Spacer(1, 12))
+        content = [Paragraph("Data Protection", heading_style), Spacer(1, 12)]
 
-        sections = data.get("sections", {})
-        protection_config = sections.get("data_protection_configuration", {}).get("data", {})
+        protection_config = _section_data(data, "data_protection_configuration")
+        snapshots = protection_config.get("snapshot_programs")
+        policies = protection_config.get("protection_policies")
+        if not (snapshots or policies):
+            return content
 
         # Snapshot Programs
-        snapshots = protection_config.get("snapshot_programs")
         if snapshots:
-            content.append(Paragraph("<b>Snapshot Programs:</b>", normal_style))
-            for snapshot in snapshots.get("programs", []):
-                content.append(
-                    Paragraph(
-                        f"• {snapshot.get('name', 'Unknown')} - {snapshot.get('schedule', 'Unknown')} ({'Enabled' if snapshot.get('enabled') else 'Disabled'})",
-                        normal_style,
-                    )
-                )
-            content.append(Spacer(1, 8))
+            lines = ["<b>Snapshot Programs:</b>"]
+            lines += (
+                f"• {snapshot.get('name', 'Unknown')} - {snapshot.get('schedule', 'Unknown')} ({'Enabled' if snapshot.get('enabled') else 'Disabled'})"
+                for snapshot in snapshots.get("programs", [])
+            )
+            content.extend((Paragraph("<br/>".join(lines), normal_style), Spacer(1, 8)))
 
         # Protection Policies
-        policies = protection_config.get("protection_policies")
         if policies:
-            policy_list = policies.get("policies", []) if isinstance(policies, dict) else policies
-            policy_count = len(policy_list) if isinstance(policy_list, list) else 0
-            content.append(
-                Paragraph(
-                    f"<b>Protection Policies:</b> {policy_count} policies configured",
-                    normal_style,
-                )
-            )
+            policy_count = len(_normalize_list(policies, "policies"))
+            content.append(Paragraph(f"<b>Protection Policies:</b> {policy_count} policies configured", normal_style))
 
         return content
 
     def _create_enhanced_features_section(self, data: Dict[str, Any]) -> List[Any]:
         """Create enhanced features section."""
-        styles = getSampleStyleSheet()
-
-        heading_style = ParagraphStyle(
-            "Section_Heading",
-            parent=styles["Heading1"],
-            fontSize=self.config.heading_font_size,
-            spaceAfter=12,
-        )
-
-        normal_style = ParagraphStyle(
-            "Section_Normal",
-            parent=styles["Normal"],
-            fontSize=self.config.font_size,
-            spaceAfter=8,
-        )
-
-        content = []
+        heading_style = self._heading_style
+        normal_style = self._normal_style
 
-        content.append(Paragraph("Enhanced Features", heading_style))
-        content.append(Spacer(1, 12))
+        content = [Paragraph("Enhanced Features", heading_style), Spacer(1, 12)]
 
         enhanced_features = data.get("metadata", {}).get("enhanced_features", {})
 
         # Rack Height Support
         rack_support = enhanced_features.get("rack_height_supported", False)
-        content.append(Paragraph("<b>Rack Positioning:</b>", normal_style))
-        content.append(Paragraph(f"• Supported: {'Yes' if rack_support else 'No'}", normal_style))
+        lines = ["<b>Rack Positioning:</b>", f"• Supported: {'Yes' if rack_support else 'No'}"]
         if rack_support:
-            content.append(
-                Paragraph(
-                    "• Automated U-number generation for hardware positioning",
-                    normal_style,
-                )
-            )
-            content.append(Paragraph("• Physical rack layout visualization available", normal_style))
+            lines += [
+                "• Automated U-number generation for hardware positioning",
+                "• Physical rack layout visualization available",
+            ]
         else:
-            content.append(Paragraph("• Manual entry required for rack positions", normal_style))
-        content.append(Spacer(1, 8))
+            lines.append("• Manual entry required for rack positions")
+        content.extend((Paragraph("<br/>".join(lines), normal_style), Spacer(1, 8)))
 
         # PSNT Support
         psnt_support = enhanced_features.get("psnt_supported", False)
-        content.append(Paragraph("<b>PSNT Tracking:</b>", normal_style))
-        content.append(Paragraph(f"• Supported: {'Yes' if psnt_support else 'No'}", normal_style))
+        lines = ["<b>PSNT Tracking:</b>", f"• Supported: {'Yes' if psnt_support else 'No'}"]
         if psnt_support:
-            content.append(
-                Paragraph(
-                    "• Cluster Product Serial Number available for support tracking",
-                    normal_style,
-                )
-            )
-            cluster_info = data.get("cluster_summary", {})
-            psnt = cluster_info.get("psnt")
+            lines.append("• Cluster Product Serial Number available for support tracking")
+            psnt = data.get("cluster_summary", {}).get("psnt")
             if psnt:
-                content.append(Paragraph(f"• PSNT: {psnt}", normal_style))
+                lines.append(f"• PSNT: {psnt}")
         else:
-            content.append(Paragraph("• PSNT not available for this cluster version", normal_style))
+            lines.append("• PSNT not available for this cluster version")
+        content.append(Paragraph("<br/>".join(lines), normal_style))
 
         return content
 
     def _create_appendix(self, data: Dict[str, Any]) -> List[Any]:
         """Create appendix section."""
-        styles = getSampleStyleSheet()
-
-        heading_style = ParagraphStyle(
-            "Section_Heading",
-            parent=styles["Heading1"],
-            fontSize=self.config.heading_font_size,
-            spaceAfter=12,
-        )
+        heading_style = self._heading_style
+        normal_style = self._normal_style
 
-        normal_style = ParagraphStyle(
-            "Section_Normal",
-            parent=styles["Normal"],
-            fontSize=self.config.font_size,
-            spaceAfter=8,
-        )
-
-        content = []
-
-        content.append(Paragraph("Appendix", heading_style))
-        content.append(Spacer(1, 12))
+        content = [Paragraph("Appendix", heading_style), Spacer(1, 12)]
 
         # Generation metadata
         metadata = data.get("metadata", {})
-        content.append(Paragraph("<b>Report Generation Information:</b>", normal_style))
-        content.append(
-            Paragraph(
-                f"• Generated on: {metadata.get('extraction_timestamp', 'Unknown')}",
-                normal_style,
-            )
-        )
-        content.append(
-            Paragraph(
-                f"• Data completeness: {metadata.get('overall_completeness', 0.0):.1%}",
-                normal_style,
-            )
-        )
-        content.append(Paragraph(f"• API version: {metadata.get('api_version', 'Unknown')}", normal_style))
-        content.append(
-            Paragraph(
-                f"• Cluster version: {metadata.get('cluster_version', 'Unknown')}",
-                normal_style,
-            )
-        )
-        content.append(Spacer(1, 12))
+        lines = [
+            "<b>Report Generation Information:</b>",
+            f"• Generated on: {metadata.get('extraction_timestamp', 'Unknown')}",
+            f"• Data completeness: {metadata.get('overall_completeness', 0.0):.1%}",
+            f"• API version: {metadata.get('api_version', 'Unknown')}",
+            f"• Cluster version: {metadata.get('cluster_version', 'Unknown')}",
+        ]
+        content.extend((Paragraph("<br/>".join(lines), normal_style), Spacer(1, 12)))
 
         # Physical layout information
         hardware = data.get("hardware_inventory", {})
         physical_layout = hardware.get("physical_layout")
         if physical_layout:
-            content.append(Paragraph("<b>Physical Rack Layout:</b>", normal_style))
             stats = physical_layout.get("statistics", {})
-            content.append(
-                Paragraph(
-                    f"• Occupied positions: {stats.get('occupied_positions', 0)}",
-                    normal_style,
-                )
-            )
-            content.append(
-                Paragraph(
-                    f"• Position range: U{stats.get('min_position', 0)} - U{stats.get('max_position', 0)}",
-                    normal_style,
-                )
-            )
-            content.append(Paragraph(f"• Total CNodes: {stats.get('total_cnodes', 0)}", normal_style))
-            content.append(Paragraph(f"• Total DNodes: {stats.get('total_dnodes', 0)}", normal_style))
+            lines = [
+                "<b>Physical Rack Layout:</b>",
+                f"• Occupied positions: {stats.get('occupied_positions', 0)}",
+                f"• Position range: U{stats.get('min_position', 0)} - U{stats.get('max_position', 0)}",
+                f"• Total CNodes: {stats.get('total_cnodes', 0)}",
+                f"• Total DNodes: {stats.get('total_dnodes', 0)}",
+            ]
+            content.append(Paragraph("<br/>".join(lines), normal_style))
 
         return content
 
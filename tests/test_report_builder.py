@@ -51,6 +51,12 @@ class TestReportConfig(unittest.TestCase):
         self.assertEqual(config.font_size, 12)
         self.assertFalse(config.include_toc)
 
+    def test_report_config_inventory_rows_per_page_from_yaml(self):
+        """inventory_rows_per_page is read from report.pdf and defaults to 25."""
+        self.assertEqual(ReportConfig().inventory_rows_per_page, 25)
+        config = ReportConfig.from_yaml({"report": {"pdf": {"inventory_rows_per_page": "40"}}})
+        self.assertEqual(config.inventory_rows_per_page, 40)
+
 
 class TestVastReportBuilder(unittest.TestCase):
     """Test cases for VastReportBuilder class."""
@@ -212,6 +218,29 @@ class TestVastReportBuilder(unittest.TestCase):
 
         self.assertFalse(result)
 
+    def test_failed_build_keeps_existing_report(self):
+        """A build that fails in the final pass leaves an existing PDF untouched."""
+        from report_builder import BaseDocTemplate
+
+        builder = VastReportBuilder()
+        output_path = Path(self.temp_dir) / "test_report.pdf"
+        output_path.write_bytes(b"%PDF-old")
+        real_build = BaseDocTemplate.build
+        calls = []
+
+        def build(doc, *args, **kwargs):
+            calls.append(doc)
+            if len(calls) > 1:
+                raise RuntimeError("layout failed")
+            return real_build(doc, *args, **kwargs)
+
+        with patch.object(BaseDocTemplate, "build", build):
+            result = builder.generate_pdf_report(self.sample_data, str(output_path))
+
+        self.assertFalse(result)
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(output_path.read_bytes(), b"%PDF-old")
+
     def test_create_title_page(self):
         """Test title page creation."""
         builder = VastReportBuilder()
@@ -248,6 +277,28 @@ class TestVastReportBuilder(unittest.TestCase):
         self.assertIsInstance(content, list)
         self.assertGreater(len(content), 0)
 
+    def test_cluster_information_status_rows(self):
+        """Flag rows render Yes/No/Unknown while other rows show the raw value."""
+        builder = VastReportBuilder()
+        data = {
+            "cluster_summary": {
+                "name": "c1",
+                "state": "ONLINE",
+                "enabled": True,
+                "enable_similarity": False,
+                "capacity_base_10": True,
+            }
+        }
+
+        text = _flowable_text(builder._create_cluster_information(data))
+
+        self.assertIn("State\nONLINE", text)
+        self.assertIn("Enabled\nYes", text)
+        self.assertIn("Similarity Enabled\nNo", text)
+        self.assertIn("Metrics Disabled\nUnknown", text)
+        self.assertIn("Leader CNode\nUnknown", text)
+        self.assertIn("Capacity-Base 10\nTrue", text)
+
     def test_create_hardware_inventory(self):
         """Test hardware inventory section creation."""
         builder = VastReportBuilder()
@@ -257,6 +308,25 @@ class TestVastReportBuilder(unittest.TestCase):
         self.assertIsInstance(content, list)
         self.assertGreater(len(content), 0)
 
+    def test_hardware_inventory_storage_capacity_rows(self):
+        """Storage Capacity rows are rounded, unit-suffixed and skip missing values."""
+        builder = VastReportBuilder()
+        data = dict(self.sample_data)
+        data["cluster_summary"] = {
+            **self.sample_data["cluster_summary"],
+            "capacity_base_10": False,
+            "usable_capacity_tb": 101.6,
+            "drr_text": "Unknown",
+            "physical_space_in_use_percent": 42.4,
+        }
+
+        text = _flowable_text(builder._create_hardware_inventory(data))
+
+        self.assertIn("Usable Capacity\n102 TiB", text)
+        self.assertIn("Physical Space In Use %\n42%", text)
+        self.assertNotIn("Data Reduction Ratio", text)
+        self.assertNotIn("Free Usable Capacity", text)
+
     def test_create_network_configuration(self):
         """Test network configuration section creation."""
         builder = VastReportBuilder()
@@ -266,6 +336,285 @@ class TestVastReportBuilder(unittest.TestCase):
         self.assertIsInstance(content, list)
         self.assertGreater(len(content), 0)
 
+    def test_cluster_network_configuration_placeholders(self):
+        """Unset cluster network fields render as "Not Configured" in one paragraph."""
+        builder = VastReportBuilder()
+        data = {
+            "sections": {
+                "cluster_network_configuration": {
+                    "data": {"mgmt_vip": "10.0.0.5", "eth_mtu": 9000, "ib_mtu": "Unknown"}
+                }
+            }
+        }
+
+        content = builder._create_cluster_network_configuration(data)
+        text = _flowable_text(content)
+
+        self.assertEqual(len(content), 3)
+        self.assertIn("• Management VIP: 10.0.0.5", text)
+        self.assertIn("• Ethernet MTU: 9000", text)
+        self.assertIn("• InfiniBand MTU: Not Configured", text)
+        self.assertIn("• B2B IPMI: False", text)
+        self.assertNotIn("Management Inner VIP", text)
+
+    def test_section_data_tolerates_missing_levels(self):
+        """_section_data returns {} for missing or None sections and section data."""
+        from report_builder import _section_data
+
+        self.assertEqual(_section_data({}, "port_mapping"), {})
+        self.assertEqual(_section_data({"sections": None}, "port_mapping"), {})
+        self.assertEqual(_section_data({"sections": {"port_mapping": {"data": None}}}, "port_mapping"), {})
+        self.assertEqual(_section_data({"sections": {"x": {"data": {"a": 1}}}}, "x"), {"a": 1})
+
+    def test_yes_no_unknown_flags(self):
+        """Cluster flags render Yes/No, with None reported as Unknown."""
+        from report_builder import _yes_no_unknown
+
+        self.assertEqual([_yes_no_unknown(v) for v in (True, 1, False, 0, None)], ["Yes", "Yes", "No", "No", "Unknown"])
+
+    def test_comprehensive_network_configuration_without_data(self):
+        """With no network sections or nodes the section ends with a single notice."""
+        builder = VastReportBuilder()
+
+        content = builder._create_comprehensive_network_configuration({"sections": {}})
+
+        self.assertTrue(_flowable_text(content[-1:]).startswith("No network configuration data available"))
+
+    def test_node_network_summary_table_sorted_with_last_column(self):
+        """Node rows are Mgmt-IP sorted and end with the caller's node-specific cell."""
+        builder = VastReportBuilder()
+        nodes = [
+            {"id": 2, "name": "dn-2", "mgmt_ip": "10.0.0.10"},
+            {"id": 1, "mgmt_ip": "10.0.0.9", "position": "virtual"},
+        ]
+
+        with patch.object(
+            builder.brand_compliance, "create_vast_hardware_table_with_pagination", return_value=[]
+        ) as create:
+            content = builder._node_network_summary_table(nodes, "DNodes", "Position", lambda n: n.get("position", "-"))
+
+        rows, title, headers = create.call_args.args
+        self.assertEqual([row[0] for row in rows], [1, 2])
+        self.assertEqual(rows[0][1:], ["Unknown", "10.0.0.9", "Unknown", "Unknown", "virtual"])
+        self.assertEqual(headers[-1], "Position")
+        self.assertEqual(len(content), 1)
+        self.assertEqual(builder._node_network_summary_table([], "DNodes", "Position", str), [])
+
+    def test_consolidated_inventory_orders_boxes_by_numeric_id(self):
+        """CNode rows are grouped per CBox and boxes sort by numeric, not string, id."""
+        builder = VastReportBuilder()
+        cboxes = {
+            "a": {"id": "10", "name": "cbox-1", "rack_name": "R1", "rack_unit": "U5"},
+            "b": {"id": "9", "name": "cbox-1", "rack_name": "R1", "rack_unit": "U5"},
+        }
+        cnodes = [
+            {"cbox_id": "10", "name": "cnode-a", "box_vendor": "Model X, 2x NIC", "status": "ACTIVE"},
+            {"cbox_id": "9", "name": "cnode-b", "box_vendor": "Model Y", "status": "ACTIVE"},
+            {"cbox_id": "9", "name": "cnode-c", "box_vendor": "Model Y", "status": "ACTIVE"},
+        ]
+
+        with patch.object(
+            builder.brand_compliance, "create_vast_hardware_table_with_pagination", return_value=[]
+        ) as create:
+            builder._create_consolidated_inventory_table(cboxes, cnodes, {}, [], [])
+
+        rows = create.call_args.args[0]
+        self.assertEqual([row[1] for row in rows], ["cnode-b", "cnode-c", "cnode-a"])
+        self.assertEqual(rows[-1][2], "Model X")
+
+    def test_toc_entry_styles_shared_per_combination(self):
+        """Dynamic TOC rows with the same weight and spacing share one style pair."""
+        builder = VastReportBuilder()
+
+        text_style, page_style = builder._toc_entry_styles(True, 12, 0.5)
+
+        self.assertIs(builder._toc_entry_styles(True, 12, 0.5)[0], text_style)
+        self.assertEqual(page_style.alignment, 2)
+        self.assertEqual(builder._toc_entry_styles(False, 0, 0.5)[0].fontSize, builder.config.font_size - 2)
+
+    def test_security_configuration_without_data(self):
+        """With no authentication services or cluster summary no table is built."""
+        builder = VastReportBuilder()
+
+        with patch.object(builder.brand_compliance, "create_vast_table") as create:
+            content = builder._create_security_configuration({"sections": {}})
+
+        create.assert_not_called()
+        self.assertTrue(_flowable_text(content[-1:]).startswith("No security configuration data available"))
+
+    def test_toc_style_keyed_by_cell_attributes(self):
+        """Excel TOC cells with equal font, size, color, alignment and spacing share a style."""
+        from reportlab.lib import colors
+
+        builder = VastReportBuilder()
+        style = builder._toc_style("Helvetica", 9, colors.HexColor("#FF0000"), 1, 3, 0.5)
+
+        self.assertIs(builder._toc_style("Helvetica", 9, colors.HexColor("#ff0000"), 1, 3, 0.5), style)
+        self.assertIsNot(builder._toc_style("Helvetica", 9, colors.HexColor("#000000"), 1, 3, 0.5), style)
+
+    def test_page_template_measures_watermark_once(self):
+        """The watermark image is opened when the template is built, not on every page."""
+        from PIL import Image as PILImage
+
+        brand = VastReportBuilder().brand_compliance
+        with patch("PIL.Image.open", wraps=PILImage.open) as pil_open:
+            template = brand.create_vast_page_template({"timestamp": "t", "mgmt_vip": "v"})
+            canvas = MagicMock()
+            for page in (1, 2, 3):
+                canvas.getPageNumber.return_value = page
+                template.onPageEnd(canvas, None)
+
+        self.assertEqual(pil_open.call_count, 1)
+        self.assertEqual(canvas.drawImage.call_count, 2)
+
+    def test_title_page_hardware_summary(self):
+        """CBox models fall back to CBox data; DBox/switch models are deduplicated and sorted."""
+        builder = VastReportBuilder()
+        data = {
+            "hardware_inventory": {
+                "cnodes": [{"id": 1, "box_vendor": "Unknown"}],
+                "cboxes": {"cb1": {"model": "Broadwell"}, "cb2": {"model": "Broadwell"}},
+                "dboxes": {"db1": {"id": 7, "hardware_type": "ceres"}, "db2": {"id": 8, "hardware_type": "ceres"}},
+                "switches": [{"model": "SN4600"}, {"model": "Unknown"}, {"model": "MSN2700"}],
+            }
+        }
+
+        text = _flowable_text(builder._create_title_page(data))
+
+        self.assertIn("CBox Hardware: Broadwell", text)
+        self.assertIn("CBox Quantity: 2", text)
+        self.assertIn("DBox Hardware: ceres", text)
+        self.assertIn("DBox Quantity: 2", text)
+        self.assertIn("Switch Hardware: MSN2700, SN4600", text)
+        self.assertIn("Switch Quantity: 3", text)
+
+    def test_vast_table_style_shared_per_density(self):
+        """create_vast_table reuses one TableStyle per compact setting."""
+        brand = VastReportBuilder().brand_compliance
+
+        brand.create_vast_table([["a", "b"]], "T1", ["Description", "Value"])
+        brand.create_vast_table([["c", "d"]], "T2", ["Description", "Value"])
+
+        self.assertEqual(list(brand._table_styles), [False])
+        self.assertIsNot(brand._vast_table_style(True), brand._vast_table_style(False))
+
+    def test_security_display_placeholders(self):
+        """Encryption/EKM values fall back to "Not Configured" per field rules."""
+        display = VastReportBuilder._security_display
+
+        self.assertEqual(display(False, None), "False")
+        self.assertEqual(display(None, None), "Not Configured")
+        self.assertEqual(display(["a", "b"], ("Unknown", "")), "a, b")
+        self.assertEqual(display([], ("Unknown", "")), "Not Configured")
+        self.assertEqual(display("Unknown", ("Unknown", "")), "Not Configured")
+        self.assertEqual(display("null", ("null",)), "Not Configured")
+        self.assertEqual(display("kms.example", ("null",)), "kms.example")
+
+    def test_security_authentication_rows(self):
+        """Active Directory, LDAP and NIS settings become Authentication rows in order."""
+        builder = VastReportBuilder()
+
+        with patch.object(builder.brand_compliance, "create_vast_table", return_value=[]) as create:
+            builder._create_security_configuration(self.sample_data)
+
+        rows = create.call_args.args[0]
+        self.assertEqual(
+            [row[1:] for row in rows if row[0] == "Authentication"],
+            [
+                ["Active Directory", "Enabled", "True"],
+                ["Active Directory", "Domain", "example.com"],
+                ["Active Directory", "Servers", "dc1.example.com"],
+                ["LDAP", "Enabled", "False"],
+                ["NIS", "Enabled", "False"],
+            ],
+        )
+
+    def test_normalize_list_shapes(self):
+        """Wrapped and bare lists yield their items; other shapes count as empty."""
+        from report_builder import _normalize_list
+
+        self.assertEqual(_normalize_list({"policies": [1, 2]}, "policies"), [1, 2])
+        self.assertEqual(_normalize_list([3], "policies"), [3])
+        self.assertEqual(_normalize_list({"other": [1]}, "policies"), [])
+        self.assertEqual(_normalize_list({"policies": "x"}, "policies"), [])
+        self.assertEqual(_normalize_list(5, "policies"), [])
+
+    def test_dot_leader_reused_per_length(self):
+        """Leaders of the same length are built once and wrapped in gray font markup."""
+        from report_builder import _dot_leader
+
+        leader = _dot_leader(7)
+
+        self.assertEqual(leader, '<font color="#CCCCCC">.......</font>')
+        self.assertIs(_dot_leader(7), leader)
+        self.assertEqual(_dot_leader(0), '<font color="#CCCCCC"></font>')
+
+    def test_cbox_rack_unit_and_model_fall_back_to_cnodes(self):
+        """A CBox without rack unit/model takes them from its CNodes."""
+        from report_builder import _cbox_rack_unit_and_model, _cnodes_by_cbox
+
+        by_cbox = _cnodes_by_cbox(
+            [
+                {"cbox_id": 1, "model": "cb-a", "rack_position": None},
+                {"cbox_id": 1, "model": "cb-b", "rack_position": 12},
+                {"cbox_id": 2, "model": "other", "rack_position": 30},
+            ]
+        )
+
+        self.assertEqual(_cbox_rack_unit_and_model({"id": 1}, by_cbox), ("U12", "cb-a"))
+        self.assertEqual(_cbox_rack_unit_and_model({"id": 3}, by_cbox), ("", "Unknown"))
+        self.assertEqual(
+            _cbox_rack_unit_and_model({"id": 2, "rack_unit": "U5", "model": "x"}, by_cbox),
+            ("U5", "x"),
+        )
+
+    def test_logical_configuration_rows(self):
+        """Logical, network service and data protection counts are listed in section order."""
+        builder = VastReportBuilder()
+        self.sample_data["sections"]["network_configuration"]["data"]["ntp"] = {"ntp_servers": ["ntp1", "ntp2"]}
+
+        with patch.object(builder.brand_compliance, "create_vast_table", return_value=[]) as create:
+            builder._create_logical_configuration(self.sample_data)
+
+        self.assertEqual(
+            create.call_args.args[0],
+            [
+                ["Tenants", "1 tenants configured"],
+                ["Views", "1 views configured"],
+                ["View Policies", "1 policies configured"],
+                ["VIP Pools", "1 pools configured"],
+                ["NTP Servers", "ntp1, ntp2"],
+                ["Snapshot Programs", "1 programs configured"],
+                ["Data Protection Policies", "1 policies configured"],
+            ],
+        )
+
+    def test_security_rows_skip_unreported_fields(self):
+        """Encryption/EKM fields missing from the cluster summary get no row."""
+        builder = VastReportBuilder()
+        data = {"cluster_summary": {"enable_encryption": True, "ekm_servers": "Unknown"}}
+
+        with patch.object(builder.brand_compliance, "create_vast_table", return_value=[]) as create:
+            builder._create_security_configuration(data)
+
+        self.assertEqual(
+            create.call_args.args[0],
+            [
+                ["Security", "Encryption", "Enabled", "True"],
+                ["Security", "EKM", "Servers", "Not Configured"],
+            ],
+        )
+
+    def test_hw_dnode_network_entry_position(self):
+        """Hardware DNodes map os_version to vast_os and blank positions to primary."""
+        from report_builder import _hw_dnode_network_entry
+
+        entry = _hw_dnode_network_entry({"id": 4, "name": "dn-4", "os_version": "5.2", "position": None})
+        self.assertEqual(entry["vast_os"], "5.2")
+        self.assertEqual(entry["position"], "primary")
+        self.assertEqual(entry["mgmt_ip"], "Unknown")
+        self.assertEqual(_hw_dnode_network_entry({"position": "virtual"})["position"], "virtual")
+
     def test_create_logical_configuration(self):
         """Test logical configuration section creation."""
         builder = VastReportBuilder()
@@ -700,6 +1049,124 @@ class TestSwitchConfigActivePortsMtu(unittest.TestCase):
         self.assertIn("38", text)
         self.assertIn("4096", text)
 
+    def test_port_number_key_sorts_naturally(self):
+        """Port names sort by their embedded number, names without digits first."""
+        from report_builder import _port_number_key
+
+        self.assertEqual(
+            sorted(["swp10", "swp2", "mgmt", "swp1"], key=_port_number_key), ["mgmt", "swp1", "swp2", "swp10"]
+        )
+
+
+class TestNetworkDiagramCache(unittest.TestCase):
+    """Rendered network diagrams are reused between the two story passes."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.temp_dir)
+
+    def test_second_pass_reuses_rendered_diagram(self):
+        """The second story pass reuses the diagram rendered by the first."""
+        from PIL import Image as PILImage
+
+        png = Path(self.temp_dir) / "network_topology_page1.png"
+        PILImage.new("RGB", (40, 20), "white").save(png)
+        gen = MagicMock()
+        gen.generate.return_value = [str(png)]
+
+        builder = VastReportBuilder()
+        data = {"hardware_inventory": {"switches": [{"name": "sw1"}]}, "sections": {}}
+        with (
+            patch.object(builder, "_resolve_diagrams_dir", return_value=Path(self.temp_dir)),
+            patch("network_diagram_v2.create_rack_centric_diagram_generator", return_value=gen),
+        ):
+            builder._create_logical_network_diagram(data)
+            builder._create_logical_network_diagram(data)
+
+        self.assertEqual(gen.generate.call_count, 1)
+
+    def test_load_image_reads_size_once_per_file_version(self):
+        """Diagram pixel sizes are cached; missing files return None."""
+        from PIL import Image as PILImage
+
+        png = Path(self.temp_dir) / "diagram.png"
+        PILImage.new("RGB", (40, 20), "white").save(png)
+        builder = VastReportBuilder()
+
+        with patch("PIL.Image.open", wraps=PILImage.open) as pil_open:
+            self.assertEqual(builder._load_image(png)[1], (40, 20))
+            self.assertEqual(builder._load_image(png)[1], (40, 20))
+        self.assertEqual(pil_open.call_count, 1)
+        self.assertIsNone(builder._load_image(Path(self.temp_dir) / "missing.png"))
+
+    def test_load_image_returns_cached_bytes(self):
+        """Diagram bytes are read from disk once and re-read after the file changes."""
+        from PIL import Image as PILImage
+
+        png = Path(self.temp_dir) / "diagram.png"
+        PILImage.new("RGB", (40, 20), "white").save(png)
+        builder = VastReportBuilder()
+
+        raw, size = builder._load_image(png)
+        self.assertEqual(raw, png.read_bytes())
+        self.assertEqual(size, (40, 20))
+        self.assertIs(builder._load_image(png)[0], raw)
+
+        PILImage.new("RGB", (80, 30), "white").save(png)
+        self.assertEqual(builder._load_image(png)[1], (80, 30))
+
+
+class TestLazyRackFlowable(unittest.TestCase):
+    """Rack diagrams are generated on first layout and memoized."""
+
+    def test_generates_on_first_wrap_only(self):
+        """The generator runs on the first wrap() only, which reports the drawing's size."""
+        from reportlab.graphics.shapes import Drawing
+        from report_builder import LazyRackFlowable
+
+        rack_gen = MagicMock()
+        rack_gen.generate_rack_diagram.return_value = (Drawing(200, 300), {})
+        flowable = LazyRackFlowable(rack_gen.generate_rack_diagram, list, ["cbox"], [], None, rack_name="Rack-1")
+
+        rack_gen.generate_rack_diagram.assert_not_called()
+        self.assertEqual(flowable.wrap(500, 700), (200, 300))
+        flowable.wrap(500, 700)
+        rack_gen.generate_rack_diagram.assert_called_once_with(["cbox"], [], None, rack_name="Rack-1")
+
+    def test_generation_error_draws_placeholder(self):
+        """A failing generator lays out and draws the rack layout placeholder."""
+        from reportlab.platypus import Flowable
+        from report_builder import LazyRackFlowable
+
+        builder = VastReportBuilder()
+        rack_gen = MagicMock()
+        rack_gen.generate_rack_diagram.side_effect = ValueError("bad rack")
+        flowable = LazyRackFlowable(rack_gen.generate_rack_diagram, builder._rack_diagram_placeholder)
+
+        width, height = flowable.wrap(500, 700)
+        self.assertEqual(width, 500)
+        self.assertGreater(height, 0)
+        placeholder = [f for f, _ in flowable._fallback]
+        self.assertIn("Physical Rack Layout", _flowable_text(placeholder))
+
+        flowable.canv = MagicMock()
+        with patch.object(Flowable, "drawOn") as draw_on:
+            flowable.draw()
+        self.assertEqual(draw_on.call_count, len(placeholder))
+
+    def test_builder_memoizes_identical_rack_inputs(self):
+        """Identical rack inputs reuse the cached diagram."""
+        rack_gen = MagicMock(page_width=500, page_height=600, rack_height_u=42)
+        rack_gen.generate_rack_diagram.return_value = ("drawing", {})
+        builder = VastReportBuilder()
+
+        first = builder._cached_rack_diagram(rack_gen, [{"id": 1}], [], None, rack_name="R1")
+        second = builder._cached_rack_diagram(rack_gen, [{"id": 1}], [], None, rack_name="R1")
+        builder._cached_rack_diagram(rack_gen, [{"id": 2}], [], None, rack_name="R1")
+
+        self.assertIs(first, second)
+        self.assertEqual(rack_gen.generate_rack_diagram.call_count, 2)
+
 
 if __name__ == "__main__":
     unittest.main()